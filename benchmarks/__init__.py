@@ -0,0 +1 @@
+"""me_toolbox benchmarks (run from the repository root with: python -m benchmarks)"""
@@ -0,0 +1,87 @@
+"""Benchmarks command line
+
+usage:
+    python -m benchmarks list
+    python -m benchmarks run [-k PATTERN ...] [--output results.json]
+    python -m benchmarks compare baseline.json [current.json] [--threshold 0.2]
+    python -m benchmarks import-time [--repeat N]
+
+compare times the workloads now unless a current results file is given, it exits with
+status 1 if any workload regressed by more than the threshold.
+"""
+import argparse
+import sys
+
+from benchmarks import import_time, runner
+from benchmarks.workloads import WORKLOADS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description=__doc__.splitlines()[0],
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog='\n'.join(__doc__.splitlines()[1:]))
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="list the workloads")
+
+    timing = argparse.ArgumentParser(add_help=False)
+    timing.add_argument('-k', dest='patterns', action='append',
+                        help="run only the workloads matching the pattern (e.g. 'gears.*')")
+    timing.add_argument('--repeat', type=int, default=5, help="repeats of each workload")
+    timing.add_argument('--min-time', type=float, default=0.1,
+                        help="minimal duration of a repeat [s]")
+
+    run_parser = commands.add_parser('run', parents=[timing], help="time the workloads")
+    run_parser.add_argument('--output', '-o', help="write the results to a JSON file")
+
+    compare_parser = commands.add_parser('compare', parents=[timing],
+                                         help="compare with a baseline results file")
+    compare_parser.add_argument('baseline', help="baseline JSON results file")
+    compare_parser.add_argument('current', nargs='?',
+                                help="current JSON results file (default: time the workloads)")
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help="allowed relative slowdown (default: 0.2 - 20%%)")
+    compare_parser.add_argument('--output', '-o', help="write the current results to a file")
+
+    import_parser = commands.add_parser('import-time', help="cold start import time")
+    import_parser.add_argument('--repeat', type=int, default=7, help="processes per measurement")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for name in WORKLOADS:
+            print(name)
+        return 0
+
+    if args.command == 'import-time':
+        import_time.main(['--repeat', str(args.repeat)])
+        return 0
+
+    if args.command == 'run':
+        results = runner.run(runner.select(args.patterns), args.repeat, args.min_time)
+        if args.output:
+            runner.save(results, args.output)
+        return 0
+
+    baseline = runner.load(args.baseline)
+    if args.current:
+        current = runner.load(args.current)
+    else:
+        names = [name for name in runner.select(args.patterns) if name in baseline['results']]
+        current = runner.run(names, args.repeat, args.min_time)
+        if args.output:
+            runner.save(current, args.output)
+
+    rows, regressed = runner.compare(baseline, current, args.threshold)
+    print(f"\n{'workload':<45}{'baseline':>12}{'current':>12}{'ratio':>8}  status")
+    for name, before, after, ratio, status in rows:
+        print(f"{name:<45}{runner.format_time(before):>12}{runner.format_time(after):>12}"
+              f"{ratio:>8.2f}  {status}")
+    if regressed:
+        print(f"\nregressions beyond {args.threshold:.0%} were found")
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Cold start import time benchmark
+
+Every measurement runs the import statement in a fresh python process and compares
+the lazy imports (default) with importing everything up front (ME_TOOLBOX_EAGER_IMPORT),
+it also reports which heavy third party packages were loaded by the import.
+
+usage: python benchmarks/import_time.py [--repeat N] (or: python -m benchmarks import-time)
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = ['import me_toolbox',
+              'from me_toolbox.fatigue import FailureCriteria',
+              'from me_toolbox.fatigue import FatigueAnalysis',
+              'from me_toolbox.gears import SpurGear, Transmission',
+              'from me_toolbox.fasteners import Bolt',
+              'from me_toolbox.springs import HelicalCompressionSpring']
+
+HEAVY_PACKAGES = ('numpy', 'sympy', 'mpmath', 'icecream')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+
+def measure(statement, eager, repeat):
+    """Returns the median import time in [ms] and the heavy packages that were loaded
+
+    :param str statement: import statement
+    :param bool eager: import all the package's modules up front
+    :param int repeat: number of fresh processes to run
+
+    :rtype: tuple[float, str]
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT,
+                                                                    os.environ.get('PYTHONPATH')])))
+    env.pop('ME_TOOLBOX_EAGER_IMPORT', None)
+    if eager:
+        env['ME_TOOLBOX_EAGER_IMPORT'] = '1'
+
+    times, heavy = [], ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement,
+                                                                    heavy=HEAVY_PACKAGES)],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        elapsed, heavy = output.split()[0], ''.join(output.split()[1:])
+        times.append(float(elapsed) * 1e3)
+    return statistics.median(times), heavy or '-'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7, help="processes per measurement")
+    args = parser.parse_args(argv)
+
+    print(f"{'statement':<58}{'lazy [ms]':>10}{'eager [ms]':>11}{'gain':>7}  loaded (lazy)")
+    for statement in STATEMENTS:
+        lazy_time, lazy_heavy = measure(statement, eager=False, repeat=args.repeat)
+        eager_time, _ = measure(statement, eager=True, repeat=args.repeat)
+        print(f"{statement:<58}{lazy_time:>10.1f}{eager_time:>11.1f}"
+              f"{eager_time / lazy_time:>6.1f}x  {lazy_heavy}")
+
+
+if __name__ == '__main__':
+    main()
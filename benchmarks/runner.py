@@ -0,0 +1,156 @@
+"""Timing of the workloads, JSON results files and comparison against a baseline"""
+import datetime
+import fnmatch
+import json
+import platform
+import statistics
+import time
+
+import numpy as np
+
+from benchmarks.workloads import WORKLOADS
+
+
+def time_workload(func, repeat=5, min_time=0.1):
+    """Time a callable, the number of calls in each repeat is calibrated
+    so every repeat takes at least min_time seconds
+
+    :param callable func: The timed callable
+    :param int repeat: Number of repeats
+    :param float min_time: Minimal duration of a repeat [s]
+
+    :returns: best and median time of a single call [s] and the number of calls per repeat
+    :rtype: dict
+    """
+    number = 1
+    while True:
+        elapsed = _time_calls(func, number)
+        if elapsed >= min_time:
+            break
+        # aim a bit above min_time to avoid another calibration round
+        number = max(number * 2, int(1.2 * number * min_time / max(elapsed, 1e-9)))
+
+    times = [elapsed / number] + [_time_calls(func, number) / number for _ in range(repeat - 1)]
+    return {'best': min(times), 'median': statistics.median(times), 'number': number,
+            'repeat': repeat}
+
+
+def _time_calls(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def select(patterns=None):
+    """Returns the names of the workloads matching any of the patterns (fnmatch style,
+    e.g. 'gears.*'), all the workloads if no patterns are given
+
+    :param list[str] patterns: workload name patterns
+
+    :rtype: list[str]
+    """
+    if not patterns:
+        return list(WORKLOADS)
+    names = [name for name in WORKLOADS
+             if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+    if not names:
+        raise KeyError(f"No workload matches {patterns}, the workloads are: {list(WORKLOADS)}")
+    return names
+
+
+def run(names=None, repeat=5, min_time=0.1, verbose=True):
+    """Time the workloads
+
+    :param list[str] names: workload names (default: all the workloads)
+    :param int repeat: Number of repeats of each workload
+    :param float min_time: Minimal duration of a repeat [s]
+    :param bool verbose: print the result of each workload when it's done
+
+    :returns: the results file content (environment metadata and the timing of each workload)
+    :rtype: dict
+    """
+    results = {}
+    for name in names or WORKLOADS:
+        func = WORKLOADS[name]()
+        results[name] = time_workload(func, repeat, min_time)
+        if verbose:
+            print(f"{name:<45}{format_time(results[name]['best']):>12}"
+                  f"  ({results[name]['number']} calls x {repeat})")
+    return {'metadata': metadata(), 'results': results}
+
+
+def metadata():
+    """Returns the environment the benchmarks ran in
+
+    :rtype: dict
+    """
+    return {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine()}
+
+
+def save(results, path):
+    """Write results to a JSON file
+
+    :param dict results: the results of run
+    :param str path: file path
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+        file.write('\n')
+
+
+def load(path):
+    """Read results from a JSON file
+
+    :param str path: file path
+
+    :rtype: dict
+    """
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compare(baseline, current, threshold=0.2, key='best'):
+    """Compare the results with a baseline, a workload regressed if its time grew by more
+    than the threshold (relative), workloads missing in one of the results are skipped
+
+    :param dict baseline: baseline results (see run)
+    :param dict current: current results (see run)
+    :param float threshold: allowed relative slowdown (0.2 - 20% slower)
+    :param str key: the compared time ('best' / 'median')
+
+    :returns: rows of [name, baseline time, current time, ratio, status]
+        (status is 'regression', 'improvement' or 'ok') and whether anything regressed
+    :rtype: tuple[list, bool]
+    """
+    rows, regressed = [], False
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        before, after = baseline['results'][name][key], result[key]
+        ratio = after / before
+        if ratio > 1 + threshold:
+            status, regressed = 'regression', True
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append([name, before, after, ratio, status])
+    return rows, regressed
+
+
+def format_time(seconds):
+    """Format a duration with a readable unit
+
+    :param float seconds: duration [s]
+
+    :rtype: str
+    """
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
@@ -0,0 +1,265 @@
+"""Representative workloads of every subsystem
+
+Every workload is a setup function registered with the workload decorator, the setup
+builds the inputs and returns the callable that is timed (so building the objects and
+loading the tables isn't part of the measurement, unless the workload says otherwise).
+"""
+import numpy as np
+
+WORKLOADS = {}
+
+
+def workload(name):
+    """Register a workload setup function under a dotted name (subsystem.workload)
+
+    :param str name: The workload name
+    """
+    def decorator(setup):
+        WORKLOADS[name] = setup
+        return setup
+    return decorator
+
+
+# ------------------------------------------------------------------------------------------
+# gears
+# ------------------------------------------------------------------------------------------
+def _spur_gearbox():
+    """The spur gear example (examples/gears_examples)"""
+    from me_toolbox.gears import SpurGear, Transmission
+    pinion = SpurGear(modulus=4, pressure_angle=25, teeth_num=25, rpm=1500, grade=2,
+                      Qv=11, crowned=False, adjusted=True, width=25, bearing_span=10,
+                      pinion_offset=2, enclosure='extra precision enclosed', hardness=400,
+                      number_of_cycles=1e8, material='steel', sensitive_use=True)
+    gearbox = Transmission(gear1=pinion, oil_temp=65, reliability=0.999, power=50e3,
+                           gear_ratio=3.1, driving_machine='light shock',
+                           driven_machine='moderate shock', SF=1.1, SH=1)
+    return pinion, gearbox
+
+
+def _helical_gearbox():
+    """The helical gear example (examples/gears_examples)"""
+    from me_toolbox.gears import HelicalGear, Transmission
+    helical = HelicalGear(modulus=2, pressure_angle=20, teeth_num=37, rpm=2500, grade=1,
+                          Qv=12, crowned=False, adjusted=False, width=50, bearing_span=100,
+                          pinion_offset=22.4, enclosure='precision enclosed', hardness=160,
+                          number_of_cycles=1e6, material='steel', helix_angle=20,
+                          sensitive_use=True)
+    gearbox = Transmission(gear1=helical, oil_temp=100, reliability=0.999, power=50e3,
+                           gear_ratio=2.5, driving_machine='uniform', driven_machine='uniform',
+                           SF=1, SH=1)
+    return helical, gearbox
+
+
+@workload('gears.spur_optimization')
+def spur_optimization():
+    # the optimization modifies the gears, so a new gearbox is built for every call
+    def run():
+        pinion, gearbox = _spur_gearbox()
+        return gearbox.optimize(pinion, 'all')
+    return run
+
+
+@workload('gears.helical_optimization')
+def helical_optimization():
+    def run():
+        helical, gearbox = _helical_gearbox()
+        return gearbox.optimize(helical, 'all')
+    return run
+
+
+@workload('gears.spur_Y_j')
+def spur_Y_j():
+    pinion, gearbox = _spur_gearbox()
+    return lambda: pinion.Y_j(gearbox.gear1, gearbox.gear2)
+
+
+@workload('gears.helical_Y_j')
+def helical_Y_j():
+    helical, gearbox = _helical_gearbox()
+    return lambda: helical.Y_j(gearbox.gear1, gearbox.gear2)
+
+
+@workload('gears.duty_cycle_10k')
+def duty_cycle():
+    _, gearbox = _spur_gearbox()
+    rng = np.random.default_rng(0)
+    power = rng.uniform(5e3, 50e3, 10_000)
+    rpm = rng.uniform(500, 1500, 10_000)
+    hours = rng.uniform(1, 10, 10_000)
+    return lambda: gearbox.duty_cycle(power, rpm, hours)
+
+
+# ------------------------------------------------------------------------------------------
+# tools
+# ------------------------------------------------------------------------------------------
+def _geometry_factors_table():
+    import os
+    from me_toolbox import gears
+    from me_toolbox.tools import table_registry
+    path = os.path.join(os.path.dirname(gears.__file__), 'tables',
+                        '20deg - spur gear geometry factors.csv')
+    return table_registry.get(path)
+
+
+@workload('tools.table_interpolation')
+def table_interpolation():
+    from me_toolbox.tools import table_interpolation as interpolate
+    data = _geometry_factors_table()
+    return lambda: interpolate(33.3, 47.5, data)
+
+
+@workload('tools.table_interpolator_10k')
+def table_interpolator_array():
+    from me_toolbox.tools import TableInterpolator
+    data = _geometry_factors_table()
+    interpolator = TableInterpolator(data)
+    rng = np.random.default_rng(0)
+    rows = rng.uniform(data[1, 0], data[-1, 0], 10_000)
+    cols = rng.uniform(data[0, 1], data[0, -1], 10_000)
+    return lambda: interpolator(rows, cols)
+
+
+# ------------------------------------------------------------------------------------------
+# fatigue
+# ------------------------------------------------------------------------------------------
+def _fatigue_analysis():
+    from me_toolbox.fatigue import FatigueAnalysis
+    return FatigueAnalysis(modified_endurance_limit=90, stress_type='bending', ductile=True,
+                           ultimate_tensile_strength=480, yield_strength=410, Kf_bending=1,
+                           alt_bending_stress=100, mean_bending_stress=50)
+
+
+@workload('fatigue.miner_rule')
+def miner_rule():
+    fatigue = _fatigue_analysis()
+    stress_groups = [[2, 150, -50], [3, 200, -50], [2, 350, -100], [1, 400, -300],
+                     [1, 200, -50]]
+    return lambda: fatigue.miner_rule(stress_groups, Sut=480, Se=90, Sy=410, z=-5.69)
+
+
+@workload('fatigue.cumulative_damage_100k')
+def cumulative_damage():
+    from me_toolbox.fatigue import FatigueAnalysis
+    rng = np.random.default_rng(0)
+    counts = rng.integers(1, 1000, 100_000)
+    alternating, mean = rng.uniform(50, 300, 100_000), rng.uniform(-100, 200, 100_000)
+    return lambda: FatigueAnalysis.calc_cumulative_damage(counts, alternating, mean, 480, 90,
+                                                          z=-5.69, alt_mean=True)
+
+
+@workload('fatigue.get_safety_factors')
+def get_safety_factors():
+    from me_toolbox.fatigue import FailureCriteria
+    return lambda: FailureCriteria.get_safety_factors(420, 520, 180, 120, 60, 'gerber')
+
+
+@workload('fatigue.get_safety_factors_100k')
+def get_safety_factors_array():
+    from me_toolbox.fatigue import FailureCriteria
+    rng = np.random.default_rng(0)
+    alternating, mean = rng.uniform(10, 200, 100_000), rng.uniform(-100, 300, 100_000)
+    return lambda: FailureCriteria.get_safety_factors(420, 520, 180, alternating, mean,
+                                                      'gerber')
+
+
+@workload('fatigue.num_of_cycles')
+def num_of_cycles():
+    from me_toolbox.fatigue import FatigueAnalysis
+    return lambda: FatigueAnalysis.calc_num_of_cycles(50, 150, 90, 480, 410, z=-3)
+
+
+# ------------------------------------------------------------------------------------------
+# fasteners
+# ------------------------------------------------------------------------------------------
+LAYERS = [[5, 207e3], [10, 207e3]]
+
+
+def _bolt_pattern():
+    """The BoltPattern example notebook (examples/fasteners_examples)"""
+    from me_toolbox.fasteners import Bolt, BoltPattern, ThreadedFastener
+    M10 = Bolt(10, 1.5, 33, 26, *Bolt.get_strength_prop(10, '9.8'), 207e3)
+    M5 = Bolt(5, 0.8, 23, 16, *Bolt.get_strength_prop(5, '9.8'), 207e3)
+    M10_fastener = ThreadedFastener(M10, LAYERS, nut=True, preload=32062.5)
+    M5_fastener = ThreadedFastener(M5, LAYERS, nut=True, preload=7850)
+    return BoltPattern([M10_fastener, M10_fastener, M5_fastener],
+                       [[20, 45, 0], [-20, 45, 0], [0, 15, 0]],
+                       [0, -8500, 0], [0, 0, 100], [[0, 0], [1, 0]], 'shank')
+
+
+@workload('fasteners.bolt_pattern_safety_factors')
+def bolt_pattern_safety_factors():
+    pattern = _bolt_pattern()
+
+    def run():
+        return (pattern.separation_safety_factor(), pattern.load_safety_factor(),
+                pattern.proof_safety_factor())
+    return run
+
+
+@workload('fasteners.bolt_pattern_solver_10k')
+def bolt_pattern_solver():
+    solver = _bolt_pattern().solver()
+    rng = np.random.default_rng(0)
+    forces = rng.normal(0, 5e3, (10_000, 3))
+    return lambda: solver.solve(forces, [0, 0, 100])
+
+
+@workload('fasteners.member_stiffness')
+def member_stiffness():
+    from me_toolbox.fasteners import ThreadedFastener
+    return lambda: ThreadedFastener.calc_member_stiffness(10, 15, 15, LAYERS, nut=True)
+
+
+# ------------------------------------------------------------------------------------------
+# springs
+# ------------------------------------------------------------------------------------------
+@workload('springs.compression_fatigue')
+def compression_fatigue():
+    from me_toolbox.springs import HelicalCompressionSpring, Spring
+    spring = HelicalCompressionSpring(
+        max_force=500, wire_diameter=6, spring_diameter=50,
+        ultimate_tensile_strength=Spring.material_prop('music wire', 6, metric=True,
+                                                       verbose=False),
+        shear_yield_percent=0.45, shear_modulus=75e3, elastic_modulus=205e3,
+        end_type='squared and ground', spring_rate=6, set_removed=False, shot_peened=True,
+        density=7800, zeta=0.25)
+    return lambda: spring.fatigue_analysis(500, 100, reliability=99.999)
+
+
+@workload('springs.extension_fatigue')
+def extension_fatigue():
+    from me_toolbox.springs import ExtensionSpring
+    # the extension spring example notebook
+    spring = ExtensionSpring(max_force=22.24, initial_tension=5.29, wire_diameter=0.88,
+                             spring_diameter=5.41, hook_r1=2.69, hook_r2=2.672,
+                             ultimate_tensile_strength=1823.3, body_shear_yield_percent=0.45,
+                             hook_normal_yield_percent=0.75, hook_shear_yield_percent=0.4,
+                             shear_modulus=80e3, elastic_modulus=197.9e3, spring_rate=3.13,
+                             shot_peened=False, density=7800)
+    return lambda: spring.fatigue_analysis(22.24, 6.67, reliability=50, criterion='gerber')
+
+
+@workload('springs.torsion_fatigue')
+def torsion_fatigue():
+    from me_toolbox.springs import HelicalTorsionSpring, Spring
+    # the torsion spring example notebook
+    d = 1.829
+    spring = HelicalTorsionSpring(
+        max_moment=851.27, wire_diameter=d, spring_diameter=15.081 - d, leg1=25.4, leg2=25.4,
+        ultimate_tensile_strength=Spring.material_prop('music wire', d, metric=True,
+                                                       verbose=False),
+        yield_percent=0.45 / 0.577, shear_modulus=81e3, elastic_modulus=196.5e3,
+        spring_rate=525.11, arbor_diameter=10.16, shot_peened=False, density=7800)
+    return lambda: spring.fatigue_analysis(564.896, 112.979, fatigue_percent=53,
+                                           reliability=50, criterion='gerber')
+
+
+@workload('springs.batch_fatigue_10k')
+def batch_fatigue():
+    from me_toolbox.springs import HelicalCompressionSpringBatch
+    d, D = np.meshgrid(np.linspace(1, 6, 100), np.linspace(20, 80, 100))
+    springs = HelicalCompressionSpringBatch.from_material(
+        'music wire', max_force=500, wire_diameter=d, spring_diameter=D,
+        shear_yield_percent=0.45, shear_modulus=75e3, elastic_modulus=205e3,
+        end_type='squared and ground', spring_rate=6, shot_peened=True)
+    return lambda: springs.fatigue_analysis(500, 100, reliability=99.999)
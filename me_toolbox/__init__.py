@@ -0,0 +1,10 @@
+import logging
+
+from me_toolbox._lazy import attach
+
+# the library's diagnostics are silent unless the application configures logging
+# (see me_toolbox.tools.diagnostics)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, submodules=['fasteners', 'fatigue', 'gears', 'springs', 'tools'])
@@ -0,0 +1,53 @@
+"""module containing the attach function used by the packages __init__ modules
+to import their modules lazily (PEP 562), a module is imported only when one of
+its attributes is first accessed
+
+Note: setting the ME_TOOLBOX_EAGER_IMPORT environment variable imports everything
+up front (useful for debugging import errors and for benchmarking)
+"""
+import importlib
+import os
+import sys
+
+
+def attach(package_name, submodules=(), submodule_attrs=None):
+    """Create the module level __getattr__, __dir__ and __all__ of a lazy package
+
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={'gear': ['Gear']})
+
+    :param str package_name: the package __name__
+    :param iterable submodules: subpackages/modules accessed as package attributes
+    :param dict submodule_attrs: module name and the attributes it exports
+
+    :returns: __getattr__, __dir__ and __all__ for the package
+    :rtype: tuple
+    """
+    submodules = set(submodules)
+    submodule_attrs = submodule_attrs or {}
+    attr_to_module = {attr: module for module, attrs in submodule_attrs.items()
+                      for attr in attrs}
+    __all__ = sorted(submodules | set(attr_to_module))
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(f"{package_name}.{name}")
+        if name in attr_to_module:
+            module = importlib.import_module(f"{package_name}.{attr_to_module[name]}")
+            value = getattr(module, name)
+            # bind the attribute to the package so __getattr__ is called only once
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+    def __dir__():
+        return list(__all__)
+
+    if os.environ.get('ME_TOOLBOX_EAGER_IMPORT'):
+        # the package's __getattr__ is needed by modules importing from the package
+        sys.modules[package_name].__getattr__ = __getattr__
+        for attr in __all__:
+            __getattr__(attr)
+
+    return __getattr__, __dir__, __all__
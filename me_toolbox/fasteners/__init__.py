@@ -1,3 +1,9 @@
-from me_toolbox.fasteners.bolt import Bolt
-from me_toolbox.fasteners.threaded_fastener import ThreadedFastener
-from me_toolbox.fasteners.bolt_pattern import BoltPattern
+from me_toolbox._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={
+    'bolt': ['Bolt'],
+    'threaded_fastener': ['ThreadedFastener'],
+    'bolt_pattern': ['BoltPattern'],
+    'bolt_pattern_solver': ['BoltPatternSolver'],
+    'bolt_fatigue': ['BoltPatternFatigue', 'bolt_pattern_damage'],
+})
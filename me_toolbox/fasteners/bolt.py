@@ -1,7 +1,6 @@
 """module containing the bolts base class Bolt"""
 from collections import namedtuple
-from math import sqrt, pi
-from mpmath import sec
+from math import sqrt, pi, cos
 
 from me_toolbox.tools import print_atributes
 from me_toolbox.fatigue import EnduranceLimit
@@ -111,10 +110,10 @@ class Bolt:
         Fi, d, dm = preload, self.diameter, self.mean_diameter
         length = self.pitch  # for single start
         tanG = length / (pi * dm)
-        alpha = self.angle
+        sec_alpha = 1 / cos(self.angle)
         return Fi * d * ((dm / (2 * d)) *
-                         ((tanG + thread_friction * sec(alpha)) /
-                          (1 - thread_friction * tanG * sec(alpha))) + 0.625*collar_friction)
+                         ((tanG + thread_friction * sec_alpha) /
+                          (1 - thread_friction * tanG * sec_alpha)) + 0.625*collar_friction)
 
     def torque2preload(self, torque):
         pass
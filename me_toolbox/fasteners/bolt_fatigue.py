@@ -0,0 +1,211 @@
+"""module containing the BoltPatternFatigue class for the fatigue life prediction
+of a bolt pattern under a (streamed) history of force vectors"""
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import RainflowCounter, MinerAccumulator, FatigueAnalysis
+
+
+class BoltPatternFatigue:
+    """Fatigue damage of each bolt of a pattern over a force history given in chunks
+
+    The normal and shear stresses of every bolt are calculated for a whole chunk at once,
+    the normal stress history of each bolt is rainflow counted with the shear stress as
+    a companion (the shear range and mean between the reversals of each cycle), the
+    alternating and mean stresses of every cycle are combined into equivalent stresses like
+    BoltPattern.variable_equivalent_stresses (FatigueAnalysis 'multiple' with the thread Kf,
+    see FatigueAnalysis.calc_thread_kf) and the damage is accumulated (Miner's rule)
+
+    .. code-block:: python
+
+        analysis = BoltPatternFatigue(pattern, endurance_limits, range_bin_width=1)
+        for chunk in iter_force_chunks(np.load('forces.npy', mmap_mode='r')):
+            analysis.feed(chunk)
+        results = analysis.finish()
+    """
+
+    def __repr__(self):
+        return f"BoltPatternFatigue(pattern={self.pattern}, " \
+               f"force_location={self.force_location}, Kf={self.Kf.tolist()}, " \
+               f"range_bin_width={self.range_bin_width})"
+
+    def __init__(self, pattern, endurance_limits, force_location=None, Kf=None, z=-3,
+                 range_bin_width=1, mean_bin_width=None):
+        """
+        :param BoltPattern pattern: the bolt pattern (it is not modified)
+        :param list[EnduranceLimit] endurance_limits: the EnduranceLimit object of each bolt
+        :param list force_location: The forces location (default: the pattern's force_location)
+        :param float or list[float] Kf: thread dynamic stress concentration factor
+            (default: the Kf of each bolt)
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param float or None range_bin_width: width of the rainflow range bins [MPa]
+            (None - no binning, only for short histories, see RainflowCounter)
+        :param float or None mean_bin_width: width of the rainflow mean bins [MPa]
+            (default: range_bin_width)
+        """
+        fasteners = pattern.fasteners
+        if len(endurance_limits) != len(fasteners):
+            raise ValueError(f"{len(endurance_limits)} endurance limits were given "
+                             f"for {len(fasteners)} fasteners")
+        if Kf is None:
+            Kf = [fastener.bolt.Kf for fastener in fasteners]
+            if None in Kf:
+                raise ValueError("A bolt has no Kf, set the bolt's Kf or pass Kf "
+                                 "(see FatigueAnalysis.calc_thread_kf)")
+
+        self.pattern = pattern
+        self.force_location = pattern.force_location if force_location is None \
+            else force_location
+        self.Kf = np.broadcast_to(np.asarray(Kf, dtype=float), (len(fasteners),))
+        self.endurance_limits = [endurance_limit.modified for endurance_limit in endurance_limits]
+        self.range_bin_width = range_bin_width
+        self.finished = False
+        self.groups = None
+
+        self._solver = pattern.solver()
+        self._counters = [RainflowCounter(range_bin_width, mean_bin_width, companion=True)
+                          for _ in fasteners]
+        self._accumulators = [MinerAccumulator(fastener.bolt.tensile_strength, Se, z=z)
+                              for fastener, Se in zip(fasteners, self.endurance_limits)]
+
+    def stresses(self, forces):
+        """Returns the normal and shear stresses of each bolt
+
+        :param np.ndarray forces: (n_steps, 3) forces
+
+        :returns: (n_steps, n_bolts) normal stresses and (n_steps, n_bolts) shear stresses
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        return (self._solver.normal_stress(forces, self.force_location),
+                self._solver.shear_stress(forces, self.force_location))
+
+    def equivalent_stresses(self, groups, bolt):
+        """Returns the alternating and mean equivalent stresses of rainflow groups
+        (see FatigueAnalysis.calc_alt_eq_stress and calc_mean_eq_stress)
+
+        :param np.ndarray groups: [count, normal range, normal mean, shear range, shear mean]
+            rows of the bolt
+        :param int bolt: the bolt's index
+
+        :returns: the alternating and the mean equivalent stresses of each group
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        fastener = self.pattern.fasteners[bolt]
+        analysis = FatigueAnalysis(modified_endurance_limit=self.endurance_limits[bolt],
+                                   stress_type='multiple', ductile=True,
+                                   ultimate_tensile_strength=fastener.bolt.tensile_strength,
+                                   yield_strength=fastener.bolt.yield_strength,
+                                   Kf_normal=self.Kf[bolt], Kf_torsion=self.Kf[bolt],
+                                   alt_normal_stress=0.5 * groups[:, 1],
+                                   mean_normal_stress=groups[:, 2],
+                                   alt_torsion_stress=0.5 * groups[:, 3],
+                                   mean_torsion_stress=groups[:, 4])
+        return analysis.alt_eq_stress, analysis.mean_eq_stress
+
+    def feed(self, forces):
+        """Count the cycles of the next chunk of the force history
+
+        :param np.ndarray forces: (n_steps, 3) next force vectors
+        """
+        if self.finished:
+            raise ValueError("at BoltPatternFatigue: feed was called after finish")
+        normal_stress, shear_stress = self.stresses(np.asarray(forces, dtype=float).reshape(-1, 3))
+        for counter, normal, shear in zip(self._counters, normal_stress.T, shear_stress.T):
+            counter.feed(normal, shear)
+
+    def finish(self, initial_damage=0):
+        """Count the residue of the history and accumulate the damage of each bolt
+
+        :param float or list[float] initial_damage: damage the bolts already have
+
+        :returns: rainflow groups ([count, normal range, normal mean, shear range, shear mean]
+            rows, before the Kf correction),
+            damage of one repetition of the history, life (repetitions of the history until
+            failure), remaining_life (repetitions of the history until failure including the
+            initial damage) and the number of cycles out of the HCF range of each bolt
+        :rtype: dict
+        """
+        if not self.finished:
+            self.groups = [counter.finish() for counter in self._counters]
+            for bolt, (accumulator, groups) in enumerate(zip(self._accumulators, self.groups)):
+                accumulator.add(groups[:, 0], *self.equivalent_stresses(groups, bolt))
+            self.finished = True
+
+        damage = np.array([accumulator.damage for accumulator in self._accumulators])
+        total_damage = np.asarray(initial_damage, dtype=float) + damage
+        with np.errstate(divide='ignore'):
+            life = np.where(damage > 0, 1 / damage, inf)
+            remaining_life = np.where(damage > 0, np.clip(1 - total_damage, 0, None) / damage,
+                                      np.where(total_damage < 1, inf, 0))
+        return {'groups': self.groups,
+                'damage': damage,
+                'life': life,
+                'remaining_life': remaining_life,
+                'out_of_range_cycles': np.array([accumulator.out_of_range_cycles
+                                                 for accumulator in self._accumulators])}
+
+
+def iter_force_chunks(history, chunk_size=2 ** 16):
+    """Iterate over a history of force vectors in (n, 3) chunks, the history can be an
+    (n_steps, 3) array (including a memory-mapped array) or any iterable of force vectors
+    or (n, 3) arrays
+
+    :param history: the force history
+    :param int chunk_size: maximum number of force vectors in a chunk
+
+    :returns: chunks generator
+    :rtype: Iterator[np.ndarray]
+    """
+    if isinstance(history, np.ndarray):
+        history = history.reshape(-1, 3)
+        for start in range(0, len(history), chunk_size):
+            yield np.asarray(history[start:start + chunk_size], dtype=float)
+        return
+
+    buffer = []
+    for item in history:
+        if np.ndim(item) == 1:
+            buffer.append(item)
+            if len(buffer) == chunk_size:
+                yield np.array(buffer, dtype=float)
+                buffer = []
+        else:
+            if buffer:
+                yield np.array(buffer, dtype=float)
+                buffer = []
+            yield from iter_force_chunks(np.asarray(item), chunk_size)
+    if buffer:
+        yield np.array(buffer, dtype=float)
+
+
+def bolt_pattern_damage(pattern, history, endurance_limits, force_location=None, Kf=None,
+                        z=-3, range_bin_width=1, mean_bin_width=None, initial_damage=0,
+                        chunk_size=2 ** 16):
+    """Predict the fatigue damage and remaining life of each bolt of a pattern
+    over a force history, the history is read chunk by chunk (see BoltPatternFatigue)
+
+    :param BoltPattern pattern: the bolt pattern (it is not modified)
+    :param history: (n_steps, 3) force history (array, memory-mapped array or iterable)
+    :param list[EnduranceLimit] endurance_limits: the EnduranceLimit object of each bolt
+    :param list force_location: The forces location (default: the pattern's force_location)
+    :param float or list[float] Kf: thread dynamic stress concentration factor
+        (default: the Kf of each bolt)
+    :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+        where N=5e8
+    :param float range_bin_width: width of the range bins [MPa]
+        (None - no binning, only for short histories)
+    :param float mean_bin_width: width of the mean bins [MPa] (default: range_bin_width)
+    :param float or list[float] initial_damage: damage the bolts already have
+    :param int chunk_size: maximum number of force vectors read at once
+
+    :returns: groups, damage, life, remaining_life and out_of_range_cycles of each bolt
+        (see BoltPatternFatigue.finish)
+    :rtype: dict
+    """
+    analysis = BoltPatternFatigue(pattern, endurance_limits, force_location, Kf, z,
+                                  range_bin_width, mean_bin_width)
+    for chunk in iter_force_chunks(history, chunk_size):
+        analysis.feed(chunk)
+    return analysis.finish(initial_damage)
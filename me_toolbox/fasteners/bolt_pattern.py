@@ -1,9 +1,15 @@
 """module containing the BoltPattern class used for a bolt pattern strength analysis"""
-from numpy import array, cross, dot, sqrt
+import logging
+
+from numpy import array, cross, dot, ndim, sqrt
 from numpy.linalg import norm
 
 from me_toolbox.fatigue import FatigueAnalysis, EnduranceLimit
-from me_toolbox.tools import print_atributes
+from me_toolbox.fasteners.bolt_pattern_solver import BoltPatternSolver
+from me_toolbox.tools import print_atributes, dependent_property
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class BoltPattern:
@@ -43,17 +49,41 @@ class BoltPattern:
         """print all the fastener properties"""
         print_atributes(self)
 
+    def solver(self):
+        """Returns a solver for evaluating the pattern under many load cases at once
+        (see BoltPatternSolver.solve), the solver is reused until the pattern changes
+
+        :rtype: BoltPatternSolver
+        """
+        return self._solver
+
+    @dependent_property('_fasteners_key', '_geometry_key', 'shear_location')
+    def _solver(self):
+        """cached BoltPatternSolver of the pattern"""
+        return BoltPatternSolver.from_pattern(self)
+
+    @property
+    def _fasteners_key(self):
+        """the stiffness keys of the fasteners (changes when a fastener changes)"""
+        return tuple(fastener.stiffness_key for fastener in self.fasteners)
+
     @property
+    def _geometry_key(self):
+        """the fasteners locations, axis of rotation and preloads as a key"""
+        return (tuple(tuple(location) for location in self.fasteners_locations),
+                tuple(tuple(point) for point in self.axis_of_rotation), tuple(self.preloads))
+
+    @dependent_property('_fasteners_key')
     def fasteners_stiffness(self):
         """bolts' fastener stiffness (C)"""
         return [fastener.fastener_stiffness for fastener in self.fasteners]
 
-    @property
+    @dependent_property('_fasteners_key')
     def total_stiffness(self):
         """fasteners' total stiffness list (Kb+Km)"""
         return [fastener.member_stiffness + fastener.bolt_stiffness for fastener in self.fasteners]
 
-    @property
+    @dependent_property('_fasteners_key', 'shear_location')
     def bolt_shear_area(self):
         """if the shear stress is in the threaded section the shear area is the stress areas
            if the shear stress is in the shank section the shear area is the shank area"""
@@ -85,7 +115,7 @@ class BoltPattern:
 
         return [(force * area) / sum(self.bolt_shear_area) for area in self.bolt_shear_area]
 
-    @property
+    @dependent_property('_fasteners_key', '_geometry_key', 'shear_location')
     def center_of_rotation(self):
         """center of rotation for an off center shear force"""
         bolts_x_locations = [bolt[0] for bolt in self.fasteners_locations]
@@ -146,7 +176,7 @@ class BoltPattern:
         return [array([0, 0, (normal_force * stiffness) / sum(self.total_stiffness)]) for stiffness
                 in self.total_stiffness]
 
-    @property
+    @dependent_property('_fasteners_key', '_geometry_key')
     def neutral_point(self):
         """The location of the neutral point of tension"""
         bolts_x_locations = [bolt[0] for bolt in self.fasteners_locations]
@@ -202,86 +232,89 @@ class BoltPattern:
         return [sqrt(normal_stress ** 2 + 3 * shear_stress ** 2) for normal_stress, shear_stress in
                 zip(self.normal_stress, self.shear_stress)]
 
+    @verbose_option
     def load_safety_factor(self, minimal_value=True, verbose=False):
         """Safety factor for loading (nL)
                 :param bool minimal_value: If true returns the lowest safety factor of all the
                 fasteners, if false returns a list of safety factors for each of the fasteners
                 :param bool verbose: If true prints the safety value for each fastener
+                (logged with logger.info)
         """
         proof_loads = array([fastener.bolt.proof_load for fastener in self.fasteners])
         nL = (proof_loads - array(self.preloads)) / (self.bolt_load - array(self.preloads))
         if verbose:
             for i, fastener in enumerate(self.fasteners):
-                print(f"{fastener} - nL = {nL[i]:.2f}")
-            print("")
+                logger.info("%s - nL = %.2f", fastener, nL[i])
         return min(nL) if minimal_value else nL
 
+    @verbose_option
     def separation_safety_factor(self, minimal_value=True, verbose=False):
         """Safety factor against fastener separation (n0)
                 :param bool minimal_value: If true returns the lowest safety factor of all the
                 fasteners, if false returns a list of safety factors for each of the fasteners
                 :param bool verbose: If true prints the safety value for each fastener
+                (logged with logger.info)
         """
         n0 = array(self.preloads) / ((1 - array(self.fasteners_stiffness)) * self.fastener_load)
         if verbose:
             for i, fastener in enumerate(self.fasteners):
-                print(f"{fastener} - n0 = {n0[i]:.2f}")
-            print("")
+                logger.info("%s - n0 = %.2f", fastener, n0[i])
         return min(n0) if minimal_value else n0
 
+    @verbose_option
     def proof_safety_factor(self, minimal_value=True, verbose=False):
         """Safety factor for proof strength (np)
                 :param bool minimal_value: If true returns the lowest safety factor of all the
                 fasteners, if false returns a list of safety factors for each of the fasteners
                 :param bool verbose: If true prints the safety value for each fastener
+                (logged with logger.info)
         """
         np = [fastener.bolt.proof_strength / eq for fastener, eq in
               zip(self.fasteners, self.equivalent_stresses)]
         if verbose:
             for i, fastener in enumerate(self.fasteners):
-                print(f"{fastener} - np = {np[i]:.2f}")
-            print("")
+                logger.info("%s - np = %.2f", fastener, np[i])
         return min(np) if minimal_value else np
 
-    def variable_loading_stresses(self, Fmin, Fmax):
+    def variable_loading_stresses(self, Fmin, Fmax, force_location=None):
         """
         Returns the alternating and mean normal and shear stresses
-            :param list[float] Fmin: Minimum force
-            :param list[float] Fmax: Maximum force
+        (the pattern is not modified so it can be shared between threads)
+            :param list[float] or np.ndarray Fmin: Minimum force, or a (n_cases, 3) array
+            of minimum forces
+            :param list[float] or np.ndarray Fmax: Maximum force, or a (n_cases, 3) array
+            of maximum forces
+            :param list[float] or np.ndarray force_location: The forces location
+            (default: the pattern's force_location)
             :return:A List of the alternating normal stress, a List of the alternating shear stress,
             a List of the mean normal stress and a List of the mean shear stress
+            (a (n_cases, n_bolts) array of each for arrays of forces)
             :rtype: dict{'alt_normal_stress': float,
                          'alt_shear_stress': float,
                          'mean_normal_stress': float,
                          'mean_shear_stress': float}
         """
-        force = self.force  # saving the original force used in the class call
-
-        # setting the pattern force attribute as the minimum force and
-        # retrieving the minimum normal stress and the minimum shear stress
-        # from the updated class properties
-        self.force = Fmin
-        min_normal_stress = array(self.normal_stress)
-        min_shear_stress = array(self.shear_stress)
-
-        # setting the pattern force attribute as the maximum force and
-        # retrieving the maximum normal stress and the maximum shear stress
-        # from the updated class properties
-        self.force = Fmax
-        max_normal_stress = array(self.normal_stress)
-        max_shear_stress = array(self.shear_stress)
-
-        alt_normal_stress = (max_normal_stress - min_normal_stress) / 2
-        alt_shear_stress = (max_shear_stress - min_shear_stress) / 2
-        mean_normal_stress = (max_normal_stress + min_normal_stress) / 2
-        mean_shear_stress = (max_shear_stress + min_shear_stress) / 2
-
-        self.force = force  # restoring the original force used in the class call
-
-        return {'alt_normal_stress': alt_normal_stress,
-                'alt_shear_stress': alt_shear_stress,
-                'mean_normal_stress': mean_normal_stress,
-                'mean_shear_stress': mean_shear_stress}
+        force_location = self.force_location if force_location is None else force_location
+        stresses = self.solver().variable_stresses(Fmin, Fmax, force_location)
+        if ndim(Fmin) == 1 and ndim(Fmax) == 1:
+            return {key: value[0] for key, value in stresses.items()}
+        return stresses
+
+    def history_loading_stresses(self, forces, force_locations=None):
+        """
+        Returns the alternating and mean normal and shear stresses of each bolt
+        over a history of force vectors (from the extreme stresses of each bolt)
+            :param np.ndarray forces: (n_steps, 3) force history
+            :param np.ndarray force_locations: The forces location, one location or one for each
+            step (default: the pattern's force_location)
+            :return: the alternating and mean normal and shear stresses of each bolt
+            :rtype: dict{'alt_normal_stress': np.ndarray,
+                         'alt_shear_stress': np.ndarray,
+                         'mean_normal_stress': np.ndarray,
+                         'mean_shear_stress': np.ndarray}
+        """
+        force_locations = self.force_location if force_locations is None else force_locations
+        return self.solver().history_stresses(forces, force_locations)
 
     def variable_equivalent_stresses(self, endurance_limit, Fmin, Fmax):
         """Returns the mean and alternating equivalent stress (σ_eq_a and σ_eq_m)
@@ -298,8 +331,10 @@ class BoltPattern:
             self.variable_loading_stresses(Fmin, Fmax).values()
         variable_eq_stresses = []
         for i, fastener in enumerate(self.fasteners):
-            analysis = FatigueAnalysis(endurance_limit=endurance_limit[i], ductile=True,
-                                       Sy=fastener.bolt.yield_strength,
+            analysis = FatigueAnalysis(modified_endurance_limit=endurance_limit[i].modified,
+                                       stress_type='multiple', ductile=True,
+                                       ultimate_tensile_strength=fastener.bolt.tensile_strength,
+                                       yield_strength=fastener.bolt.yield_strength,
                                        Kf_normal=fastener.bolt.Kf,
                                        Kf_torsion=fastener.bolt.Kf,
                                        alt_normal_stress=alt_normal_stress[i],
@@ -310,13 +345,14 @@ class BoltPattern:
                                          'alt': analysis.alt_eq_stress})
         return variable_eq_stresses
 
+    @verbose_option
     def fatigue_safety_factor(self, endurance_limits, Fmin, Fmax, verbose=False):
         """
         Returns the fatigue(Goodman) and static(Langar) safety factors for each bolt
         :param list[EnduranceLimit] endurance_limits: the EnduranceLimit object of each bolt
         :param list[float] Fmin: Minimum force
         :param list[float] Fmax: Maximum force
-        :param bool verbose: Print additional information
+        :param bool verbose: Print additional information (logged with logger.info)
         :return: A list of the fatigue and static safety factors pairs for each of the bolts
         :rtype: list[dict{'fatigue': float, 'static': float}]
         """
@@ -331,7 +367,8 @@ class BoltPattern:
             Se = endurance_limits[i].modified
             Sp = fastener.bolt.proof_strength
             if verbose:
-                print(f"σi={preload_stress}, σa={alt_stress}, σm={mean_stress}, Sut={Sut}, Se={Se}")
+                logger.info("σi=%s, σa=%s, σm=%s, Sut=%s, Se=%s",
+                            preload_stress, alt_stress, mean_stress, Sut, Se)
             nf = ((Se * (Sut - preload_stress)) /
                   (Sut * alt_stress + Se * (mean_stress - preload_stress)))
             ns = Sp / (mean_stress + alt_stress)
@@ -0,0 +1,232 @@
+"""module containing the BoltPatternSolver class used for analysing a bolt pattern
+under many load cases at once"""
+import numpy as np
+
+
+class BoltPatternSolver:
+    """Bolt pattern strength analysis for many load cases at once, the pattern geometry
+    and stiffness are calculated once (as arrays) when the solver is created
+
+    Note: the calculations are the same as in BoltPattern, changing the fasteners after
+    the solver was created is not reflected in the results (create a new solver)
+
+    .. code-block:: python
+
+        solver = BoltPatternSolver.from_pattern(pattern)
+        results = solver.solve(forces, force_locations)  # forces is (n_cases, 3) array
+        n0 = results['n0'].min(axis=1)  # the lowest separation safety factor of each case
+    """
+
+    def __repr__(self):
+        return f"BoltPatternSolver(fasteners={[str(fastener) for fastener in self.fasteners]}, " \
+               f"fasteners_locations={self.fasteners_locations.tolist()}, " \
+               f"axis_of_rotation={self.axis_of_rotation.tolist()}, " \
+               f"shear_location={self.shear_location})"
+
+    def __init__(self, fasteners, fasteners_locations, axis_of_rotation, shear_location,
+                 preloads=None):
+        """Initialize bolt pattern solver
+        :param list[ThreadedFastener] fasteners: A List of threaded fasteners object
+        :param list[list] fasteners_locations: A list of coordinates for each of the
+         fasteners locations
+        :param list[list] axis_of_rotation: List of two points that describe the axis of
+        rotation
+        :param string shear_location: Where along the volt the shear is felt, shank or thread
+        :param list or None preloads: The fasteners preloads (default: the fasteners' preload)
+        """
+        self.fasteners = list(fasteners)
+        self.fasteners_locations = np.asarray(fasteners_locations, dtype=float)
+        self.axis_of_rotation = np.asarray(axis_of_rotation, dtype=float)
+        self.shear_location = shear_location
+        if preloads is None:
+            preloads = [fastener.preload for fastener in self.fasteners]
+        self.preloads = np.asarray(preloads, dtype=float)
+
+        if shear_location == 'shank':
+            self.bolt_shear_area = np.array([fastener.bolt.nominal_area
+                                             for fastener in self.fasteners])
+        elif shear_location == 'thread':
+            self.bolt_shear_area = np.array([fastener.bolt.stress_area
+                                             for fastener in self.fasteners])
+        else:
+            raise ValueError("shear_location can be 'shank' or 'thread'")
+
+        self.stress_area = np.array([fastener.bolt.stress_area for fastener in self.fasteners])
+        self.proof_load = np.array([fastener.bolt.proof_load for fastener in self.fasteners])
+        self.proof_strength = np.array([fastener.bolt.proof_strength
+                                        for fastener in self.fasteners])
+        self.fasteners_stiffness = np.array([fastener.fastener_stiffness
+                                             for fastener in self.fasteners])
+        self.total_stiffness = np.array([fastener.member_stiffness + fastener.bolt_stiffness
+                                         for fastener in self.fasteners])
+
+        # center of rotation (G) and the polar moment of the shear areas around it
+        area = self.bolt_shear_area
+        self.center_of_rotation = area @ self.fasteners_locations / area.sum()
+        self._rGi = self.fasteners_locations - self.center_of_rotation
+        self._area_moment = np.sum(area * np.sum(self._rGi ** 2, axis=1))
+
+        # neutral point of tension (H) and the fasteners distances from the rotation edge
+        stiffness = self.total_stiffness
+        self.neutral_point = stiffness @ self.fasteners_locations / stiffness.sum()
+        edge_p1, edge_p2 = self.axis_of_rotation
+        edge_vector = edge_p2 - edge_p1
+        edge_direction = np.array([-edge_vector[1], edge_vector[0]]) / np.linalg.norm(edge_vector)
+        relative = self.fasteners_locations[:, :2] - edge_p1
+        signed_distance = (edge_vector[0] * relative[:, 1] - edge_vector[1] * relative[:, 0]) / \
+            np.linalg.norm(edge_vector)
+        self.distance_from_edge = signed_distance[:, None] * edge_direction
+        self._stiffness_moment = np.sum(stiffness * signed_distance ** 2)
+
+    @classmethod
+    def from_pattern(cls, pattern):
+        """Create a solver for the fasteners and geometry of a BoltPattern
+
+        :param BoltPattern pattern: the bolt pattern
+
+        :rtype: BoltPatternSolver
+        """
+        return cls(pattern.fasteners, pattern.fasteners_locations, pattern.axis_of_rotation,
+                   pattern.shear_location, preloads=pattern.preloads)
+
+    @staticmethod
+    def _as_cases(forces, force_locations):
+        """Returns the forces and locations as (n_cases, 3) arrays"""
+        forces = np.atleast_2d(np.asarray(forces, dtype=float))
+        force_locations = np.broadcast_to(np.asarray(force_locations, dtype=float),
+                                          forces.shape)
+        return forces, force_locations
+
+    def shear_forces(self, forces, force_locations):
+        """The total shear force on each bolt from the direct shear force and resulting torque
+        (Fi = Fvi+FGi)
+
+        :param np.ndarray forces: (n_cases, 3) external forces
+        :param np.ndarray force_locations: (n_cases, 3) forces locations (or one location)
+
+        :returns: (n_cases, n_bolts, 3) shear forces
+        :rtype: np.ndarray
+        """
+        forces, force_locations = self._as_cases(forces, force_locations)
+        area = self.bolt_shear_area
+
+        # direct shear force (forces in the z direction don't cause shear)
+        direct = forces[:, None, :] * (area / area.sum())[None, :, None]
+        direct[:, :, 2] = 0
+
+        # shear force from the torque around the z axis
+        relative = force_locations - self.center_of_rotation
+        torque = relative[:, 0] * forces[:, 1] - relative[:, 1] * forces[:, 0]
+        rGi = self._rGi
+        torque_shear = np.zeros_like(direct)
+        factor = torque[:, None] * area / self._area_moment
+        torque_shear[:, :, 0] = -factor * rGi[:, 1]
+        torque_shear[:, :, 1] = factor * rGi[:, 0]
+        return direct + torque_shear
+
+    def shear_stress(self, forces, force_locations):
+        """bolts' shear stress of each case
+
+        :rtype: np.ndarray
+        """
+        return np.linalg.norm(self.shear_forces(forces, force_locations), axis=2) / \
+            self.bolt_shear_area
+
+    def fastener_load(self, forces, force_locations):
+        """the total normal force on each bolt from the direct force and resulting
+        bending moment (Pj)
+
+        :param np.ndarray forces: (n_cases, 3) external forces
+        :param np.ndarray force_locations: (n_cases, 3) forces locations (or one location)
+
+        :returns: (n_cases, n_bolts) fasteners loads
+        :rtype: np.ndarray
+        """
+        forces, force_locations = self._as_cases(forces, force_locations)
+        stiffness = self.total_stiffness
+        direct = forces[:, 2:] * stiffness / stiffness.sum()
+
+        # moment relative to the neutral center (the moment in the z direction
+        # doesn't cause tension)
+        relative = force_locations - np.array([*self.neutral_point[:2], 0])
+        moment = np.cross(relative, forces)
+        distance = self.distance_from_edge
+        bending = (moment[:, :1] * distance[:, 1] - moment[:, 1:2] * distance[:, 0]) * \
+            stiffness / self._stiffness_moment
+        return np.abs(direct + bending)
+
+    def normal_stress(self, forces, force_locations):
+        """normal stress in the bolts of each case
+
+        :rtype: np.ndarray
+        """
+        bolt_load = self.preloads + self.fastener_load(forces, force_locations) * \
+            self.fasteners_stiffness
+        return bolt_load / self.stress_area
+
+    def variable_stresses(self, min_forces, max_forces, force_locations):
+        """Returns the alternating and mean normal and shear stresses of each case
+        (the stresses of the maximum force minus the stresses of the minimum force)
+
+        :param np.ndarray min_forces: (n_cases, 3) minimum forces
+        :param np.ndarray max_forces: (n_cases, 3) maximum forces
+        :param np.ndarray force_locations: (n_cases, 3) forces locations (or one location)
+
+        :returns: (n_cases, n_bolts) arrays of the alternating and mean stresses
+        :rtype: dict[str, np.ndarray]
+        """
+        min_normal_stress = self.normal_stress(min_forces, force_locations)
+        min_shear_stress = self.shear_stress(min_forces, force_locations)
+        max_normal_stress = self.normal_stress(max_forces, force_locations)
+        max_shear_stress = self.shear_stress(max_forces, force_locations)
+        return {'alt_normal_stress': (max_normal_stress - min_normal_stress) / 2,
+                'alt_shear_stress': (max_shear_stress - min_shear_stress) / 2,
+                'mean_normal_stress': (max_normal_stress + min_normal_stress) / 2,
+                'mean_shear_stress': (max_shear_stress + min_shear_stress) / 2}
+
+    def history_stresses(self, forces, force_locations):
+        """Returns the alternating and mean normal and shear stresses of each bolt
+        over a force history (from the extreme stresses of each bolt)
+
+        :param np.ndarray forces: (n_steps, 3) force history
+        :param np.ndarray force_locations: (n_steps, 3) forces locations (or one location)
+
+        :returns: (n_bolts,) arrays of the alternating and mean stresses
+        :rtype: dict[str, np.ndarray]
+        """
+        normal_stress = self.normal_stress(forces, force_locations)
+        shear_stress = self.shear_stress(forces, force_locations)
+        results = {}
+        for name, stress in (('normal', normal_stress), ('shear', shear_stress)):
+            max_stress, min_stress = stress.max(axis=0), stress.min(axis=0)
+            results[f'alt_{name}_stress'] = (max_stress - min_stress) / 2
+            results[f'mean_{name}_stress'] = (max_stress + min_stress) / 2
+        return {key: results[key] for key in ('alt_normal_stress', 'alt_shear_stress',
+                                              'mean_normal_stress', 'mean_shear_stress')}
+
+    def solve(self, forces, force_locations):
+        """Evaluate the stresses and safety factors of every load case
+
+        :param np.ndarray forces: (n_cases, 3) external forces
+        :param np.ndarray force_locations: (n_cases, 3) forces locations (or one location)
+
+        :returns: (n_cases, n_bolts) arrays of the shear, normal and equivalent stresses,
+            the fastener and bolt loads and the n0, nL and np safety factors
+        :rtype: dict[str, np.ndarray]
+        """
+        shear_stress = self.shear_stress(forces, force_locations)
+        fastener_load = self.fastener_load(forces, force_locations)
+        bolt_load = self.preloads + fastener_load * self.fasteners_stiffness
+        normal_stress = bolt_load / self.stress_area
+        equivalent_stress = np.sqrt(normal_stress ** 2 + 3 * shear_stress ** 2)
+        with np.errstate(divide='ignore'):
+            n0 = self.preloads / ((1 - self.fasteners_stiffness) * fastener_load)
+            nL = (self.proof_load - self.preloads) / (bolt_load - self.preloads)
+        return {'shear_stress': shear_stress,
+                'normal_stress': normal_stress,
+                'equivalent_stress': equivalent_stress,
+                'fastener_load': fastener_load,
+                'bolt_load': bolt_load,
+                'n0': n0,
+                'nL': nL,
+                'np': self.proof_strength / equivalent_stress}
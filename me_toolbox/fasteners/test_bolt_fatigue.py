@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.fasteners import Bolt, BoltPattern, ThreadedFastener, BoltPatternFatigue, \
+    bolt_pattern_damage
+from me_toolbox.fatigue import EnduranceLimit, FatigueAnalysis, MinerAccumulator
+
+
+class TestBoltPatternFatigue(TestCase):
+    def setUp(self):
+        # the BoltPattern example notebook
+        layers = [[5, 207e3], [10, 207e3]]
+        self.M10 = Bolt(10, 1.5, 33, 26, *Bolt.get_strength_prop(10, '9.8'), 207e3)
+        self.M5 = Bolt(5, 0.8, 23, 16, *Bolt.get_strength_prop(5, '9.8'), 207e3)
+        M10_fastener = ThreadedFastener(self.M10, layers, nut=True, preload=32062.5)
+        M5_fastener = ThreadedFastener(self.M5, layers, nut=True, preload=7850)
+        self.pattern = BoltPattern([M10_fastener, M10_fastener, M5_fastener],
+                                   [[20, 45, 0], [-20, 45, 0], [0, 15, 0]],
+                                   [0, -8500, 0], [0, 0, 100], [[0, 0], [1, 0]], 'shank')
+        Se = self.M10.endurance_limit(EnduranceLimit.unmodified_Se(900, 'steel'),
+                                      surface_finish='cold-drawn', temp=300, reliability=0.9)
+        self.endurance_limits = [Se, Se, Se]
+        self.M10.Kf = self.M5.Kf = FatigueAnalysis.calc_thread_kf(9.8, 'Rolled Threads')
+
+        time = np.linspace(0, 20 * np.pi, 2001)
+        self.history = np.column_stack((np.zeros_like(time), -15e3 + 15e3 * np.sin(time),
+                                        np.zeros_like(time)))
+
+    def test_variable_equivalent_stresses(self):
+        stresses = self.pattern.variable_equivalent_stresses(self.endurance_limits,
+                                                             [0, -6500, 0], [0, -8500, 0])
+        self.assertAlmostEqual(stresses[0]['mean'], 593.55, places=2)
+        self.assertAlmostEqual(stresses[0]['alt'], 33.95, places=2)
+        self.assertAlmostEqual(stresses[2]['mean'], 570.38, places=2)
+        self.assertAlmostEqual(stresses[2]['alt'], 29.95, places=2)
+
+    def test_two_level_history(self):
+        # alternating between two forces gives the equivalent stresses of the constant
+        # amplitude loading
+        Fmin, Fmax = [0, -6500, 0], [0, -8500, 0]
+        analysis = BoltPatternFatigue(self.pattern, self.endurance_limits, range_bin_width=None)
+        analysis.feed([Fmin, Fmax] * 5 + [Fmin])
+        results = analysis.finish()
+        expected = self.pattern.variable_equivalent_stresses(self.endurance_limits, Fmin, Fmax)
+        for bolt in (0, 2):
+            alt_stress, mean_stress = analysis.equivalent_stresses(results['groups'][bolt], bolt)
+            np.testing.assert_allclose(alt_stress, expected[bolt]['alt'])
+            np.testing.assert_allclose(mean_stress, expected[bolt]['mean'])
+        self.assertAlmostEqual(float(alt_stress[0]), 29.95, places=2)
+
+    def test_damage(self):
+        # 10 cycles between the extreme forces
+        extremes = [[0, -10e3, 0], [0, 0, 0]]
+        history = np.array(extremes * 10 + extremes[:1])
+        results = bolt_pattern_damage(self.pattern, history, self.endurance_limits,
+                                      range_bin_width=None)
+        solver = self.pattern.solver()
+        normal = solver.normal_stress(extremes, self.pattern.force_location)
+        shear = solver.shear_stress(extremes, self.pattern.force_location)
+        for bolt, bolt_type in ((0, self.M10), (2, self.M5)):
+            self.assertEqual(results['groups'][bolt][:, 0].sum(), 10)
+            # the alternating and mean components combined by hand (ductile, Kc=1 Se)
+            sigma_a = abs(normal[0, bolt] - normal[1, bolt]) / 2
+            sigma_m = (normal[0, bolt] + normal[1, bolt]) / 2
+            tau_a = abs(shear[0, bolt] - shear[1, bolt]) / 2
+            tau_m = (shear[0, bolt] + shear[1, bolt]) / 2
+            Kf = bolt_type.Kf
+            alt_stress = np.sqrt((Kf * sigma_a / 0.85) ** 2 + 3 * (Kf * tau_a) ** 2)
+            mean_stress = np.sqrt(sigma_m ** 2 + 3 * tau_m ** 2)
+            accumulator = MinerAccumulator(900, self.endurance_limits[bolt].modified)
+            accumulator.add([10], [alt_stress], [mean_stress])
+            self.assertGreater(accumulator.damage, 0)
+            self.assertAlmostEqual(results['damage'][bolt] / accumulator.damage, 1)
+            self.assertEqual(results['life'][bolt], 1 / results['damage'][bolt])
+        self.assertEqual(self.pattern.force, [0, -8500, 0])
+
+    def test_chunks(self):
+        expected = bolt_pattern_damage(self.pattern, self.history, self.endurance_limits)
+        for history, chunk_size in ((self.history, 7), (list(self.history), 100)):
+            results = bolt_pattern_damage(self.pattern, history, self.endurance_limits,
+                                          chunk_size=chunk_size)
+            np.testing.assert_allclose(results['damage'], expected['damage'])
+
+    def test_default_bins(self):
+        # the default 1 MPa range bins keep the counters bounded on a long random history
+        rng = np.random.default_rng(0)
+        history = np.zeros((20000, 3))
+        history[:, 1] = rng.uniform(-10e3, 0, len(history))
+        analysis = BoltPatternFatigue(self.pattern, self.endurance_limits)
+        for chunk in np.array_split(history, 10):
+            analysis.feed(chunk)
+        sizes = [len(counter._bins) for counter in analysis._counters]
+        results = analysis.finish()
+        self.assertLess(max(sizes), 5000)
+        self.assertGreater(results['groups'][0][:, 0].sum(), 5000)
+
+    def test_remaining_life(self):
+        results = bolt_pattern_damage(self.pattern, self.history, self.endurance_limits,
+                                      initial_damage=0.5)
+        np.testing.assert_allclose(results['remaining_life'][2],
+                                   (0.5 - results['damage'][2]) / results['damage'][2])
+
+    def test_missing_kf(self):
+        self.M5.Kf = None
+        with self.assertRaises(ValueError):
+            bolt_pattern_damage(self.pattern, self.history, self.endurance_limits)
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.fasteners import Bolt, BoltPattern, BoltPatternSolver, ThreadedFastener
+
+
+class TestBoltPatternSolver(TestCase):
+    def setUp(self):
+        # the BoltPattern example notebook
+        layers = [[5, 207e3], [10, 207e3]]
+        M10 = Bolt(10, 1.5, 33, 26, *Bolt.get_strength_prop(10, '9.8'), 207e3)
+        M5 = Bolt(5, 0.8, 23, 16, *Bolt.get_strength_prop(5, '9.8'), 207e3)
+        M10_fastener = ThreadedFastener(M10, layers, nut=True, preload=32062.5)
+        M5_fastener = ThreadedFastener(M5, layers, nut=True, preload=7850)
+        self.pattern = BoltPattern([M10_fastener, M10_fastener, M5_fastener],
+                                   [[20, 45, 0], [-20, 45, 0], [0, 15, 0]],
+                                   [0, -8500, 0], [0, 0, 100], [[0, 0], [1, 0]], 'shank')
+        self.solver = self.pattern.solver()
+
+    def test_notebook_example(self):
+        results = self.solver.solve([0, -8500, 0], [0, 0, 100])
+        np.testing.assert_allclose(results['fastener_load'][0],
+                                   [9272.06, 9272.06, 1034.31], atol=0.01)
+        np.testing.assert_allclose(results['normal_stress'][0], [593.79, 593.79, 567.24],
+                                   atol=0.01)
+        np.testing.assert_allclose(results['shear_stress'][0], [48.10, 48.10, 48.10], atol=0.01)
+        np.testing.assert_allclose(results['equivalent_stress'][0], [599.61, 599.61, 573.33],
+                                   atol=0.01)
+        np.testing.assert_allclose(results['n0'][0], [4.65, 4.65, 9.35], atol=0.01)
+        np.testing.assert_allclose(results['np'][0], [1.08, 1.08, 1.13], atol=0.01)
+
+    def test_matches_pattern(self):
+        rng = np.random.default_rng(0)
+        forces = rng.normal(0, 5e3, (20, 3))
+        locations = rng.normal(0, 50, (20, 3))
+        results = self.solver.solve(forces, locations)
+        for i, (force, location) in enumerate(zip(forces, locations)):
+            self.pattern.force, self.pattern.force_location = list(force), list(location)
+            np.testing.assert_allclose(results['shear_stress'][i], self.pattern.shear_stress)
+            np.testing.assert_allclose(results['normal_stress'][i], self.pattern.normal_stress)
+            np.testing.assert_allclose(results['equivalent_stress'][i],
+                                       self.pattern.equivalent_stresses)
+            np.testing.assert_allclose(results['n0'][i],
+                                       self.pattern.separation_safety_factor(False))
+            np.testing.assert_allclose(results['nL'][i], self.pattern.load_safety_factor(False))
+            np.testing.assert_allclose(results['np'][i], self.pattern.proof_safety_factor(False))
+
+    def test_solver_cache(self):
+        self.assertIs(self.pattern.solver(), self.solver)
+        fastener = self.pattern.fasteners[2]
+        fastener.layers = [[5, 207e3], [10, 70e3]]
+        solver = self.pattern.solver()
+        self.assertIsNot(solver, self.solver)
+        self.assertEqual(solver.total_stiffness[2],
+                         fastener.member_stiffness + fastener.bolt_stiffness)
+        self.pattern.fasteners_locations = [[20, 45, 0], [-20, 45, 0], [0, 20, 0]]
+        self.assertIsNot(self.pattern.solver(), solver)
+
+    def test_variable_loading_stresses(self):
+        # the notebook example, the pattern's force isn't changed
+        stresses = self.pattern.variable_loading_stresses([0, -6500, 0], [0, -8500, 0])
+        np.testing.assert_allclose(stresses['alt_normal_stress'], [4.81073616, 4.81073616,
+                                                                   1.61736502])
+        np.testing.assert_allclose(stresses['alt_shear_stress'], [5.65884242] * 3)
+        np.testing.assert_allclose(stresses['mean_normal_stress'], [588.98141572, 588.98141572,
+                                                                    565.62739024])
+        np.testing.assert_allclose(stresses['mean_shear_stress'], [42.44131816] * 3)
+        self.assertEqual(self.pattern.force, [0, -8500, 0])
+
+        # many cases at once
+        stresses = self.pattern.variable_loading_stresses([[0, -6500, 0], [0, 0, 0]],
+                                                          [[0, -8500, 0], [0, -8500, 0]])
+        self.assertEqual(stresses['alt_shear_stress'].shape, (2, 3))
+        np.testing.assert_allclose(stresses['alt_shear_stress'][1], [48.10016058 / 2] * 3)
+
+    def test_history_loading_stresses(self):
+        history = np.array([[0, -6500, 0], [0, -7000, 0], [0, -8500, 0], [0, -7500, 0]])
+        expected = self.pattern.variable_loading_stresses([0, -6500, 0], [0, -8500, 0])
+        stresses = self.pattern.history_loading_stresses(history)
+        for key, value in expected.items():
+            np.testing.assert_allclose(stresses[key], value)
+
+    def test_shear_location(self):
+        with self.assertRaises(ValueError):
+            BoltPatternSolver(self.pattern.fasteners, self.pattern.fasteners_locations,
+                              self.pattern.axis_of_rotation, 'head')
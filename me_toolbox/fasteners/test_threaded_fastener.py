@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 from math import log, pi, tan, radians
 import numpy as np
 
@@ -114,3 +115,25 @@ class TestThreadedFastener(TestCase):
 
     def test_fastener_stiffness(self):
         self.assertAlmostEqual(self.fastener.fastener_stiffness, 0.33840496783181806)
+
+    def test_stiffness_cache(self):
+        member_stiffness = self.fastener.member_stiffness
+        with patch.object(ThreadedFastener, 'calc_member_stiffness',
+                          wraps=ThreadedFastener.calc_member_stiffness) as calc:
+            for _ in range(10):
+                self.assertEqual(self.fastener.member_stiffness, member_stiffness)
+            calc.assert_not_called()
+
+            # setting the layers (or changing the bolt) recalculates the stiffness
+            self.fastener.layers = [[2, 200e3], [4, 70e3], [4, 200e3]]
+            self.assertNotEqual(self.fastener.member_stiffness, member_stiffness)
+            self.assertEqual(calc.call_count, 1)
+            self.bolt.elastic_modulus = 100e3
+            self.assertLess(self.fastener.fastener_stiffness, 0.33840496783181806)
+
+    def test_invalidate(self):
+        member_stiffness = self.fastener.member_stiffness
+        self.layers[0][1] = 70e3  # changing the layers in place
+        self.assertEqual(self.fastener.member_stiffness, member_stiffness)
+        self.fastener.invalidate()
+        self.assertLess(self.fastener.member_stiffness, member_stiffness)
@@ -1,5 +1,6 @@
 """module containing the ThreadedFastener class used for fastener strength analysis"""
 from copy import deepcopy
+import logging
 
 from math import tan, radians, pi, log
 
@@ -7,7 +8,10 @@ from numpy import array
 
 # from me_toolbox.fatigue import FatigueAnalysis
 from me_toolbox.fasteners import Bolt
-from me_toolbox.tools import print_atributes
+from me_toolbox.tools import print_atributes, dependent_property, clear_cache
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class ThreadedFastener:
@@ -27,15 +31,14 @@ class ThreadedFastener:
         :param bool nut: True if a nut is used, False if the last layer is threaded
         :param float or none preload: The initial load on the bolt (estimated if None)
         """
-
+        self._version = 0
         self.bolt = bolt
         self.layers = layers
         self.nut = nut
         if preload is None:
             self.preload = bolt.estimate_preload(True)
-            print(f"{self} - No preload was entered so an estimated value was used"
-                  f"({round(self.preload,2)})"
-                  f" under the assumption that the bolt is reusable ")
+            logger.warning("%s - No preload was entered so an estimated value was used (%.2f) "
+                           "under the assumption that the bolt is reusable", self, self.preload)
         else:
             self.preload = preload
 
@@ -44,6 +47,51 @@ class ThreadedFastener:
         print_atributes(self)
 
     @property
+    def bolt(self):
+        """The fastener's bolt"""
+        return self._bolt
+
+    @bolt.setter
+    def bolt(self, bolt):
+        self._bolt = bolt
+        self.invalidate()
+
+    @property
+    def layers(self):
+        """The fastener's layers thicknesses and elastic modulus"""
+        return self._layers
+
+    @layers.setter
+    def layers(self, layers):
+        self._layers = layers
+        self.invalidate()
+
+    @property
+    def nut(self):
+        """True if a nut is used, False if the last layer is threaded"""
+        return self._nut
+
+    @nut.setter
+    def nut(self, nut):
+        self._nut = nut
+        self.invalidate()
+
+    def invalidate(self):
+        """Discard the cached geometry and stiffness values
+        (called by the bolt, layers and nut setters, call it after changing the layers in place)
+        """
+        self._version += 1
+        clear_cache(self)
+
+    @property
+    def stiffness_key(self):
+        """A key that changes whenever the fastener's geometry or materials change
+        (the stiffness values are cached by it)"""
+        bolt = self.bolt
+        return (self._version, bolt.diameter, bolt.pitch, bolt.length, bolt.thread_length,
+                bolt.elastic_modulus)
+
+    @dependent_property('stiffness_key')
     def grip_length(self):
         """griped length in the member (l)"""
         if self.nut:
@@ -56,7 +104,7 @@ class ThreadedFastener:
                 grip_length = sum_of_unthreaded_layers + 0.5 * self.bolt.diameter
             return grip_length
 
-    @property
+    @dependent_property('stiffness_key')
     def griped_thread_length(self):
         """threaded section in grip (lt)"""
         lt = self.grip_length - self.bolt.shank_length
@@ -65,7 +113,7 @@ class ThreadedFastener:
                              f"is larger than the griped length({self.grip_length})")
         return lt
 
-    @property
+    @dependent_property('stiffness_key')
     def bolt_stiffness(self):
         """bolt stiffness (Kb)"""
         bolt = self.bolt
@@ -77,7 +125,7 @@ class ThreadedFastener:
         # print(f"Ad={Ad},At={At},E={E},ld={ld},lt={lt},L={bolt.length},LT={bolt.thread_length},l={self.grip_length}")
         return (Ad * At * E) / ((Ad * lt) + (At * ld))
 
-    @property
+    @dependent_property('stiffness_key')
     def member_stiffness(self):
         """ member stiffness (Kb) """
         d = self.bolt.diameter
@@ -87,6 +135,7 @@ class ThreadedFastener:
         return self.calc_member_stiffness(d, D1, lt, self.layers, self.nut)
 
     @staticmethod
+    @verbose_option
     def calc_member_stiffness(diameter, head_diam, grip_length, Layers, nut=True, verbose=False):
         """Calculates member stiffness (Kb)
         :param float diameter: Bolt's nominal diameter
@@ -95,7 +144,7 @@ class ThreadedFastener:
         :param list[list] Layers: tuple (or list)
             containing a tuple (or list) of layer thickness and material
         :param bool nut: True if fastener has a nut, False if the last layer is threaded
-        :param bool verbose: print details for each layer
+        :param bool verbose: print details for each layer (logged with logger.info)
 
         :returns: Substrate stiffness
         :rtype: float
@@ -151,14 +200,14 @@ class ThreadedFastener:
             stiffness.append(ki)
 
             if verbose:
-                print(f"d={d}, D={D}, t={t}, E={E}, ki={ki:.2f}")
+                logger.info("d=%s, D=%s, t=%s, E=%s, ki=%.2f", d, D, t, E, ki)
 
         km_inv = sum(1 / array(stiffness))
         if verbose:
-            print(f"Km={1 / km_inv:.2f}")
+            logger.info("Km=%.2f", 1 / km_inv)
         return 1 / km_inv
 
-    @property
+    @dependent_property('stiffness_key')
     def fastener_stiffness(self):
         """Fastener stiffness of the joint (C),
         the fraction of external load carried by bolt
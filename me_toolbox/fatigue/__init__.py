@@ -1,4 +1,9 @@
-from me_toolbox.fatigue.failure_criteria import FailureCriteria
-from me_toolbox.fatigue.fatigue_analysis import FatigueAnalysis
-from me_toolbox.fatigue.endurance_limit import EnduranceLimit
+from me_toolbox._lazy import attach
 
+__getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={
+    'failure_criteria': ['FailureCriteria'],
+    'fatigue_analysis': ['FatigueAnalysis'],
+    'endurance_limit': ['EnduranceLimit'],
+    'sn_curve': ['SNCurve'],
+    'rainflow': ['RainflowCounter', 'MinerAccumulator', 'iter_chunks', 'rainflow_damage'],
+})
@@ -1,9 +1,60 @@
-"""module containing the EnduranceLimit class"""
-from math import sqrt
+"""module containing the EnduranceLimit class and the Marin factors tables,
+the calculations accept arrays (and arrays of strings for the categorical parameters)
+so many variants are evaluated in one call"""
+import numpy as np
+
+# surface condition factor constants (Ka = a * Sut^b)
+SURFACE_FINISH = {'ground': (1.58, -0.085),
+                  'machined': (4.51, -0.265),
+                  'cold-drawn': (4.51, -0.265),
+                  'hot-rolled': (57.7, -0.718),
+                  'as forged': (272, -0.995)}
+
+# load factor of each stress type
+LOAD_FACTORS = {'bending': 1, 'axial': 0.85, 'torsion': 0.59, 'shear': 0.59, 'multiple': 1}
+
+# temperature [C] and temperature factor
+TEMPERATURE_FACTORS = (
+    np.array([20, 50, 100, 150, 200, 250, 300, 350, 400, 450, 500, 550, 600]),
+    np.array([1, 1.01, 1.02, 1.025, 1.02, 1, 0.975, 0.943, 0.9, 0.843, 0.768, 0.672, 0.549]))
+
+# reliability [%] and reliability factor
+RELIABILITY_FACTORS = (np.array([50, 90, 95, 99, 99.9, 99.99, 99.999, 99.9999]),
+                       np.array([1, 0.897, 0.868, 0.814, 0.753, 0.702, 0.659, 0.620]))
+
+# unmodified endurance limit of each material:
+# Sut limit, Se fraction of Sut under the limit, Se above the limit
+UNMODIFIED_SE = {'steel': (1400, 0.5, 700),
+                 'iron': (400, 0.4, 160),
+                 'aluminium': (330, 0.4, 130),
+                 'copper alloy': (280, 0.4, 100)}
+
+for _table in (*TEMPERATURE_FACTORS, *RELIABILITY_FACTORS):
+    _table.flags.writeable = False
+
+
+def _lookup(values, table, name):
+    """Returns the table rows of the categorical values (a string or an array of strings)"""
+    values = np.asarray(values)
+    names, inverse = np.unique(values, return_inverse=True)
+    unknown = [value for value in names.tolist() if value not in table]
+    if unknown:
+        raise KeyError(f"{name} {unknown} is unknown, the options are: {list(table)}")
+    rows = np.array([table[value] for value in names.tolist()], dtype=float)
+    return rows[inverse.reshape(values.shape)]
+
+
+def _as_result(values):
+    """Returns a float for a scalar (0-d) result and the array otherwise"""
+    return float(values) if np.ndim(values) == 0 else values
 
 
 class EnduranceLimit:
-    """calculates Marin modification factors and return modified endurance limit"""
+    """calculates Marin modification factors and return modified endurance limit
+
+    Note: all the parameters can be arrays (of the same shape or broadcastable),
+    e.g. surface_finish=np.array(['ground', 'machined']) with Sut=np.array([600, 800])
+    """
 
     def __init__(self, unmodified_Se, Sut, surface_finish, rotating, max_normal_stress,
                  max_bending_stress, stress_type, temp, reliability,
@@ -50,11 +101,22 @@ class EnduranceLimit:
             self._A95 = A95
 
     def calc_A95(self):
-        if self.diameter is not None:
-            return 0.01046 * self.diameter ** 2
+        return self.calc_a95(self.diameter, self.width, self.height)
+
+    @staticmethod
+    def calc_a95(diameter=None, width=None, height=None):
+        """Calculate the area containing over 95% of maximum periodic stress
+        of a round (diameter) or rectangular (width and height) cross-section
+
+        :param float or np.ndarray diameter: diameter
+        :param float or np.ndarray width: width
+        :param float or np.ndarray height: height
+        """
+        if diameter is not None:
+            return 0.01046 * np.asarray(diameter) ** 2
 
-        elif (self.width and self.height) is not None:
-            return 0.05 * self.width * self.height
+        elif width is not None and height is not None:
+            return 0.05 * np.asarray(width) * np.asarray(height)
 
         else:
             raise ValueError('A95 is None and no parameters (diameter/width/height)'
@@ -63,38 +125,60 @@ class EnduranceLimit:
     @property
     def Ka(self):
         """Returns Surface condition modification factor"""
+        return self.calc_ka(self.Sut, self.surface_finish)
 
-        data = {'ground': (1.58, -0.085),
-                'machined': (4.51, -0.265),
-                'cold-drawn': (4.51, -0.265),
-                'hot-rolled': (57.7, -0.718),
-                'as forged': (272, -0.995)}
-        a, b = data[self.surface_finish]
-        return a * (self.Sut ** b)
+    @staticmethod
+    def calc_ka(Sut, surface_finish):
+        """Calculate surface condition modification factor
+
+        :param float or np.ndarray Sut: Ultimate tensile strength
+        :param str or np.ndarray surface_finish: surface finish (see SURFACE_FINISH)
+        """
+        constants = _lookup(surface_finish, SURFACE_FINISH, 'surface finish')
+        return _as_result(constants[..., 0] * (np.asarray(Sut, dtype=float) ** constants[..., 1]))
 
     @property
-    def Kb(self):  # FIXME: fix Kb its badly writen
+    def Kb(self):
         """Returns size modification factor"""
-        if self.max_normal_stress > 0.85 * self.max_bending_stress:
-            # if axial loading accrue
-            return 1
-        elif self.rotating and self.diameter is not None:
+        return self.calc_kb(self.rotating, self.max_normal_stress, self.max_bending_stress,
+                            self.A95, self.diameter)
+
+    @staticmethod
+    def calc_kb(rotating, max_normal_stress, max_bending_stress, A95, diameter=None):
+        """Calculate size modification factor,
+        the factor is nan where the effective diameter is out of the range [2.79, 254]
+
+        :param bool or np.ndarray rotating: rotating mode
+        :param float or np.ndarray max_normal_stress: (for axial loading check)
+        :param float or np.ndarray max_bending_stress: (for axial loading check)
+        :param float or np.ndarray A95: Area containing over 95% of maximum periodic stress
+        :param float or np.ndarray diameter: diameter (None if not round)
+        """
+        # not rotating or not round
+        de = np.sqrt(np.asarray(A95) / 0.07658)
+        if diameter is not None:
             # rotating and round
-            de = self.diameter
-        else:
-            # not rotating or not round
-            de = sqrt(self.A95 / 0.07658)
+            de = np.where(rotating, diameter, de)
 
-        if 2.79 <= de <= 51:
-            return 1.24 * (de ** -0.107)
-        elif 51 < de <= 254:
-            return 1.51 * (de ** -0.157)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            Kb = np.select([(2.79 <= de) & (de <= 51), (51 < de) & (de <= 254)],
+                           [1.24 * (de ** -0.107), 1.51 * (de ** -0.157)], np.nan)
+        # if axial loading accrue
+        return _as_result(np.where(
+            np.asarray(max_normal_stress) > 0.85 * np.asarray(max_bending_stress), 1, Kb))
 
     @property
     def Kc(self):
         """Returns load modification factor"""
-        types = {'bending': 1, 'axial': 0.85, 'torsion': 0.59, 'shear': 0.59, 'multiple': 1}
-        return types[self.stress_type]
+        return self.calc_kc(self.stress_type)
+
+    @staticmethod
+    def calc_kc(stress_type):
+        """Calculate load modification factor
+
+        :param str or np.ndarray stress_type: stress type (see LOAD_FACTORS)
+        """
+        return _as_result(_lookup(stress_type, LOAD_FACTORS, 'stress type'))
 
     @property
     def Kd(self):
@@ -104,11 +188,7 @@ class EnduranceLimit:
     @staticmethod
     def calc_kd(temp):
         """Calculate temperature modification factor"""
-        import numpy as np
-        percentage = np.array([20, 50, 100, 150, 200, 250, 300, 350, 400, 450, 500, 550, 600])
-        reliability_factors = np.array([1, 1.01, 1.02, 1.025, 1.02, 1, 0.975, 0.943, 0.9, 0.843,
-                                        0.768, 0.672, 0.549])
-        return np.interp(temp, percentage, reliability_factors)
+        return _as_result(np.interp(temp, *TEMPERATURE_FACTORS))
 
     @property
     def Ke(self):
@@ -118,10 +198,7 @@ class EnduranceLimit:
     @staticmethod
     def calc_ke(reliability):
         """Calculates reliability factor"""
-        import numpy as np
-        percentage = np.array([50, 90, 95, 99, 99.9, 99.99, 99.999, 99.9999])
-        reliability_factors = np.array([1, 0.897, 0.868, 0.814, 0.753, 0.702, 0.659, 0.620])
-        return np.interp(reliability, percentage, reliability_factors)
+        return _as_result(np.interp(reliability, *RELIABILITY_FACTORS))
 
     @property
     def Kf(self):
@@ -133,19 +210,11 @@ class EnduranceLimit:
         """Returns the unmodified endurance strength limit based
         on the material (steel/iron/aluminium/copper alloy) and ultimate_tensile_strength
 
-        :param float Sut: Ultimate Tensile Strength
+        :param float or np.ndarray Sut: Ultimate Tensile Strength
         :param string material: (steel/iron/aluminium/copper alloy)
         """
-
-        data = {'steel': {'divider': 1400, 'lesser': 0.5 * Sut, 'grater': 700},
-                'iron': {'divider': 400, 'lesser': 0.4 * Sut, 'grater': 160},
-                'aluminium': {'divider': 330, 'lesser': 0.4 * Sut, 'grater': 130},
-                'copper alloy': {'divider': 280, 'lesser': 0.4 * Sut, 'grater': 100}}
-
-        if Sut < data[material]['divider']:
-            return data[material]['lesser']
-        else:
-            return data[material]['grater']
+        divider, fraction, grater = UNMODIFIED_SE[material]
+        return _as_result(np.where(np.asarray(Sut) < divider, fraction * np.asarray(Sut), grater))
 
     @property
     def modified(self):
@@ -154,6 +223,24 @@ class EnduranceLimit:
         """
         return self.Ka * self.Kb * self.Kc * self.Kd * self.Ke * self.Kf * self.unmodified
 
+    @staticmethod
+    def calc_modified(unmodified_Se, Sut, surface_finish, rotating, max_normal_stress,
+                      max_bending_stress, stress_type, temp, reliability,
+                      A95=None, diameter=None, height=None, width=None):
+        """Calculate the modified endurance limit of many variants in one call
+        (the parameters are the same as in the constructor, as arrays)
+
+        :returns: The modified endurance limit
+        :rtype: np.ndarray
+        """
+        if A95 is None:
+            A95 = EnduranceLimit.calc_a95(diameter, width, height)
+        return (EnduranceLimit.calc_ka(Sut, surface_finish) *
+                EnduranceLimit.calc_kb(rotating, max_normal_stress, max_bending_stress, A95,
+                                       diameter) *
+                EnduranceLimit.calc_kc(stress_type) * EnduranceLimit.calc_kd(temp) *
+                EnduranceLimit.calc_ke(reliability) * unmodified_Se)
+
     def get_factors(self, verbose=True):
         """Prints Marine factors
         :param bool verbose: Enables Marin factors printing
@@ -162,7 +249,15 @@ class EnduranceLimit:
         :rtype: tuple[float]
         """
         if verbose:
-            print(f"Ka={self.Ka:.3f}, Kb={self.Kb:.3f}, Kc={self.Kc:.3f}, "
-                  f"factor_Ks={self.Kd:.3f}, Ke={self.Ke:.3f}, Kf={self.Kf:.3f}")
+            Ka, Kb, Kc, Kd, Ke, Kf = (_format_factor(factor) for factor in
+                                      (self.Ka, self.Kb, self.Kc, self.Kd, self.Ke, self.Kf))
+            print(f"Ka={Ka}, Kb={Kb}, Kc={Kc}, factor_Ks={Kd}, Ke={Ke}, Kf={Kf}")
 
         return self.Ka, self.Kb, self.Kc, self.Kd, self.Ke, self.Kf
+
+
+def _format_factor(factor):
+    """Format a Marin factor with 3 decimals (element-wise for an array of factors)"""
+    if isinstance(factor, np.ndarray):
+        return np.array2string(factor, precision=3, floatmode='fixed')
+    return f"{factor:.3f}"
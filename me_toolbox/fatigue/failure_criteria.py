@@ -2,7 +2,14 @@
 containing the Failure criteria as described in
 Shigley's Mechanical Engineering design
 """
-from sympy import sqrt
+import logging
+
+import numpy as np
+
+from me_toolbox.tools.backend import sqrt
+from me_toolbox.tools.diagnostics import verbose_output
+
+logger = logging.getLogger(__name__)
 
 
 class FailureCriteria:
@@ -18,7 +25,11 @@ class FailureCriteria:
         :rtype: any
 
         :raises Exception: if mean equivalent stress is negative
+            (for arrays the safety factor is nan where the mean stress is negative)
         """
+        if isinstance(mean_eq_stress, np.ndarray):
+            return _array_criterion(_goodman_array, None, ultimate_strength, endurance_limit,
+                                    alt_eq_stress, mean_eq_stress)
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
@@ -33,7 +44,11 @@ class FailureCriteria:
         :rtype: any
 
         :raises Exception: if mean equivalent stress is negative
+            (for arrays the safety factor is nan where the mean stress is negative)
         """
+        if isinstance(mean_eq_stress, np.ndarray):
+            return _array_criterion(_soderberg_array, yield_strength, None, endurance_limit,
+                                    alt_eq_stress, mean_eq_stress)
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
@@ -47,7 +62,11 @@ class FailureCriteria:
         :returns: Safety factor
         :rtype: any
         :raises Exception: if mean equivalent stress is negative
+            (for arrays the safety factor is nan where the mean stress is negative)
         """
+        if isinstance(mean_eq_stress, np.ndarray):
+            return _array_criterion(_gerber_array, None, ultimate_strength, endurance_limit,
+                                    alt_eq_stress, mean_eq_stress)
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
@@ -64,7 +83,11 @@ class FailureCriteria:
         :rtype: any
 
         :raises Exception: if mean equivalent stress is negative
+            (for arrays the safety factor is nan where the mean stress is negative)
         """
+        if isinstance(mean_eq_stress, np.ndarray):
+            return _array_criterion(_asme_elliptic_array, yield_strength, None, endurance_limit,
+                                    alt_eq_stress, mean_eq_stress)
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
@@ -79,6 +102,9 @@ class FailureCriteria:
         :returns: Safety factor
         :rtype: any
         """
+        if isinstance(mean_eq_stress, np.ndarray) or isinstance(alt_eq_stress, np.ndarray):
+            return FailureCriteria.langer_static_yield_array(yield_strength, alt_eq_stress,
+                                                             mean_eq_stress)
         if mean_eq_stress > 0:
             # stress is in the first quadrant of the alternating-mean stress plan
             return yield_strength / (alt_eq_stress + mean_eq_stress)
@@ -101,11 +127,21 @@ class FailureCriteria:
         :param float endurance_limit: Modified endurance limit (Se)
         :param float alt_eq_stress: alternating stresses
         :param float mean_eq_stress: mean stresses
-        :param bool verbose: Print the result
+        :param bool verbose: Print the result (logged with logger.info)
 
         :returns: dynamic and static safety factors
         :rtype: tuple[float, float]
         """
+        if isinstance(mean_eq_stress, np.ndarray) or isinstance(alt_eq_stress, np.ndarray):
+            fatigue_safety_factor, static_safety_factor = FailureCriteria.get_safety_factors_array(
+                yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+                mean_eq_stress, criterion)
+            if verbose:
+                with verbose_output():
+                    logger.info("the minimal %s safety factor is: %s\n"
+                                "the minimal Langer static safety factor is: %s", criterion,
+                                np.nanmin(fatigue_safety_factor), np.nanmin(static_safety_factor))
+            return fatigue_safety_factor, static_safety_factor
 
         if mean_eq_stress > 0:
             # stress is in the first quadrant of the alternating-mean stress plan
@@ -126,15 +162,111 @@ class FailureCriteria:
         else:
             # stress is in the second quadrant of the alternating-mean stress plan
             if verbose:
-                print(f"NOTE: The mean stress = {mean_eq_stress} "
-                      f"is negative, using alternative calculation")
+                with verbose_output():
+                    logger.info("NOTE: The mean stress = %s is negative, using alternative "
+                                "calculation", mean_eq_stress)
             fatigue_safety_factor = endurance_limit / alt_eq_stress
             criterion = 'fatigue'
 
         static_safety_factor = FailureCriteria.langer_static_yield(yield_strength, alt_eq_stress,
                                                                    mean_eq_stress)
         if verbose:
-            print(f"the {criterion} safety factor is: {fatigue_safety_factor}\n"
-                  f"the Langer static safety factor is: {static_safety_factor}")
+            with verbose_output():
+                logger.info("the %s safety factor is: %s\nthe Langer static safety factor is: %s",
+                            criterion, fatigue_safety_factor, static_safety_factor)
+
+        return fatigue_safety_factor, static_safety_factor
+
+    @staticmethod
+    def get_safety_factors_array(yield_strength, ultimate_strength, endurance_limit,
+                                 alt_eq_stress, mean_eq_stress, criterion):
+        """Array version of :meth:`get_safety_factors`, evaluates whole arrays
+        of stress states in one vectorized pass (all inputs are broadcast together)
+
+        Note: as in the scalar version, points with a non-positive mean equivalent stress
+        (second quadrant of the alternating-mean stress plain) use the alternative
+        calculation Se/σa instead of the chosen criterion
+
+        :param str criterion: The criterion to use (modified goodman, soderberg, gerber,
+         asme-elliptic)
+        :param float or np.ndarray yield_strength: The yield strength (Sy or Ssy)
+        :param float or np.ndarray ultimate_strength: The ultimate strength (Sut or Ssu)
+        :param float or np.ndarray endurance_limit: Modified endurance limit (Se)
+        :param np.ndarray alt_eq_stress: alternating stresses
+        :param np.ndarray mean_eq_stress: mean stresses
+
+        :returns: dynamic and static safety factors
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        try:
+            criterion_function = _ARRAY_CRITERIA[criterion.lower()]
+        except KeyError:
+            raise Exception(f"Unknown criterion - {criterion}\n"
+                            f"Available criteria are: 'Modified Goodman', 'Soderberg',"
+                            f"'Gerber', 'ASME-elliptic'")
+
+        Sy, Sut, Se, alt, mean = np.broadcast_arrays(
+            *(np.asarray(value, dtype=np.float64) for value in
+              (yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+               mean_eq_stress)))
+        first_quadrant = mean > 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fatigue_safety_factor = np.where(first_quadrant,
+                                             criterion_function(Sy, Sut, Se, alt, mean),
+                                             Se / alt)
+            static_safety_factor = FailureCriteria.langer_static_yield_array(Sy, alt, mean)
 
         return fatigue_safety_factor, static_safety_factor
+
+    @staticmethod
+    def langer_static_yield_array(yield_strength, alt_eq_stress, mean_eq_stress):
+        """Array version of :meth:`langer_static_yield`
+
+        :returns: Safety factors
+        :rtype: np.ndarray
+        """
+        alt = np.asarray(alt_eq_stress, dtype=np.float64)
+        mean = np.asarray(mean_eq_stress, dtype=np.float64)
+        return yield_strength / (alt + np.abs(mean))
+
+
+def _array_criterion(kernel, yield_strength, ultimate_strength, endurance_limit,
+                     alt_eq_stress, mean_eq_stress):
+    """Evaluate a criterion kernel for arrays of stresses, nan where the mean stress
+    is negative (where the criterion isn't valid)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mean_eq_stress < 0, np.nan,
+                        kernel(yield_strength, ultimate_strength, endurance_limit,
+                               alt_eq_stress, mean_eq_stress))
+
+
+# array kernels used by FailureCriteria.get_safety_factors_array,
+# only valid for points in the first quadrant (mean stress > 0)
+def _goodman_array(yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+                   mean_eq_stress):
+    return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / ultimate_strength))
+
+
+def _soderberg_array(yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+                     mean_eq_stress):
+    return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / yield_strength))
+
+
+def _gerber_array(yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+                  mean_eq_stress):
+    alpha = ultimate_strength / mean_eq_stress
+    beta = alt_eq_stress / endurance_limit
+    return 0.5 * alpha ** 2 * beta * (-1 + np.sqrt(1 + 4 * alpha ** (-2) * beta ** (-2)))
+
+
+def _asme_elliptic_array(yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+                         mean_eq_stress):
+    return np.sqrt(1 / ((alt_eq_stress / endurance_limit) ** 2 +
+                        (mean_eq_stress / yield_strength) ** 2))
+
+
+_ARRAY_CRITERIA = {'modified goodman': _goodman_array,
+                   'soderberg': _soderberg_array,
+                   'gerber': _gerber_array,
+                   'asme-elliptic': _asme_elliptic_array}
@@ -1,16 +1,32 @@
 """module containing the FatigueAnalysis class and
 calc_kf for calculating dynamic stress concentration factor
 """
-from math import log10, inf
-from sympy import sqrt
+import logging
+from math import inf
+
+import numpy as np
 
 from me_toolbox.tools import print_atributes
-from me_toolbox.fatigue import FailureCriteria
+from me_toolbox.tools.backend import sqrt
+from me_toolbox.tools.caching import dependent_property
+from me_toolbox.tools.diagnostics import verbose_option
+from me_toolbox.fatigue import FailureCriteria, SNCurve
+
+logger = logging.getLogger(__name__)
+
+# the stresses of a FatigueAnalysis (the fields of a structured stresses array)
+STRESS_FIELDS = ('alt_bending_stress', 'alt_normal_stress', 'alt_torsion_stress',
+                 'mean_bending_stress', 'mean_normal_stress', 'mean_torsion_stress')
 
-from icecream import ic
 
 class FatigueAnalysis:
-    """Perform fatigue analysis"""
+    """Perform fatigue analysis
+
+    Note: the stresses can be arrays (e.g. the stresses at every node of a section),
+    in that case the equivalent stresses, safety factors and number of cycles are arrays
+    (safety factors of criteria that aren't valid for a negative mean stress are nan),
+    arrays modified in place are not detected - assign a new array instead
+    """
 
     def __init__(self, modified_endurance_limit, stress_type, ductile, ultimate_tensile_strength,
                  yield_strength=None, Kf_bending=0, Kf_normal=0, Kf_torsion=0,
@@ -40,14 +56,57 @@ class FatigueAnalysis:
         self.stress_type = stress_type
         self.ductile = ductile
         self.Kf_bending, self.Kf_normal, self.Kf_torsion = Kf_bending, Kf_normal, Kf_torsion
-        self.alt_bending_stress = alt_bending_stress
-        self.alt_normal_stress = alt_normal_stress
-        self.alt_torsion_stress = alt_torsion_stress
-        self.mean_bending_stress = mean_bending_stress
-        self.mean_normal_stress = mean_normal_stress
-        self.mean_torsion_stress = mean_torsion_stress
-        self.alt_eq_stress = self.calc_alt_eq_stress()
-        self.mean_eq_stress = self.calc_mean_eq_stress()
+        stresses = (alt_bending_stress, alt_normal_stress, alt_torsion_stress,
+                    mean_bending_stress, mean_normal_stress, mean_torsion_stress)
+        for name, stress in zip(STRESS_FIELDS, stresses):
+            if isinstance(stress, (list, tuple)):
+                stress = np.asarray(stress, dtype=float)
+            setattr(self, name, stress)
+
+    @classmethod
+    def from_stresses(cls, stresses, modified_endurance_limit, stress_type, ductile,
+                      ultimate_tensile_strength, yield_strength=None, Kf_bending=0, Kf_normal=0,
+                      Kf_torsion=0):
+        """Create a fatigue analysis of many points at once from a structured array
+        (or a dict of arrays) of stresses, the fields are the stresses names in STRESS_FIELDS
+        (e.g. 'alt_bending_stress'), missing fields are zero
+
+        :param np.ndarray or dict stresses: the stresses at each point
+        (the rest of the parameters are the same as in the constructor)
+
+        :rtype: FatigueAnalysis
+        """
+        names = stresses.dtype.names if isinstance(stresses, np.ndarray) else tuple(stresses)
+        if not names:
+            raise ValueError("stresses should be a structured array or a dict of arrays")
+        unknown = set(names) - set(STRESS_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown stresses {sorted(unknown)}, the stresses are: "
+                             f"{STRESS_FIELDS}")
+
+        arrays = {name: np.asarray(stresses[name], dtype=float) for name in names}
+        shape = np.broadcast_shapes(*(array.shape for array in arrays.values()))
+        kwargs = {name: np.broadcast_to(arrays.get(name, 0.), shape) for name in STRESS_FIELDS}
+        return cls(modified_endurance_limit, stress_type, ductile, ultimate_tensile_strength,
+                   yield_strength, Kf_bending, Kf_normal, Kf_torsion, **kwargs)
+
+    @dependent_property('stress_type', 'Kf_bending', 'Kf_normal', 'Kf_torsion',
+                        'alt_bending_stress', 'alt_normal_stress', 'alt_torsion_stress')
+    def alt_eq_stress(self):
+        """Alternating equivalent stress (see calc_alt_eq_stress)"""
+        return self.calc_alt_eq_stress()
+
+    @dependent_property('stress_type', 'ductile', 'Kf_bending', 'Kf_normal', 'Kf_torsion',
+                        'mean_bending_stress', 'mean_normal_stress', 'mean_torsion_stress')
+    def mean_eq_stress(self):
+        """Mean equivalent stress (see calc_mean_eq_stress)"""
+        return self.calc_mean_eq_stress()
+
+    @property
+    def is_array(self):
+        """True if the stresses are arrays (many points are analysed at once)"""
+        return isinstance(self.alt_eq_stress, np.ndarray) or \
+            isinstance(self.mean_eq_stress, np.ndarray)
 
     @staticmethod
     def calc_kf(q, Kt):
@@ -151,7 +210,7 @@ class FatigueAnalysis:
         :returns: shear_yield_strength - yield stress for shear
         :type: float
         """
-        return self.Sy / sqrt(3).evalf()
+        return self.Sy / 3 ** 0.5
 
     @property
     def modified_goodman(self):
@@ -164,7 +223,7 @@ class FatigueAnalysis:
         :raises ValueError: if ultimate_tensile_strength is not in the fatigue call
         """
 
-        if self.mean_eq_stress < 0:
+        if not self.is_array and self.mean_eq_stress < 0:
             return None
 
         ultimate_strength = self.Sut
@@ -187,7 +246,7 @@ class FatigueAnalysis:
         :raises ValueError: if Sy is not in the fatigue call
         """
 
-        if self.mean_eq_stress < 0:
+        if not self.is_array and self.mean_eq_stress < 0:
             return None
 
         yield_strength = self.Sy
@@ -209,7 +268,7 @@ class FatigueAnalysis:
         :raises ValueError: if ultimate_tensile_strength is not in the fatigue call
         """
 
-        if self.mean_eq_stress < 0:
+        if not self.is_array and self.mean_eq_stress < 0:
             return None
 
         ultimate_strength = self.Sut
@@ -231,7 +290,7 @@ class FatigueAnalysis:
         :raises ValueError: if ultimate_tensile_strength is not in the fatigue call
         """
 
-        if self.mean_eq_stress < 0:
+        if not self.is_array and self.mean_eq_stress < 0:
             return None
 
         yield_strength = self.Sut
@@ -302,23 +361,7 @@ class FatigueAnalysis:
         :returns: Sm_stress stress
         :rtype: float
         """
-
-        def f(x):
-            """ f - fatigue strength fraction
-                function constructed from curve fitting to the f graph in Shigley's
-                the range of the fit is ( 70[kPsi] < ultimate_tensile_strength < 200[kPsi] ) """
-            return (-2.56710686e-16 * x ** 5 + 1.35729780e-12 * x ** 4 - 2.92474777e-09 * x ** 3 +
-                    3.28990748e-06 * x ** 2 - 2.04929617e-03 * x + 1.38405394e+00)
-
-        if Sut < 482.633:  # 482.633[Mpa] = 70[kPsi]
-            # print(f"Note: ultimate_tensile_strength={Sut} < 482.633[Mpa] (70[kPsi]) so f~0.9")
-            return 0.9 * Sut
-        elif Sut > 1378.95:
-            # print(
-            #     f"Note: ultimate_tensile_strength={Sut} > 1378.95[Mpa] (200[kPsi]) which is out of "
-            #     f"the graph range, f={f(Sut)}")
-            return  0.75 * Sut
-        return f(Sut) * Sut
+        return SNCurve.calc_Sm(Sut)
 
     def num_of_cycles(self, z=-3):
         """Returns the number of cycles until failure
@@ -334,7 +377,7 @@ class FatigueAnalysis:
         :rtype: tuple[float, float]
         """
         return self.calc_num_of_cycles(self.mean_eq_stress, self.alt_eq_stress, self.Se, self.Sut,
-                                       self.Sy, z=-3)
+                                       self.Sy, z=z)
 
     @staticmethod
     def calc_num_of_cycles(mean_eq_stress, alt_eq_stress, endurance_limit,
@@ -354,48 +397,17 @@ class FatigueAnalysis:
             -5.69 for metal where N=5e8
 
         :returns: The Number of cycles and the fatigue stress at failure
+            (arrays for arrays of stresses, the fatigue stress is nan where it's None)
         :rtype: tuple[float, float] or tuple[float, None]
         """
-        mean_stress = mean_eq_stress
-        alternating_stress = alt_eq_stress
-        Se = endurance_limit
-        Sut = ultimate_tensile_strength
-        Sy = yield_strength
-        Sm = FatigueAnalysis.calc_Sm(Sut)
-
-        # if mean_stress is larger or equal to Sut then the reversible_stress is either negative or
-        # undefined because of a division by zero error
-        if mean_stress >= Sut:
-            return 0, None
-
-        # calculating the reversible stress (σ_rev)
-        if mean_stress >= 0:
-            reversible_stress = alternating_stress / (1 - (mean_stress / Sut))
+        if isinstance(endurance_limit, np.ndarray) or \
+                isinstance(ultimate_tensile_strength, np.ndarray):
+            curve = SNCurve(ultimate_tensile_strength, endurance_limit, yield_strength, z)
         else:
-            reversible_stress = alternating_stress
-
-
-        # Low Cycle Fatigue
-        if Sm < reversible_stress < Sy:
-            if z != -3:
-                raise ValueError(f"Number of cycles calculation for low cycle fatigue"
-                                 f" is only possible for zeta=-3")
-
-            a = Sut
-            b = (1 / z) * log10(Sut / Sm)
-
-        # High Cycle Fatigue
-        elif Se < reversible_stress < Sm:
-            a = Sm * (Sm / Se) ** (-3 / z)
-            b = (1 / z) * log10(Sm / Se)
-
-        elif reversible_stress < Se:
-            return inf, None  # inf is from math module - short for infinity
-        else:
-            return  0, None
-        N = (reversible_stress / a) ** (1 / b)
-        return N, a * N ** b
+            curve = SNCurve.get(ultimate_tensile_strength, endurance_limit, yield_strength, z)
+        return curve.num_of_cycles(alt_eq_stress, mean_eq_stress)
 
+    @verbose_option
     def miner_rule(self, stress_groups, Sut, Se, Sy=None, z=-3, verbose=False,
                    alt_mean=False, freq=False):
         """ Calculates total number of cycles for multiple periodic loads,
@@ -406,13 +418,15 @@ class FatigueAnalysis:
 
         Note: if the material don't have fatigue limit use the fatigue strength at Se=Sf(N=1e8)
 
+        Note: for large load spectra use calc_cumulative_damage with arrays directly
+
         :param list stress_groups: list containing the pick stresses and number of repetition
         :param float Sut: Ultimate tensile strength [MPa]
         :param float Sy: yield strength [MPa], if None only HCF is checked
         :param float Se: endurance limit [MPa]
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
             where N=5e8
-        :param bool verbose: printing the groups
+        :param bool verbose: printing the groups (logged with logger.info)
             [number_of_repetitions,maximum_stress, minimum_stress, reversible_stress, Number of
             cycles]
         :param bool freq: if the input is frequency instead of number of repetition
@@ -424,63 +438,88 @@ class FatigueAnalysis:
         :returns: Total number of cycles
         :rtype: float
         """
+        groups = np.array(stress_groups, dtype=float).reshape(-1, 3)
+        result = self.calc_cumulative_damage(groups[:, 0], groups[:, 1], groups[:, 2], Sut, Se,
+                                             Sy=Sy, z=z, alt_mean=alt_mean)
+
+        if result['out_of_range'].any():
+            # log error but don't stop the calculation (the group is ignored)
+            Sm = self.calc_Sm(Sut)
+            for reversible_stress in result['reversible_stress'][result['out_of_range']]:
+                logger.warning("Reversible Stress = %s not in range, LCF-range=(Sm_stress=%s,"
+                               "Sy=%s), HCF-range(Se=%s,Sm_stress=%s)",
+                               reversible_stress, Sm, Sy, Se, Sm)
 
-        Sm = self.calc_Sm(Sut)
-        for group in stress_groups:
-
-            # if the stress given are minimum and maximum instead of alternating and mean
-            if not alt_mean:
-                mean_stress = (group[1] + group[2]) / 2
-                alternating_stress = abs(group[1] - group[2]) / 2
-            else:
-                alternating_stress = group[1]
-                mean_stress = group[2]
-
-            # calculate the reversible stress according to the mean stress sign
-            if mean_stress >= 0:
-                reversible_stress = alternating_stress / (1 - (mean_stress / Sut))
-            else:
-                reversible_stress = alternating_stress
-
-            group.append(reversible_stress)
-
-            if ((Sy is not None) and (Sm < reversible_stress < Sy)) or reversible_stress < Se:
-                # infinite num of cycle - either the stress is less than
-                # the endurance limit or its low cycle fatigue
-                group.append(inf)
-
-            elif Se < reversible_stress < Sm:
-                # High Cycle Fatigue
-                # TODO: this calculation is the same every
-                #   iteration consider change to internal function and implement cash
-                a = Sm * (Sm / Se) ** (-3 / z)
-                b = (1 / z) * log10(Sm / Se)
-                N = (reversible_stress / a) ** (1 / b)
-                group.append(N)
-
-            else:
-                # print error but don't stop the loop
-                print(
-                    f"Reversible Stress = {reversible_stress} not in range,"
-                    f"LCF-range=(Sm_stress={Sm},Sy={Sy}), "
-                    f"HCF-range(Se={Se},Sm_stress={Sm})")
-
-        result = 0
-        for group in stress_groups:
-            # summing n/N
-            result += (group[0] / group[-1])
-            if verbose:
-                print(group)
+        if verbose:
+            for group, reversible_stress, N in zip(stress_groups, result['reversible_stress'],
+                                                   result['cycles_to_failure']):
+                logger.info("%s", [*group, float(reversible_stress), float(N)])
 
-        N_total = float(1 / result)
+        N_total = result['N_total']
 
         if verbose:
             if freq:
-                print(f"total time = {N_total:.2f} [s]")
+                logger.info("total time = %.2f [s]", N_total)
             else:
-                print(f"N_total = {N_total:.2f}")
+                logger.info("N_total = %.2f", N_total)
         return N_total
 
+    @staticmethod
+    def calc_cumulative_damage(counts, stress1, stress2, Sut, Se, Sy=None, z=-3,
+                               alt_mean=False):
+        """Calculates the cumulative damage (Miner's rule) of a load spectrum in one
+        vectorized pass, each bin is [count, maximum_stress, minimum_stress]
+        (or [count, alternating_stress, mean_stress] if alt_mean is True)
+
+        Note: bins in the low cycle fatigue range (when Sy is given) or below the endurance
+            limit have infinite life, bins outside the LCF and HCF ranges are marked in the
+            out_of_range mask, their damage is nan and they are ignored in the total life
+
+        :param np.ndarray counts: number of repetitions of each bin
+        :param np.ndarray stress1: maximum stresses (alternating stresses if alt_mean)
+        :param np.ndarray stress2: minimum stresses (mean stresses if alt_mean)
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa], if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+
+        :returns: N_total - total number of cycles (of the counts unit),
+            damage - n/N of each bin, cycles_to_failure - N of each bin,
+            reversible_stress of each bin and the out_of_range mask
+        :rtype: dict
+        """
+        counts = np.asarray(counts, dtype=float)
+        stress1 = np.asarray(stress1, dtype=float)
+        stress2 = np.asarray(stress2, dtype=float)
+
+        if alt_mean:
+            alternating_stress, mean_stress = stress1, stress2
+        else:
+            mean_stress = 0.5 * (stress1 + stress2)
+            alternating_stress = 0.5 * np.abs(stress1 - stress2)
+
+        curve = SNCurve.get(Sut, Se, Sy, z)
+        # Basquin's equation constants for high cycle fatigue (the same for all the bins)
+        Sm, a, b = curve.Sm, curve.a, curve.b
+        reversible_stress = curve.reversible_stress(alternating_stress, mean_stress)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            # the same ranges as calc_num_of_cycles (a stress equal to Se or Sm is out of range)
+            infinite_life = reversible_stress < Se
+            if Sy is not None:
+                infinite_life |= (Sm < reversible_stress) & (reversible_stress < Sy)
+            high_cycle = (Se < reversible_stress) & (reversible_stress < Sm)
+            out_of_range = ~(infinite_life | high_cycle)
+
+            cycles_to_failure = np.select([infinite_life, high_cycle],
+                                          [inf, (reversible_stress / a) ** (1 / b)], np.nan)
+            damage = counts / cycles_to_failure
+            N_total = float(1 / np.sum(damage, where=~out_of_range))
+
+        return {'N_total': N_total, 'damage': damage, 'cycles_to_failure': cycles_to_failure,
+                'reversible_stress': reversible_stress, 'out_of_range': out_of_range}
+
     def get_info(self):
         """print object attributes"""
         print_atributes(self)
@@ -0,0 +1,368 @@
+"""module containing the RainflowCounter class for streaming rainflow cycle counting
+(ASTM E1049-85) and the MinerAccumulator class for accumulating the damage of the
+counted cycles (Miner's rule)
+"""
+from collections import defaultdict
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis
+
+# the maximum number of bins a counter keeps (bounds the memory of long histories)
+MAX_BINS = 2 ** 17
+
+
+class RainflowCounter:
+    """Rainflow cycle counting (ASTM E1049-85 section 5.4.4) of a load history given
+    in chunks, only the unclosed reversals (the residue) and the binned cycles are kept
+    in memory so the history can be longer than the available memory
+
+    The cycles are binned by range and mean, the range of a bin is its upper edge
+    (conservative) and the mean is the bin center, without bins every distinct cycle
+    is kept, so the number of bins is limited (max_bins) to keep the memory bounded
+
+    .. code-block:: python
+
+        counter = RainflowCounter(range_bin_width=5)
+        for chunk in iter_chunks(np.load('history.npy', mmap_mode='r')):
+            counter.feed(chunk)
+        groups = counter.finish()  # [count, range, mean] rows
+    """
+
+    def __repr__(self):
+        return f"RainflowCounter(range_bin_width={self.range_bin_width}, " \
+               f"mean_bin_width={self.mean_bin_width}, companion={self.companion}, " \
+               f"bins={len(self._bins)}, max_bins={self.max_bins})"
+
+    def __init__(self, range_bin_width=None, mean_bin_width=None, companion=False,
+                 max_bins=MAX_BINS):
+        """
+        :param float or None range_bin_width: width of the range bins,
+            if None the cycles ranges are not binned (use it only for short histories)
+        :param float or None mean_bin_width: width of the mean bins
+            (default: the same as range_bin_width)
+        :param bool companion: if True a companion signal is fed with the load
+            (e.g. the shear stress with the normal stress), the cycles are counted on the load
+            and the range and mean of the companion between the cycle's reversals are kept
+            (binned with the same widths)
+        :param int max_bins: the maximum number of bins, a ValueError is raised when
+            the cycles don't fit in it (set or widen the bins)
+        """
+        self.range_bin_width = range_bin_width
+        self.mean_bin_width = range_bin_width if mean_bin_width is None else mean_bin_width
+        self.companion = companion
+        self.max_bins = max_bins
+        self.finished = False
+
+        self._bins = defaultdict(float)
+        self._stack = []
+        self._companion_stack = [] if companion else None
+        self._last = None  # the last point (possible reversal) of the previous chunk
+        self._last_companion = None
+        self._direction = 0  # the direction of the load toward the last point
+        # counts, ranges and means (and companion ranges and means) of the unbinned cycles
+        self._cycles = ([], [], [], [], []) if companion else ([], [], [])
+
+    def feed(self, chunk, companion=None):
+        """Count the cycles closed by the next chunk of the load history
+
+        :param np.ndarray chunk: 1D array of the next load values
+        :param np.ndarray companion: 1D array of the companion values at the same points
+            (only if the counter was created with companion=True)
+        """
+        if self.finished:
+            raise ValueError("at RainflowCounter: feed was called after finish")
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if self.companion:
+            if companion is None:
+                raise ValueError("at RainflowCounter: the companion values are missing")
+            companion = np.asarray(companion, dtype=float).ravel()
+            if companion.shape != chunk.shape:
+                raise ValueError(f"at RainflowCounter: {companion.size} companion values "
+                                 f"were given for {chunk.size} load values")
+            reversals, companion_reversals = self._reversals(chunk, companion)
+            self._push(reversals.tolist(), companion_reversals.tolist())
+        else:
+            self._push(self._reversals(chunk)[0].tolist())
+        self._bin_cycles()
+
+    def finish(self):
+        """Count the residue (the remaining reversals) as half cycles
+        and return the binned cycles
+
+        :returns: [count, range, mean] of every bin
+            ([count, range, mean, companion range, companion mean] with a companion)
+        :rtype: np.ndarray
+        """
+        if not self.finished:
+            if self._last is not None:
+                # the last point of the history is a reversal
+                self._push([float(self._last)], None if self._last_companion is None
+                           else [float(self._last_companion)])
+            stack = np.array(self._stack)
+            self._add_cycles(0.5, np.abs(np.diff(stack)), 0.5 * (stack[1:] + stack[:-1]))
+            if self.companion:
+                stack = np.array(self._companion_stack)
+                self._cycles[3].extend(np.abs(np.diff(stack)))
+                self._cycles[4].extend(0.5 * (stack[1:] + stack[:-1]))
+                self._companion_stack = []
+            self._bin_cycles()
+            self._stack = []
+            self.finished = True
+        return self.groups()
+
+    def groups(self):
+        """Returns the cycles counted so far (without the residue if finish wasn't called)
+
+        :returns: [count, range, mean] of every bin sorted by range and mean
+            ([count, range, mean, companion range, companion mean] with a companion)
+        :rtype: np.ndarray
+        """
+        columns = len(self._cycles)
+        if not self._bins:
+            return np.empty((0, columns))
+        keys = np.array(list(self._bins.keys()), dtype=float)
+        counts = np.fromiter(self._bins.values(), dtype=float, count=len(self._bins))
+        if self.range_bin_width is not None:
+            keys[:, 0::2] *= self.range_bin_width
+            keys[:, 1::2] *= self.mean_bin_width
+        order = np.lexsort(keys.T[::-1])
+        return np.column_stack((counts, keys))[order]
+
+    def _reversals(self, chunk, companion=None):
+        """Returns the reversals (peaks and valleys) confirmed by the chunk
+        and the companion values at the reversals (None without a companion)"""
+        if self._last is not None:
+            chunk = np.concatenate(([self._last], chunk))
+            if companion is not None:
+                companion = np.concatenate(([self._last_companion], companion))
+        if chunk.size == 0:
+            return chunk, companion
+
+        # remove plateaus (the companion value is the one at the plateau's start)
+        keep = np.concatenate(([True], np.diff(chunk) != 0))
+        chunk = chunk[keep]
+        if companion is not None:
+            companion = companion[keep]
+        if chunk.size < 2:
+            self._last = chunk[-1]
+            if companion is not None:
+                self._last_companion = companion[-1]
+                companion = companion[:0]
+            return chunk[:0], companion
+
+        direction = np.sign(np.diff(chunk))
+        is_turning = np.concatenate(([False], direction[:-1] != direction[1:], [False]))
+        # the previous last point is a reversal only if the load changed direction after it
+        is_turning[0] = direction[0] != self._direction
+
+        self._last, self._direction = chunk[-1], direction[-1]
+        if companion is None:
+            return chunk[is_turning], None
+        self._last_companion = companion[-1]
+        return chunk[is_turning], companion[is_turning]
+
+    def _push(self, reversals, companions=None):
+        """Add the reversals to the stack and count the cycles they close (ASTM E1049 5.4.4)"""
+        if companions is not None:
+            self._push_with_companion(reversals, companions)
+            return
+        stack = self._stack
+        counts, ranges, means = self._cycles
+        for reversal in reversals:
+            stack.append(reversal)
+            while len(stack) >= 3:
+                X = abs(stack[-1] - stack[-2])
+                Y = abs(stack[-2] - stack[-3])
+                if X < Y:
+                    break
+                ranges.append(Y)
+                means.append(0.5 * (stack[-2] + stack[-3]))
+                if len(stack) == 3:
+                    # Y contains the starting point, count it as half a cycle
+                    counts.append(0.5)
+                    del stack[0]
+                else:
+                    counts.append(1.0)
+                    del stack[-3:-1]
+
+    def _push_with_companion(self, reversals, companions):
+        """_push keeping the companion values of the reversals in a parallel stack"""
+        stack, companion_stack = self._stack, self._companion_stack
+        counts, ranges, means, companion_ranges, companion_means = self._cycles
+        for reversal, companion in zip(reversals, companions):
+            stack.append(reversal)
+            companion_stack.append(companion)
+            while len(stack) >= 3:
+                X = abs(stack[-1] - stack[-2])
+                Y = abs(stack[-2] - stack[-3])
+                if X < Y:
+                    break
+                ranges.append(Y)
+                means.append(0.5 * (stack[-2] + stack[-3]))
+                companion_ranges.append(abs(companion_stack[-2] - companion_stack[-3]))
+                companion_means.append(0.5 * (companion_stack[-2] + companion_stack[-3]))
+                if len(stack) == 3:
+                    counts.append(0.5)
+                    del stack[0]
+                    del companion_stack[0]
+                else:
+                    counts.append(1.0)
+                    del stack[-3:-1]
+                    del companion_stack[-3:-1]
+
+    def _add_cycles(self, count, ranges, means):
+        """Add cycles arrays to the unbinned cycles"""
+        counts, all_ranges, all_means = self._cycles[:3]
+        counts.extend(np.broadcast_to(count, np.shape(ranges)))
+        all_ranges.extend(ranges)
+        all_means.extend(means)
+
+    def _bin_cycles(self):
+        """Move the unbinned cycles to the bins"""
+        counts, *values = (np.array(cycles, dtype=float) for cycles in self._cycles)
+        if counts.size == 0:
+            return
+        for cycles in self._cycles:
+            cycles.clear()
+
+        keys = np.column_stack(values)
+        if self.range_bin_width is not None:
+            keys[:, 0::2] = np.ceil(keys[:, 0::2] / self.range_bin_width)
+            keys[:, 1::2] = np.floor(keys[:, 1::2] / self.mean_bin_width + 0.5)
+        keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        bin_counts = np.bincount(inverse.ravel(), weights=counts)
+        for key, count in zip(keys.tolist(), bin_counts.tolist()):
+            self._bins[tuple(key)] += count
+        if len(self._bins) > self.max_bins:
+            advice = "set range_bin_width" if self.range_bin_width is None \
+                else "use wider bins"
+            raise ValueError(f"at RainflowCounter: the cycles need more than {self.max_bins} "
+                             f"bins, {advice} to bound the memory")
+
+
+class MinerAccumulator:
+    """Accumulates the fatigue damage of cycles groups (Miner's rule),
+    the groups can be added in parts (e.g. from a RainflowCounter)
+    """
+
+    def __repr__(self):
+        return f"MinerAccumulator(damage={self.damage}, cycles={self.cycles})"
+
+    def __init__(self, Sut, Se, Sy=None, z=-3):
+        """
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa], if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        """
+        self.Sut = Sut
+        self.Se = Se
+        self.Sy = Sy
+        self.z = z
+        self.damage = 0.0
+        self.cycles = 0.0
+        self.out_of_range_cycles = 0.0
+
+    def add(self, counts, alternating_stress, mean_stress):
+        """Add the damage of cycles groups
+
+        :param np.ndarray counts: number of cycles of each group
+        :param np.ndarray alternating_stress: alternating stress of each group
+        :param np.ndarray mean_stress: mean stress of each group
+
+        :returns: The damage of each group
+        :rtype: np.ndarray
+        """
+        result = FatigueAnalysis.calc_cumulative_damage(counts, alternating_stress, mean_stress,
+                                                        self.Sut, self.Se, Sy=self.Sy, z=self.z,
+                                                        alt_mean=True)
+        counts = np.asarray(counts, dtype=float)
+        self.damage += float(np.sum(result['damage'], where=~result['out_of_range']))
+        self.cycles += float(np.sum(counts))
+        self.out_of_range_cycles += float(np.sum(counts, where=result['out_of_range']))
+        return result['damage']
+
+    def add_groups(self, groups):
+        """Add the damage of rainflow groups
+
+        :param np.ndarray groups: [count, range, mean] rows (e.g. RainflowCounter.groups())
+
+        :returns: The damage of each group
+        :rtype: np.ndarray
+        """
+        groups = np.asarray(groups, dtype=float).reshape(-1, 3)
+        return self.add(groups[:, 0], 0.5 * groups[:, 1], groups[:, 2])
+
+    @property
+    def life(self):
+        """Returns the number of repetitions of the accumulated load history until failure
+
+        :rtype: float
+        """
+        return 1 / self.damage if self.damage > 0 else inf
+
+
+def iter_chunks(data, chunk_size=2 ** 20):
+    """Iterate over a load history in chunks, the history can be an array
+    (including a memory-mapped array) or any iterable of values or arrays
+
+    :param data: the load history
+    :param int chunk_size: maximum number of values in a chunk
+
+    :returns: chunks generator
+    :rtype: Iterator[np.ndarray]
+    """
+    if isinstance(data, np.ndarray):
+        if data.ndim != 1:
+            data = data.reshape(-1)
+        for start in range(0, data.size, chunk_size):
+            yield np.asarray(data[start:start + chunk_size], dtype=float)
+        return
+
+    buffer = []
+    for item in data:
+        if np.ndim(item) == 0:
+            buffer.append(item)
+            if len(buffer) == chunk_size:
+                yield np.array(buffer, dtype=float)
+                buffer = []
+        else:
+            if buffer:
+                yield np.array(buffer, dtype=float)
+                buffer = []
+            yield from iter_chunks(np.asarray(item), chunk_size)
+    if buffer:
+        yield np.array(buffer, dtype=float)
+
+
+def rainflow_damage(history, Sut, Se, Sy=None, z=-3, range_bin_width=None,
+                    mean_bin_width=None, chunk_size=2 ** 20):
+    """Rainflow count a load (stress) history chunk by chunk and accumulate its damage
+
+    :param history: the stress history [MPa] (array, memory-mapped array or iterable)
+    :param float Sut: Ultimate tensile strength [MPa]
+    :param float Se: endurance limit [MPa]
+    :param float Sy: yield strength [MPa], if None only HCF is checked
+    :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+        where N=5e8
+    :param float range_bin_width: width of the range bins [MPa] (None - no binning,
+        only for short histories, see RainflowCounter)
+    :param float mean_bin_width: width of the mean bins [MPa] (default: range_bin_width)
+    :param int chunk_size: maximum number of values read at once
+
+    :returns: the [count, range, mean] groups, damage of each group, total damage
+        and life (number of repetitions of the history until failure)
+    :rtype: dict
+    """
+    counter = RainflowCounter(range_bin_width, mean_bin_width)
+    for chunk in iter_chunks(history, chunk_size):
+        counter.feed(chunk)
+    groups = counter.finish()
+
+    accumulator = MinerAccumulator(Sut, Se, Sy=Sy, z=z)
+    damage = accumulator.add_groups(groups)
+    return {'groups': groups, 'damage': damage, 'total_damage': accumulator.damage,
+            'life': accumulator.life}
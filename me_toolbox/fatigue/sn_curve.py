@@ -0,0 +1,175 @@
+"""module containing the SNCurve class, the S-N (stress-life) curve of a material
+with its Basquin coefficients calculated once"""
+from functools import lru_cache
+from math import inf, log10
+
+import numpy as np
+
+_SEQUENCES = (np.ndarray, list, tuple)
+
+
+class SNCurve:
+    """S-N curve of a material: low cycle fatigue (1 to 1e3 cycles, between Sut and Sm),
+    high cycle fatigue (Sm to Se) and infinite life (under Se)
+
+    Note: use SNCurve.get for scalar strengths, the curves are cached
+    by (Sut, Se, Sy, z) so the coefficients are calculated once for each material
+
+    .. code-block:: python
+
+        curve = SNCurve.get(Sut=900, Se=300, Sy=700)
+        N, Sf = curve.num_of_cycles(alt_stresses, mean_stresses)
+    """
+
+    def __repr__(self):
+        return f"SNCurve(Sut={self.Sut}, Se={self.Se}, Sy={self.Sy}, z={self.z})"
+
+    def __init__(self, ultimate_tensile_strength, endurance_limit, yield_strength=None, z=-3):
+        """Instantiate an S-N curve (the strengths can be arrays)
+
+        :param float ultimate_tensile_strength: Ultimate tensile strength (Sut)
+        :param float endurance_limit: Modified endurance limit (Se)
+        :param float yield_strength: Yield Strength, if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+            -5.69 for metal where N=5e8
+        """
+        self.Sut = ultimate_tensile_strength
+        self.Se = endurance_limit
+        self.Sy = yield_strength
+        self.z = z
+        self.Sm = self.calc_Sm(ultimate_tensile_strength)
+
+        # Basquin's equation (S = a*N^b) coefficients of the high and low cycle fatigue ranges
+        self.is_array = isinstance(self.Sut, np.ndarray) or isinstance(self.Se, np.ndarray)
+        log = np.log10 if self.is_array else log10
+        self.a = self.Sm * (self.Sm / self.Se) ** (-3 / z)
+        self.b = (1 / z) * log(self.Sm / self.Se)
+        self.lcf_a = self.Sut
+        self.lcf_b = (1 / z) * log(self.Sut / self.Sm)
+
+    @classmethod
+    def get(cls, ultimate_tensile_strength, endurance_limit, yield_strength=None, z=-3):
+        """Returns the (cached) S-N curve of scalar strengths
+
+        :rtype: SNCurve
+        """
+        if yield_strength is not None:
+            yield_strength = float(yield_strength)
+        return _cached_curve(float(ultimate_tensile_strength), float(endurance_limit),
+                             yield_strength, float(z))
+
+    @staticmethod
+    def calc_Sm(Sut):
+        """Calculate Sm_stress which is the stress at 1e3 cycles, the boundary
+        dividing Low cycle fatigue and high cycle fatigue
+
+        :param Sut: Ultimate tensile strength
+
+        :returns: Sm_stress stress
+        :rtype: float
+        """
+        def f(x):
+            """ f - fatigue strength fraction
+                function constructed from curve fitting to the f graph in Shigley's
+                the range of the fit is ( 70[kPsi] < ultimate_tensile_strength < 200[kPsi] ) """
+            return (-2.56710686e-16 * x ** 5 + 1.35729780e-12 * x ** 4 - 2.92474777e-09 * x ** 3 +
+                    3.28990748e-06 * x ** 2 - 2.04929617e-03 * x + 1.38405394e+00)
+
+        if isinstance(Sut, np.ndarray):
+            return np.select([Sut < 482.633, Sut > 1378.95], [0.9 * Sut, 0.75 * Sut],
+                             f(Sut) * Sut)
+
+        if Sut < 482.633:  # 482.633[Mpa] = 70[kPsi]
+            return 0.9 * Sut
+        elif Sut > 1378.95:
+            return 0.75 * Sut
+        return f(Sut) * Sut
+
+    def reversible_stress(self, alt_stress, mean_stress=0):
+        """Returns the fully reversed stress equivalent to an alternating and mean
+        stresses (Goodman correction for a positive mean stress)
+
+        :param float or np.ndarray alt_stress: Alternating stresses
+        :param float or np.ndarray mean_stress: Mean stresses
+
+        :rtype: np.ndarray
+        """
+        alt_stress = np.asarray(alt_stress, dtype=float)
+        mean_stress = np.asarray(mean_stress, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(mean_stress >= 0, alt_stress / (1 - (mean_stress / self.Sut)),
+                            alt_stress)
+
+    def num_of_cycles(self, alt_stress, mean_stress=0):
+        """Returns the number of cycles until failure and the fatigue strength
+
+        Note: the number of cycles is 0 where the mean stress is larger than Sut or the
+            reversible stress is out of the LCF and HCF ranges and inf under Se
+
+        :param float or np.ndarray alt_stress: Alternating stresses
+        :param float or np.ndarray mean_stress: Mean stresses
+
+        :returns: The Number of cycles and the fatigue stress at failure
+            (for scalar stresses the fatigue stress is None where there is no failure point,
+            for arrays it's nan)
+        :rtype: tuple[float, float] or tuple[np.ndarray, np.ndarray]
+        """
+        if not (self.is_array or isinstance(alt_stress, _SEQUENCES) or
+                isinstance(mean_stress, _SEQUENCES)):
+            return self._single_num_of_cycles(float(alt_stress), float(mean_stress))
+
+        mean_stress = np.asarray(mean_stress, dtype=float)
+        reversible_stress = self.reversible_stress(alt_stress, mean_stress)
+
+        # if mean_stress is larger or equal to Sut then the reversible_stress is either
+        # negative or undefined because of a division by zero error
+        valid = mean_stress < self.Sut
+        if self.Sy is None:
+            low_cycle = np.zeros(reversible_stress.shape, dtype=bool)
+        else:
+            low_cycle = valid & (self.Sm < reversible_stress) & (reversible_stress < self.Sy)
+        high_cycle = valid & (self.Se < reversible_stress) & (reversible_stress < self.Sm)
+        infinite_life = valid & (reversible_stress < self.Se)
+
+        if self.z != -3 and low_cycle.any():
+            raise ValueError(f"Number of cycles calculation for low cycle fatigue"
+                             f" is only possible for zeta=-3")
+
+        a = np.where(low_cycle, self.lcf_a, self.a)
+        b = np.where(low_cycle, self.lcf_b, self.b)
+        finite_life = low_cycle | high_cycle
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            N = np.select([infinite_life, finite_life],
+                          [inf, (reversible_stress / a) ** (1 / b)], 0)
+            Sf = np.where(finite_life, a * N ** b, np.nan)
+
+        return N, Sf
+
+    def _single_num_of_cycles(self, alt_stress, mean_stress):
+        """num_of_cycles of a single point (float arithmetic, no array overhead)"""
+        if mean_stress >= self.Sut:
+            return 0, None
+
+        if mean_stress >= 0:
+            reversible_stress = alt_stress / (1 - (mean_stress / self.Sut))
+        else:
+            reversible_stress = alt_stress
+
+        if self.Sy is not None and self.Sm < reversible_stress < self.Sy:
+            if self.z != -3:
+                raise ValueError(f"Number of cycles calculation for low cycle fatigue"
+                                 f" is only possible for zeta=-3")
+            a, b = self.lcf_a, self.lcf_b
+        elif self.Se < reversible_stress < self.Sm:
+            a, b = self.a, self.b
+        elif reversible_stress < self.Se:
+            return inf, None
+        else:
+            return 0, None
+        N = (reversible_stress / a) ** (1 / b)
+        return N, a * N ** b
+
+
+@lru_cache(maxsize=1024)
+def _cached_curve(Sut, Se, Sy, z):
+    return SNCurve(Sut, Se, Sy, z)
@@ -0,0 +1,62 @@
+from contextlib import redirect_stdout
+import io
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.fatigue import EnduranceLimit
+
+
+class TestEnduranceLimit(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 50
+        self.params = dict(
+            Sut=rng.uniform(300, 1600, n),
+            surface_finish=rng.choice(['ground', 'machined', 'cold-drawn', 'hot-rolled',
+                                       'as forged'], n),
+            rotating=rng.random(n) < 0.5,
+            max_normal_stress=rng.uniform(0, 2, n),
+            max_bending_stress=rng.uniform(0, 2, n),
+            stress_type=rng.choice(['bending', 'axial', 'torsion', 'shear', 'multiple'], n),
+            temp=rng.uniform(20, 600, n),
+            reliability=rng.uniform(50, 99.99, n),
+            diameter=rng.uniform(3, 200, n))
+
+    def test_scalar_values(self):
+        # M10 class 9.8 bolt (the bolt pattern example)
+        Se = EnduranceLimit(EnduranceLimit.unmodified_Se(900, 'steel'), 900, 'cold-drawn',
+                            False, 1, 0, 'multiple', 300, 90, diameter=np.sqrt(4 * 58 / np.pi))
+        self.assertAlmostEqual(Se.modified, 292.625, places=3)
+        self.assertIsInstance(Se.Kc, float)
+        self.assertEqual(EnduranceLimit.unmodified_Se(1500, 'steel'), 700)
+
+    def test_array_matches_scalar(self):
+        unmodified = EnduranceLimit.unmodified_Se(self.params['Sut'], 'steel')
+        modified = EnduranceLimit(unmodified, **self.params).modified
+        for i, value in enumerate(modified):
+            scalar = EnduranceLimit(unmodified[i], **{key: param[i].item()
+                                                      for key, param in self.params.items()})
+            self.assertAlmostEqual(value, scalar.modified)
+        np.testing.assert_allclose(EnduranceLimit.calc_modified(unmodified, **self.params),
+                                   modified)
+
+    def test_get_factors_array(self):
+        params = {key: param[:3] for key, param in self.params.items()}
+        limit = EnduranceLimit(EnduranceLimit.unmodified_Se(params['Sut'], 'steel'), **params)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            factors = limit.get_factors()
+        self.assertIn(f"Kc={np.array2string(limit.Kc, precision=3, floatmode='fixed')}",
+                      output.getvalue())
+        self.assertEqual(len(factors), 6)
+
+    def test_size_factor_out_of_range(self):
+        diameter = np.array([2, 10, 300])
+        Kb = EnduranceLimit.calc_kb(True, 0, 1, EnduranceLimit.calc_a95(diameter), diameter)
+        self.assertTrue(np.isnan(Kb[0]) and np.isnan(Kb[2]))
+        self.assertAlmostEqual(Kb[1], 1.24 * 10 ** -0.107)
+
+    def test_unknown_surface_finish(self):
+        with self.assertRaises(KeyError):
+            EnduranceLimit.calc_ka(np.array([600, 700]), np.array(['ground', 'polished']))
@@ -0,0 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.fatigue import FailureCriteria
+from me_toolbox.tools import symbolic, is_symbolic
+
+
+class TestFailureCriteriaArray(TestCase):
+
+    def setUp(self):
+        self.Sy, self.Sut, self.Se = 420, 520, 180
+        self.alt = np.array([50, 120, 80, 40, 90])
+        self.mean = np.array([100, 60, -30, 0, 250])
+
+    def test_matches_scalar_version(self):
+        for criterion in ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic'):
+            nf, nl = FailureCriteria.get_safety_factors_array(self.Sy, self.Sut, self.Se,
+                                                              self.alt, self.mean, criterion)
+            for i, (alt, mean) in enumerate(zip(self.alt, self.mean)):
+                expected_nf, expected_nl = FailureCriteria.get_safety_factors(
+                    self.Sy, self.Sut, self.Se, alt, mean, criterion)
+                self.assertAlmostEqual(nf[i], float(expected_nf))
+                self.assertAlmostEqual(nl[i], float(expected_nl))
+
+    def test_returns_float_arrays(self):
+        nf, nl = FailureCriteria.get_safety_factors_array(self.Sy, self.Sut, self.Se,
+                                                          self.alt, self.mean, 'gerber')
+        self.assertEqual(nf.dtype, np.float64)
+        self.assertEqual(nl.shape, self.alt.shape)
+
+    def test_second_quadrant(self):
+        nf, _ = FailureCriteria.get_safety_factors_array(self.Sy, self.Sut, self.Se,
+                                                         [80], [-30], 'soderberg')
+        self.assertAlmostEqual(nf[0], self.Se / 80)
+
+    def test_unknown_criterion(self):
+        self.assertRaises(Exception, FailureCriteria.get_safety_factors_array,
+                          self.Sy, self.Sut, self.Se, self.alt, self.mean, 'tresca')
+
+
+class TestFailureCriteriaBackend(TestCase):
+
+    def test_numeric_by_default(self):
+        nf = FailureCriteria.gerber(520, 180, 50, 100)
+        nl = FailureCriteria.asme_elliptic(420, 180, 50, 100)
+        self.assertIs(type(nf), float)
+        self.assertIs(type(nl), float)
+
+    def test_symbolic_mode(self):
+        from sympy import symbols
+        force = symbols('F', positive=True)
+        with symbolic():
+            nf = FailureCriteria.asme_elliptic(420, 180, 0.5 * force, force)
+        self.assertAlmostEqual(float(nf.subs(force, 100)),
+                               FailureCriteria.asme_elliptic(420, 180, 50, 100))
+
+    def test_symbolic_mode_per_thread(self):
+        # the symbolic mode of one thread doesn't leak to the others
+        with symbolic():
+            with ThreadPoolExecutor(1) as executor:
+                nf = executor.submit(FailureCriteria.gerber, 520, 180, 50, 100).result()
+            self.assertTrue(is_symbolic())
+        self.assertIs(type(nf), float)
+        self.assertFalse(is_symbolic())
@@ -0,0 +1,117 @@
+from unittest import TestCase
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis
+
+
+class TestCumulativeDamage(TestCase):
+
+    def setUp(self):
+        self.fatigue = FatigueAnalysis(modified_endurance_limit=90, stress_type='bending',
+                                       ductile=True, ultimate_tensile_strength=480,
+                                       yield_strength=410, Kf_bending=1,
+                                       alt_bending_stress=100, mean_bending_stress=50)
+        # [number_of_repetitions, maximum_stress, minimum_stress]
+        self.stress_groups = [[2, 150, -50], [3, 200, -50], [2, 350, -100], [1, 400, -300],
+                              [1, 200, -50]]
+
+    def test_miner_rule(self):
+        N_total = self.fatigue.miner_rule(self.stress_groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        self.assertAlmostEqual(N_total, 1853.698693894374, places=6)
+
+    def test_input_not_modified(self):
+        stress_groups = [list(group) for group in self.stress_groups]
+        self.fatigue.miner_rule(stress_groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        self.assertEqual(stress_groups, self.stress_groups)
+
+    def test_matches_single_group(self):
+        counts, s_max, s_min = np.array(self.stress_groups, dtype=float).T
+        result = FatigueAnalysis.calc_cumulative_damage(counts, s_max, s_min, 480, 90, 410)
+        for i, (count, maximum, minimum) in enumerate(self.stress_groups):
+            mean, alt = 0.5 * (maximum + minimum), 0.5 * abs(maximum - minimum)
+            N, _ = FatigueAnalysis.calc_num_of_cycles(mean, alt, 90, 480, None)
+            self.assertAlmostEqual(result['cycles_to_failure'][i], N, places=6)
+        self.assertAlmostEqual(result['N_total'], 1 / np.sum(result['damage']))
+
+    def test_out_of_range(self):
+        # without Sy a reversible stress above Sm is out of range
+        result = FatigueAnalysis.calc_cumulative_damage([1, 10, 5], [60, 480, 150],
+                                                        [0, 0, 0], 480, 90, alt_mean=True)
+        np.testing.assert_array_equal(result['out_of_range'], [False, True, False])
+        self.assertEqual(result['cycles_to_failure'][0], inf)
+        self.assertTrue(np.isnan(result['damage'][1]))
+        self.assertAlmostEqual(result['N_total'], 1 / result['damage'][2])
+
+    def test_range_boundaries(self):
+        # a reversible stress equal to Se or Sm is out of range, as in calc_num_of_cycles
+        Se, Sm = 90, FatigueAnalysis.calc_Sm(480)
+        alt_stress = [np.nextafter(Se, 0), Se, np.nextafter(Se, inf), np.nextafter(Sm, 0), Sm]
+        result = FatigueAnalysis.calc_cumulative_damage([1] * 5, alt_stress, [0] * 5, 480, Se,
+                                                        alt_mean=True)
+        np.testing.assert_array_equal(result['out_of_range'], [False, True, False, False, True])
+        for stress, out_of_range, cycles in zip(alt_stress, result['out_of_range'],
+                                                result['cycles_to_failure']):
+            N, _ = FatigueAnalysis.calc_num_of_cycles(0, stress, Se, 480, None)
+            if out_of_range:
+                self.assertEqual(N, 0)
+            elif cycles == inf:
+                self.assertEqual(N, inf)
+            else:
+                self.assertAlmostEqual(cycles / N, 1)
+
+
+class TestArrayFatigueAnalysis(TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.kwargs = dict(modified_endurance_limit=200, stress_type='multiple', ductile=True,
+                           ultimate_tensile_strength=900, yield_strength=700, Kf_bending=1.5,
+                           Kf_normal=1.3, Kf_torsion=1.2)
+        self.stresses = np.zeros(40, dtype=[('alt_bending_stress', float),
+                                            ('alt_torsion_stress', float),
+                                            ('mean_bending_stress', float),
+                                            ('mean_torsion_stress', float)])
+        for name in self.stresses.dtype.names:
+            self.stresses[name] = rng.uniform(0 if name.startswith('alt') else -150, 250, 40)
+        self.fatigue = FatigueAnalysis.from_stresses(self.stresses, **self.kwargs)
+
+    def test_matches_scalar(self):
+        nf, nl = self.fatigue.get_safety_factors('modified goodman')
+        N, Sf = self.fatigue.num_of_cycles()
+        for i, point in enumerate(self.stresses):
+            fatigue = FatigueAnalysis(**self.kwargs, **{name: float(point[name])
+                                                        for name in self.stresses.dtype.names})
+            for name in ('soderberg', 'gerber', 'ASME_elliptic', 'langer_static_yield'):
+                expected = getattr(fatigue, name)
+                if expected is None:
+                    self.assertTrue(np.isnan(getattr(self.fatigue, name)[i]))
+                else:
+                    self.assertAlmostEqual(getattr(self.fatigue, name)[i], expected)
+            expected_nf, expected_nl = fatigue.get_safety_factors('modified goodman')
+            self.assertAlmostEqual(nf[i], expected_nf)
+            self.assertAlmostEqual(nl[i], expected_nl)
+            expected_N, expected_Sf = fatigue.num_of_cycles()
+            self.assertAlmostEqual(N[i], expected_N)
+            if expected_Sf is None:
+                self.assertTrue(np.isnan(Sf[i]))
+            else:
+                self.assertAlmostEqual(Sf[i], expected_Sf)
+
+    def test_equivalent_stresses_are_lazy(self):
+        self.assertIs(self.fatigue.alt_eq_stress, self.fatigue.alt_eq_stress)
+        self.fatigue.alt_bending_stress = np.zeros(40)
+        self.fatigue.alt_torsion_stress = np.zeros(40)
+        np.testing.assert_array_equal(self.fatigue.alt_eq_stress, 0)
+
+    def test_unknown_stress(self):
+        with self.assertRaises(ValueError):
+            FatigueAnalysis.from_stresses({'alt_shear_stress': np.ones(3)}, **self.kwargs)
+
+    def test_num_of_cycles_zeta(self):
+        # z is passed to the calculation (it used to be always -3)
+        fatigue = FatigueAnalysis(**self.kwargs, alt_bending_stress=150)
+        N3, _ = fatigue.num_of_cycles(z=-3)
+        N5, _ = fatigue.num_of_cycles(z=-5)
+        self.assertGreater(N5, N3)
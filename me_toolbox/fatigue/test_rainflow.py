@@ -0,0 +1,107 @@
+from unittest import TestCase
+import os
+import tempfile
+
+import numpy as np
+
+from me_toolbox.fatigue import RainflowCounter, MinerAccumulator, FatigueAnalysis
+from me_toolbox.fatigue import iter_chunks, rainflow_damage
+
+
+class TestRainflowCounter(TestCase):
+    # ASTM E1049-85 figure 6 example
+    history = [-2, 1, -3, 5, -1, 3, -4, 4, -2]
+
+    def count(self, history, chunk_size, **kwargs):
+        counter = RainflowCounter(**kwargs)
+        for chunk in iter_chunks(history, chunk_size):
+            counter.feed(chunk)
+        return counter.finish()
+
+    def test_astm_example(self):
+        groups = self.count(self.history, 100)
+        counts_per_range = {}
+        for count, cycle_range, _ in groups:
+            counts_per_range[cycle_range] = counts_per_range.get(cycle_range, 0) + count
+        self.assertEqual(counts_per_range, {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5})
+
+    def test_chunk_size_independent(self):
+        rng = np.random.default_rng(0)
+        history = np.cumsum(rng.normal(size=5000))
+        expected = self.count(history, len(history), range_bin_width=0.5)
+        for chunk_size in (1, 7, 1000):
+            np.testing.assert_array_equal(
+                self.count(history, chunk_size, range_bin_width=0.5), expected)
+
+    def test_plateaus_and_iterators(self):
+        history = [0, 0, 2, 2, 2, -1, -1, 3, 3]
+        np.testing.assert_array_equal(self.count(iter(history), 2),
+                                      self.count([0, 2, -1, 3], 100))
+
+    def test_bins(self):
+        groups = self.count(self.history, 3, range_bin_width=5, mean_bin_width=2)
+        # the ranges are the bins upper edges and the means are the bins centers
+        self.assertTrue(set(groups[:, 1]) <= {5, 10})
+        self.assertTrue(np.all(groups[:, 2] % 2 == 0))
+        self.assertEqual(groups[:, 0].sum(), 4)
+
+    def test_companion(self):
+        # the companion's range and mean between the reversals of each cycle
+        companion = np.arange(len(self.history), dtype=float)
+        counter = RainflowCounter(companion=True)
+        for start in range(0, len(self.history), 2):
+            counter.feed(self.history[start:start + 2], companion[start:start + 2])
+        groups = counter.finish()
+        np.testing.assert_array_equal(groups[:, :3], self.count(self.history, 100))
+        # the full cycle -1 -> 3 (points 4 and 5) and the half cycle 5 -> -4 (points 3 and 6)
+        np.testing.assert_array_equal(groups[(groups[:, 0] == 1) & (groups[:, 1] == 4), 3:],
+                                      [[1, 4.5]])
+        np.testing.assert_array_equal(groups[groups[:, 1] == 9, 3:], [[3, 4.5]])
+        with self.assertRaises(ValueError):
+            counter = RainflowCounter(companion=True)
+            counter.feed(self.history)
+
+    def test_memmap(self):
+        rng = np.random.default_rng(1)
+        history = np.cumsum(rng.normal(size=3000))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.npy')
+            np.save(path, history)
+            memmap = np.load(path, mmap_mode='r')
+            np.testing.assert_array_equal(self.count(memmap, 256), self.count(history, 3000))
+            del memmap
+
+    def test_bounded_bins(self):
+        # the bins of a long (bounded) history don't grow with the number of cycles
+        rng = np.random.default_rng(2)
+        counter = RainflowCounter(range_bin_width=5)
+        for _ in range(50):
+            counter.feed(rng.uniform(-100, 100, 10000))
+            self.assertLessEqual(len(counter._bins), 41 * 41)
+        self.assertGreater(counter.finish()[:, 0].sum(), 1e5)
+        # without bins every distinct cycle is kept up to max_bins
+        counter = RainflowCounter(max_bins=1000)
+        with self.assertRaises(ValueError):
+            for _ in range(10):
+                counter.feed(rng.uniform(-100, 100, 1000))
+
+
+class TestMinerAccumulator(TestCase):
+    def test_matches_cumulative_damage(self):
+        history = [0, 300, -100, 250, -250, 350, 0]
+        result = rainflow_damage(history, Sut=480, Se=90, Sy=410)
+        groups = result['groups']
+        expected = FatigueAnalysis.calc_cumulative_damage(
+            groups[:, 0], 0.5 * groups[:, 1], groups[:, 2], 480, 90, 410, alt_mean=True)
+        self.assertAlmostEqual(result['life'], expected['N_total'])
+
+    def test_accumulates_parts(self):
+        groups = np.array([[1, 300, 50], [2, 250, 0], [5, 100, 0]])
+        whole = MinerAccumulator(480, 90)
+        whole.add_groups(groups)
+        parts = MinerAccumulator(480, 90)
+        parts.add_groups(groups[:1])
+        parts.add_groups(groups[1:])
+        self.assertAlmostEqual(whole.damage, parts.damage)
+        self.assertEqual(parts.cycles, 8)
+        self.assertEqual(MinerAccumulator(480, 90).life, float('inf'))
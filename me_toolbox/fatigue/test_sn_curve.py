@@ -0,0 +1,58 @@
+from unittest import TestCase
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import SNCurve, FatigueAnalysis
+
+
+class TestSNCurve(TestCase):
+
+    def setUp(self):
+        self.curve = SNCurve.get(900, 300, 850)
+        rng = np.random.default_rng(2)
+        self.alt = rng.uniform(0, 800, 200)
+        self.mean = rng.uniform(-300, 950, 200)
+
+    def test_cached(self):
+        self.assertIs(SNCurve.get(900.0, 300, 850), self.curve)
+        self.assertIsNot(SNCurve.get(900, 300, 850, z=-5), self.curve)
+
+    def test_matches_single_point(self):
+        N, Sf = self.curve.num_of_cycles(self.alt, self.mean)
+        for i, (alt, mean) in enumerate(zip(self.alt, self.mean)):
+            expected_N, expected_Sf = self.curve.num_of_cycles(float(alt), float(mean))
+            self.assertAlmostEqual(N[i], expected_N)
+            if expected_Sf is None:
+                self.assertTrue(np.isnan(Sf[i]))
+            else:
+                self.assertAlmostEqual(Sf[i], expected_Sf)
+        # all the ranges are covered
+        self.assertTrue(np.any(N == inf) and np.any(N == 0))
+        self.assertTrue(np.any((N > 0) & (N < 1e3)) and np.any((N > 1e3) & (N < inf)))
+
+    def test_curve_points(self):
+        # the curve passes through (1e3, Sm) and (1e6, Se) for z=-3
+        self.assertAlmostEqual(self.curve.a * 1e3 ** self.curve.b, self.curve.Sm)
+        self.assertAlmostEqual(self.curve.a * 1e6 ** self.curve.b, self.curve.Se)
+        self.assertEqual(self.curve.Sm, FatigueAnalysis.calc_Sm(900))
+
+    def test_low_cycle_zeta(self):
+        with self.assertRaises(ValueError):
+            SNCurve.get(900, 300, 850, z=-5).num_of_cycles(np.array([800.]))
+
+    def test_boundaries_match_cumulative_damage(self):
+        # a reversible stress equal to Se or Sm is out of range in both APIs
+        Se, Sm = self.curve.Se, self.curve.Sm
+        stress = np.array([np.nextafter(Se, 0), Se, np.nextafter(Se, inf),
+                           np.nextafter(Sm, 0), Sm])
+        curve = SNCurve.get(900, 300)
+        N, _ = curve.num_of_cycles(stress, np.zeros(5))
+        result = FatigueAnalysis.calc_cumulative_damage([1] * 5, stress, [0] * 5, 900, 300,
+                                                        alt_mean=True)
+        np.testing.assert_array_equal(N == 0, result['out_of_range'])
+        np.testing.assert_array_equal(N == 0, [False, True, False, False, True])
+        np.testing.assert_allclose(N[~result['out_of_range']],
+                                   result['cycles_to_failure'][~result['out_of_range']])
+        for i, value in enumerate(stress):
+            self.assertEqual(curve.num_of_cycles(float(value), 0.)[0], N[i])
@@ -1,4 +1,13 @@
-from me_toolbox.gears.gear import Gear
-from me_toolbox.gears.spur_gear import SpurGear
-from me_toolbox.gears.helical_gear import HelicalGear
-from me_toolbox.gears.transmission import Transmission, GearTypeError
+from me_toolbox._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={
+    'gear': ['Gear'],
+    'spur_gear': ['SpurGear'],
+    'helical_gear': ['HelicalGear'],
+    'transmission': ['Transmission', 'GearTypeError'],
+    'agma_factors': ['dynamic_factor', 'size_factor', 'rim_thickness_factor',
+                     'load_distribution_factor', 'bending_cycle_factor', 'contact_cycle_factor',
+                     'bending_cycle_curve', 'contact_cycle_curve', 'bending_cycles_to_failure',
+                     'contact_cycles_to_failure'],
+    'batch': ['optimize_batch', 'TransmissionSpec'],
+})
@@ -0,0 +1,349 @@
+"""Module containing the AGMA 2001-D04 gear factors as standalone kernels
+
+Every kernel accepts floats or numpy arrays (broadcast together) and returns the
+factor and a mask of the inputs inside the range of the factor's equation,
+with floats the factor is a float and the mask a bool, with arrays both are arrays
+and the factor is nan where it isn't defined.
+
+example: KH, valid = load_distribution_factor(widths, pitch_diameters, bearing_span=10,
+                                              pinion_offset=2, enclosure='precision enclosed')
+"""
+# I want the variables names to be the same as in AGMA pylint: disable=invalid-name
+from math import log, sqrt, pi, inf, isnan
+
+import numpy as np
+
+# K_Hma - mesh alignment factor coefficients (A, B, C) for each enclosure type
+ENCLOSURE_COEFFICIENTS = {'open gearing': (2.47e-1, 0.657e-3, -1.186e-7),
+                          'commercial enclosed': (1.27e-1, 0.622e-3, -1.69e-7),
+                          'precision enclosed': (0.675e-1, 0.504e-3, -1.44e-7),
+                          'extra precision enclosed': (0.380e-1, 0.402e-3, -1.27e-7)}
+
+# YN = a * N ** b curves (a, b)
+# 1e2 <= N < 2e6, by hardness [HBN] or surface treatment
+YN_LOW_CYCLE = {160: (2.3194, -0.0538),
+                250: (4.9404, -0.1045),
+                400: (9.4518, -0.148),
+                'Nitrided': (3.517, -0.0817),
+                'Case carb': (6.1514, -0.1192)}
+# N >= 2e6, by sensitive use
+YN_HIGH_CYCLE = {True: (1.6831, -0.0323),
+                 False: (1.3558, -0.0178)}
+
+# ZN = a * N ** b curves (a, b)
+# N < 3e6, by nitriding
+ZN_LOW_CYCLE = {True: (1.249, -0.0138),
+                False: (2.466, -0.056)}
+# N >= 3e6, by sensitive use
+ZN_HIGH_CYCLE = {True: (2.466, -0.056),
+                 False: (1.4488, -0.023)}
+
+
+def _is_array(*values):
+    return any(isinstance(value, np.ndarray) for value in values)
+
+
+def dynamic_factor(Qv, velocity):
+    """Kv - dynamic factor, Kv is dependent on the tangent velocity in [m/s]
+    and Qv (transmission accuracy grade number)
+
+    note: the equations here are from "Shigley's Mechanical Engineering Design"
+
+    :param float or np.ndarray Qv: transmission accuracy grade number (5<=Qv<=12)
+    :param float or np.ndarray velocity: tangent velocity [m/s]
+
+    :returns: Kv (nan where Qv is out of range), the maximum velocity of the equation
+        (inf for Qv=12) and a mask of the valid Qv where the velocity is below the maximum
+    :rtype: tuple
+    """
+    if not _is_array(Qv, velocity):
+        if not (6 <= Qv <= 11 or Qv == 5 or Qv == 12):
+            return np.nan, np.nan, False
+        if Qv == 12:
+            return 1, inf, True
+        B = 0.25 * (12 - Qv) ** (2 / 3)
+        A = 50 + 56 * (1 - B)
+        v_max = ((A + (Qv - 3)) ** 2) / 200
+        if Qv == 5:
+            K_v = (50 + sqrt(200 * velocity)) / 50
+        else:
+            K_v = ((A + sqrt(200 * velocity)) / A) ** B
+        return K_v, v_max, velocity <= v_max
+
+    Qv, velocity = np.broadcast_arrays(np.asarray(Qv, dtype=float),
+                                       np.asarray(velocity, dtype=float))
+    with np.errstate(invalid='ignore'):
+        B = 0.25 * (12 - Qv) ** (2 / 3)
+        A = 50 + 56 * (1 - B)
+        v_max = ((A + (Qv - 3)) ** 2) / 200
+        K_v = np.select([(Qv >= 6) & (Qv <= 11), Qv == 5, Qv == 12],
+                        [((A + np.sqrt(200 * velocity)) / A) ** B,
+                         (50 + np.sqrt(200 * velocity)) / 50, 1], np.nan)
+    v_max = np.where(Qv == 12, np.inf, np.where(np.isnan(K_v), np.nan, v_max))
+    return K_v, v_max, ~np.isnan(K_v) & (velocity <= v_max)
+
+
+def size_factor(modulus):
+    """Ks - size factor, Ks is dependent on the circular pitch (p=πm)
+
+    :param float or np.ndarray modulus: gear modulus [mm]
+
+    :returns: Ks and a mask of the positive moduli
+    :rtype: tuple
+    """
+    pitch = pi * modulus
+    if not _is_array(modulus):
+        return (1 / 1.189) * (pitch ** 0.097) if pitch > 8 else 1, pitch > 0
+    with np.errstate(invalid='ignore'):
+        return np.where(pitch > 8, (1 / 1.189) * pitch ** 0.097, 1), pitch > 0
+
+
+def rim_thickness_factor(teeth_num):
+    """KB - rim thickness factor, KB is dependent on the number of teeth
+
+    :param float or np.ndarray teeth_num: number of teeth
+
+    :returns: KB (nan for less than 3 teeth) and a mask of the valid teeth numbers
+    :rtype: tuple
+    """
+    mB = (0.5 * teeth_num - 1.25) / 2.25
+    if not _is_array(teeth_num):
+        if mB <= 0:
+            return np.nan, False
+        return 1.6 * log(2.242 / mB) if mB < 1.2 else 1, True
+    with np.errstate(divide='ignore', invalid='ignore'):
+        K_B = np.where(mB < 1.2, 1.6 * np.log(2.242 / mB), 1)
+    K_B = np.where(mB > 0, K_B, np.nan)
+    return K_B, mB > 0
+
+
+def load_distribution_factor(width, pitch_diameter, bearing_span, pinion_offset, enclosure,
+                             crowned=False, adjusted=False):
+    """KH - load distribution factor
+
+    :param float or np.ndarray width: gear width [mm] (width <= 1020)
+    :param float or np.ndarray pitch_diameter: pitch diameter [mm]
+    :param float or np.ndarray bearing_span: the distance between the bearings center lines
+    :param float or np.ndarray pinion_offset: the distance from the bearing span center
+        to the pinion mid-face
+    :param str enclosure: enclosure type ('open gearing', 'commercial enclosed',
+        'precision enclosed', 'extra precision enclosed')
+    :param bool or np.ndarray crowned: the teeth are crowned
+    :param bool or np.ndarray adjusted: the teeth are adjusted after assembly
+
+    :returns: KH (nan where the width is larger than 1020mm) and a mask of the valid widths
+    :rtype: tuple
+
+    :raise KeyError: unknown enclosure type
+    """
+    try:
+        A, B, C = ENCLOSURE_COEFFICIENTS[enclosure]
+    except KeyError:
+        raise KeyError(f"at KH factor: enclosure={enclosure} is invalid, the enclosure types "
+                       f"are: {list(ENCLOSURE_COEFFICIENTS)}") from None
+
+    if not _is_array(width, pitch_diameter, bearing_span, pinion_offset, crowned, adjusted):
+        # K_Hmc - lead correction factor, K_He - mesh alignment correction factor
+        K_Hmc = 0.8 if crowned else 1
+        K_He = 0.8 if adjusted else 1
+
+        # K_Hpf - pinion proportion factor (gear width to diameter ratio)
+        ratio = width / (10 * pitch_diameter)
+        if ratio < 0.05:
+            ratio = 0.05
+        if width <= 25:
+            K_Hpf = ratio - 0.025
+        elif width <= 432:
+            K_Hpf = ratio - 0.0375 + 0.000492 * width
+        elif width <= 1020:
+            K_Hpf = ratio - 0.1109 + 0.00815 * width - 0.000000353 * width ** 2
+        else:
+            return np.nan, False
+
+        # K_Hpm - pinion proportion modifier
+        K_Hpm = 1 if (pinion_offset / bearing_span) < 0.175 else 1.1
+
+        # K_Hma - mesh alignment factor
+        K_Hma = A + width * B + C * width ** 2
+        return 1.0 + K_Hmc * (K_Hpf * K_Hpm + K_Hma * K_He), True
+
+    width = np.asarray(width, dtype=float)
+    K_Hmc = np.where(crowned, 0.8, 1)
+    K_He = np.where(adjusted, 0.8, 1)
+    ratio = np.fmax(width / (10 * pitch_diameter), 0.05)
+    K_Hpf = np.select([width <= 25, width <= 432, width <= 1020],
+                      [ratio - 0.025, ratio - 0.0375 + 0.000492 * width,
+                       ratio - 0.1109 + 0.00815 * width - 0.000000353 * width ** 2], np.nan)
+    K_Hpm = np.where(np.divide(pinion_offset, bearing_span) < 0.175, 1, 1.1)
+    K_Hma = A + B * width + C * width ** 2
+    K_H = 1.0 + K_Hmc * (K_Hpf * K_Hpm + K_Hma * K_He)
+    return K_H, ~np.isnan(K_H)
+
+
+def _bending_curve(low_cycle, hardness, nitriding, case_carb, sensitive_use):
+    """the (a, b) coefficients of the YN curves, (nan, nan) where there is no curve"""
+    if not _is_array(low_cycle, hardness, nitriding, case_carb, sensitive_use):
+        if not low_cycle:
+            return YN_HIGH_CYCLE[bool(sensitive_use)]
+        if nitriding:
+            return YN_LOW_CYCLE['Nitrided']
+        if case_carb:
+            return YN_LOW_CYCLE['Case carb']
+        return YN_LOW_CYCLE.get(hardness, (np.nan, np.nan))
+
+    low_cycle, hardness, nitriding, case_carb, sensitive_use = np.broadcast_arrays(
+        low_cycle, hardness, nitriding, case_carb, sensitive_use)
+    a, b = np.full(low_cycle.shape, np.nan), np.full(low_cycle.shape, np.nan)
+    for curve in (160, 250, 400):
+        curve_mask = hardness == curve
+        a[curve_mask], b[curve_mask] = YN_LOW_CYCLE[curve]
+    for curve, curve_mask in (('Case carb', case_carb), ('Nitrided', nitriding)):
+        curve_mask = curve_mask.astype(bool)
+        a[curve_mask], b[curve_mask] = YN_LOW_CYCLE[curve]
+    for use in (True, False):
+        curve_mask = ~low_cycle & (sensitive_use.astype(bool) == use)
+        a[curve_mask], b[curve_mask] = YN_HIGH_CYCLE[use]
+    return a, b
+
+
+def _contact_curve(low_cycle, nitriding, sensitive_use):
+    """the (a, b) coefficients of the ZN curves"""
+    if not _is_array(low_cycle, nitriding, sensitive_use):
+        return ZN_LOW_CYCLE[bool(nitriding)] if low_cycle else ZN_HIGH_CYCLE[bool(sensitive_use)]
+
+    low_cycle, nitriding, sensitive_use = np.broadcast_arrays(low_cycle, nitriding, sensitive_use)
+    a = np.where(low_cycle, np.where(nitriding, ZN_LOW_CYCLE[True][0], ZN_LOW_CYCLE[False][0]),
+                 np.where(sensitive_use, ZN_HIGH_CYCLE[True][0], ZN_HIGH_CYCLE[False][0]))
+    b = np.where(low_cycle, np.where(nitriding, ZN_LOW_CYCLE[True][1], ZN_LOW_CYCLE[False][1]),
+                 np.where(sensitive_use, ZN_HIGH_CYCLE[True][1], ZN_HIGH_CYCLE[False][1]))
+    return a, b
+
+
+def bending_cycle_factor(N, hardness, nitriding=False, case_carb=False, sensitive_use=False):
+    """YN - bending strength stress cycle factor
+
+    :param float or np.ndarray N: number of cycles (N >= 1e2)
+    :param float or np.ndarray hardness: gear hardness [HBN] (160/250/400 for N < 2e6)
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray case_carb: the gear is case carburized
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: YN (nan where there is no curve) and a mask of the valid values
+    :rtype: tuple
+    """
+    if not _is_array(N, hardness, nitriding, case_carb, sensitive_use):
+        if N < 1e2:
+            return np.nan, False
+        a, b = _bending_curve(N < 2e6, hardness, nitriding, case_carb, sensitive_use)
+        return a * N ** b, not isnan(a)
+
+    N = np.asarray(N, dtype=float)
+    a, b = _bending_curve(N < 2e6, hardness, nitriding, case_carb, sensitive_use)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Y_N = np.where(N >= 1e2, a * N ** b, np.nan)
+    return Y_N, ~np.isnan(Y_N)
+
+
+def contact_cycle_factor(N, nitriding=False, sensitive_use=False):
+    """ZN - contact strength stress cycle factor
+
+    :param float or np.ndarray N: number of cycles (N > 0)
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: ZN and a mask of the valid values
+    :rtype: tuple
+    """
+    if not _is_array(N, nitriding, sensitive_use):
+        if not N > 0:
+            return np.nan, False
+        a, b = _contact_curve(N < 3e6, nitriding, sensitive_use)
+        return a * N ** b, True
+
+    N = np.asarray(N, dtype=float)
+    a, b = _contact_curve(N < 3e6, nitriding, sensitive_use)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Z_N = np.where(N > 0, a * N ** b, np.nan)
+    return Z_N, ~np.isnan(Z_N)
+
+
+def bending_cycle_curve(N, hardness, nitriding=False, case_carb=False, sensitive_use=False):
+    """The coefficients of the YN curve at N cycles (YN = a * N ** b)
+
+    :param float or np.ndarray N: number of cycles
+    :param float or np.ndarray hardness: gear hardness [HBN] (160/250/400 for N < 2e6)
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray case_carb: the gear is case carburized
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: a and b (nan where there is no curve)
+    :rtype: tuple
+    """
+    return _bending_curve(N < 2e6, hardness, nitriding, case_carb, sensitive_use)
+
+
+def contact_cycle_curve(N, nitriding=False, sensitive_use=False):
+    """The coefficients of the ZN curve at N cycles (ZN = a * N ** b)
+
+    :param float or np.ndarray N: number of cycles
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: a and b
+    :rtype: tuple
+    """
+    return _contact_curve(N < 3e6, nitriding, sensitive_use)
+
+
+def bending_cycles_to_failure(YN, hardness, nitriding=False, case_carb=False,
+                              sensitive_use=False):
+    """Number of cycles until bending failure, the inverse of bending_cycle_factor
+    where YN is the stress cycle factor the bending stress requires
+
+    Note: the high cycle curve is used if its number of cycles is in its range (N >= 2e6),
+        otherwise the low cycle curve
+
+    :param float or np.ndarray YN: required bending strength stress cycle factor
+    :param float or np.ndarray hardness: gear hardness [HBN] (160/250/400 for N < 2e6)
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray case_carb: the gear is case carburized
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: number of cycles (inf for YN=0, nan where there is no curve)
+        and a mask of the valid values
+    :rtype: tuple
+    """
+    high_cycles, _ = _cycles_to_failure(YN, _bending_curve(False, hardness, nitriding,
+                                                           case_carb, sensitive_use))
+    return _cycles_to_failure(YN, _bending_curve(high_cycles < 2e6, hardness, nitriding,
+                                                 case_carb, sensitive_use))
+
+
+def contact_cycles_to_failure(ZN, nitriding=False, sensitive_use=False):
+    """Number of cycles until contact failure, the inverse of contact_cycle_factor
+    where ZN is the stress cycle factor the contact stress requires
+
+    Note: the high cycle curve is used if its number of cycles is in its range (N >= 3e6),
+        otherwise the low cycle curve
+
+    :param float or np.ndarray ZN: required contact strength stress cycle factor
+    :param bool or np.ndarray nitriding: the gear is nitrided
+    :param bool or np.ndarray sensitive_use: the gear is for sensitive use
+
+    :returns: number of cycles (inf for ZN=0) and a mask of the valid values
+    :rtype: tuple
+    """
+    high_cycles, _ = _cycles_to_failure(ZN, _contact_curve(False, nitriding, sensitive_use))
+    return _cycles_to_failure(ZN, _contact_curve(high_cycles < 3e6, nitriding, sensitive_use))
+
+
+def _cycles_to_failure(factor, curve):
+    """N of the curve factor = a * N ** b"""
+    a, b = curve
+    if not _is_array(factor, a):
+        if not factor > 0 or isnan(a):
+            return (inf, True) if factor == 0 else (np.nan, False)
+        return (factor / a) ** (1 / b), True
+    with np.errstate(invalid='ignore', divide='ignore'):
+        N = np.where(factor >= 0, (factor / a) ** (1 / b), np.nan)
+    return N, ~np.isnan(N)
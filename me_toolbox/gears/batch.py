@@ -0,0 +1,85 @@
+"""Module containing tools to run many transmission optimizations in parallel"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from me_toolbox.gears.spur_gear import SpurGear
+from me_toolbox.gears.helical_gear import HelicalGear
+from me_toolbox.gears.transmission import Transmission
+
+GEAR_TYPES = {'spur': SpurGear, 'helical': HelicalGear}
+
+TransmissionSpec = namedtuple('TransmissionSpec', ['gear_type', 'gear_properties',
+                                                   'transmission_properties',
+                                                   'gear2_properties', 'optimize_feature'],
+                              defaults=[None, 'all'])
+TransmissionSpec.__doc__ = """Description of a single transmission optimization
+
+:param str gear_type: 'spur' or 'helical'
+:param dict gear_properties: keyword arguments of the pinion (gear1)
+:param dict transmission_properties: keyword arguments of the Transmission
+    (without the gears)
+:param dict or None gear2_properties: keyword arguments of gear2, if None gear2 is
+    created from the gear ratio
+:param str optimize_feature: property to optimize for ('width'/'volume'/'center'/'all')
+"""
+
+
+def optimize_batch(specs, max_workers=None, chunksize=1, return_exceptions=False):
+    """Run Transmission.optimize for every spec over a process pool
+
+    Each worker builds its own gears and transmission from the spec so the
+    optimizations don't share (or modify) any object and can run in parallel.
+
+    example: specs = [TransmissionSpec('spur', pinion_prop, {**gearbox_prop, 'power': P})
+                      for P in (10e3, 20e3, 50e3)]
+             results = optimize_batch(specs, max_workers=4)
+
+    :param list[TransmissionSpec] specs: transmissions to optimize
+    :param int or None max_workers: number of worker processes
+        (None - number of processors, 1 - run serially in this process)
+    :param int chunksize: number of specs sent to a worker at once
+    :param bool return_exceptions: if True a failed optimization returns its exception
+        instead of raising it
+
+    :returns: The optimize results (optimized result, list of viable options)
+        in the same order as the specs
+    :rtype: list[tuple]
+    """
+    specs = [spec if isinstance(spec, TransmissionSpec) else TransmissionSpec(*spec)
+             for spec in specs]
+    worker = partial(_optimize_spec, return_exceptions=return_exceptions)
+
+    if max_workers == 1 or len(specs) <= 1:
+        return list(map(worker, specs))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, specs, chunksize=chunksize))
+
+
+def build_transmission(spec):
+    """Instantiate the gears and transmission described by the spec
+
+    :param TransmissionSpec spec: transmission description
+
+    :returns: A new Transmission object
+    :rtype: Transmission
+    """
+    if spec.gear_type not in GEAR_TYPES:
+        raise ValueError(f"gear_type={spec.gear_type} but it can only be "
+                         f"{' / '.join(GEAR_TYPES)}")
+    gear_class = GEAR_TYPES[spec.gear_type]
+    gear1 = gear_class(**spec.gear_properties)
+    gear2 = gear_class(**spec.gear2_properties) if spec.gear2_properties is not None else None
+    return Transmission(gear1=gear1, gear2=gear2, **spec.transmission_properties)
+
+
+def _optimize_spec(spec, return_exceptions=False):
+    """Worker function, optimize a single spec (module level so it can be pickled)"""
+    try:
+        transmission = build_transmission(spec)
+        return transmission.optimize(transmission.gear1, spec.optimize_feature)
+    except Exception as error:  # pylint: disable=broad-except
+        if return_exceptions:
+            return error
+        raise
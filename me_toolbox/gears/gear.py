@@ -1,10 +1,16 @@
 """Module containing the Gear class"""
 
-from math import log, sqrt, pi, tan, radians
+import logging
+from math import pi, tan, radians, inf, isnan
 import os
-import numpy as np
 
-from me_toolbox.tools import table_interpolation
+from me_toolbox.gears.agma_factors import dynamic_factor, size_factor, rim_thickness_factor, \
+    load_distribution_factor, bending_cycle_factor, contact_cycle_factor
+from me_toolbox.tools import TableInterpolator, table_registry, dependent_property
+
+TABLES_DIR = os.path.join(os.path.dirname(__file__), 'tables')
+
+logger = logging.getLogger(__name__)
 
 
 class Gear:
@@ -55,7 +61,7 @@ class Gear:
         """
         return self.teeth_num * self.modulus  # pitch diameter [mm]
 
-    @property
+    @dependent_property('teeth_num')
     def KB(self):
         """Rim thickness factor, factor_KB is dependent on the number of teeth
 
@@ -63,14 +69,12 @@ class Gear:
         :returns: Gear's Rim thickness factor
         :rtype: float
         """
-        mB = (0.5 * self.teeth_num - 1.25) / 2.25
-        if mB < 1.2:
-            K_B = 1.6 * log(2.242 / mB)
-        else:
-            K_B = 1
+        K_B, valid = rim_thickness_factor(self.teeth_num)
+        if not valid:
+            raise ValueError(f"at KB factor: teeth_num={self.teeth_num} is too small")
         return K_B
 
-    @property
+    @dependent_property('Qv', 'modulus', 'teeth_num', 'rpm', 'helix_angle')
     def Kv(self):
         """Dynamic factor, Kv is dependent on the pitch diameter in [mm],
         the angular velocity in [rpm] and Qv (transmission accuracy grade number)
@@ -82,24 +86,15 @@ class Gear:
         :returns: Gear's Dynamic factor
         :rtype: float
         """
-        B = 0.25 * (12 - self.Qv) ** (2 / 3)
-        A = 50 + 56 * (1 - B)
-
-        # maximum velocity
-        self.maximum_velocity = ((A + (self.Qv - 3)) ** 2) / 200
-
-        if 6 <= self.Qv <= 11:
-            K_v = ((A + sqrt(200 * self.tangent_velocity)) / A) ** B
-        elif self.Qv == 5:
-            K_v = (50 + sqrt(200 * self.tangent_velocity)) / 50
-        elif self.Qv == 12:
-            K_v = 1
-            self.maximum_velocity = "Qv=12 no maximum velocity"
-        else:
+        K_v, maximum_velocity, _ = dynamic_factor(self.Qv, self.tangent_velocity)
+        if isnan(K_v):
             raise ValueError(f"at Kv factor: Qv={self.Qv} not in range (5<=Qv<=12)\n")
+
+        self.maximum_velocity = maximum_velocity if maximum_velocity != inf else \
+            "Qv=12 no maximum velocity"
         return K_v
 
-    @property
+    @dependent_property('modulus')
     def Ks(self):
         """Size factor, factor_Ks is dependent on the circular
         pitch (p=πm) which in turn depends on the modulus
@@ -107,13 +102,10 @@ class Gear:
         :returns: Gear's size factor
         :rtype: float
         """
-        if self.pitch > 8:
-            K_s = (1 / 1.189) * (self.pitch ** 0.097)
-        else:
-            K_s = 1
-        return K_s
+        return size_factor(self.modulus)[0]
 
-    @property
+    @dependent_property('width', 'modulus', 'teeth_num', 'helix_angle', 'crowned', 'adjusted',
+                        'bearing_span', 'pinion_offset', 'enclosure')
     def KH(self):
         """Load distribution factor, KH is dependent on: the shape of teeth (crowned),
         if teeth are adjusted after assembly (adjusted), the gear width in [mm],
@@ -125,54 +117,14 @@ class Gear:
         :returns: Gear's load distribution factor
         :rtype: float
         """
-        # K_Hmc - lead correction factor
-        if self.crowned:
-            K_Hmc = 0.8
-        else:
-            K_Hmc = 1
-
-        # K_He - mesh alignment correction factor
-        if self.adjusted:
-            K_He = 0.8
-        else:
-            K_He = 1
-
-        # K_Hpf - mesh alignment correction factor
-        # gear width to diameter ratio
-        ratio = self.width / (10 * self.pitch_diameter)
-        if ratio < 0.05:
-            ratio = 0.05
-
-        # print("the width is", b)
-        if self.width <= 25:
-            K_Hpf = ratio - 0.025
-        elif 25 < self.width <= 432:
-            K_Hpf = ratio - 0.0375 + 0.000492 * self.width
-        elif 432 < self.width <= 1020:
-            K_Hpf = ratio - 0.1109 + 0.00815 * self.width - 0.000000353 * self.width ** 2
-        else:
+        K_H, valid = load_distribution_factor(self.width, self.pitch_diameter,
+                                              self.bearing_span, self.pinion_offset,
+                                              self.enclosure, self.crowned, self.adjusted)
+        if not valid:
             raise ValueError(f"at KH factor: width={self.width} not in range, (width < 1020)\n")
-
-        # K_Hpm - pinion proportion modifier
-        s = self.bearing_span
-        s1 = self.pinion_offset
-        if (s1 / s) < 0.175:
-            K_Hpm = 1
-        else:
-            K_Hpm = 1.1
-
-        # K_Hma - mash alignment factor
-        enclosure_type = {'open gearing': [2.47e-1, 0.657e-3, -1.186e-7],
-                          'commercial enclosed': [1.27e-1, 0.622e-3, -1.69e-7],
-                          'precision enclosed': [0.675e-1, 0.504e-3, -1.44e-7],
-                          'extra precision enclosed': [0.380e-1, 0.402e-3, -1.27e-7]}
-        K_Hma = (enclosure_type[self.enclosure][0] + self.width * enclosure_type[self.enclosure][1]
-                 + enclosure_type[self.enclosure][2] * self.width ** 2)
-
-        K_H = 1.0 + K_Hmc * (K_Hpf * K_Hpm + K_Hma * K_He)
         return K_H
 
-    @property
+    @dependent_property('grade', 'hardness')
     def St(self):
         """Bending safety factor, St is dependent on the gear's
          hardness in [HBN] and the material grade
@@ -190,7 +142,7 @@ class Gear:
 
         return S_t
 
-    @property
+    @dependent_property('grade', 'hardness')
     def Sc(self):
         """Contact safety factor, Sc is dependent on the gear
         hardness in [HBN] and on the material grade
@@ -215,7 +167,8 @@ class Gear:
         """
         return 1
 
-    @property
+    @dependent_property('contact_ratio', 'number_of_cycles', 'work_hours', 'rpm', 'hardness',
+                        'nitriding', 'case_carb', 'sensitive_use')
     def YN(self):
         """Bending strength stress cycle factor
 
@@ -228,38 +181,19 @@ class Gear:
         if N is None:
             return None
 
-        # 1e2 <= N < 2e6
-        low_cycle = {160: 2.3194 * N ** (-0.0538),
-                     'Nitrided': 3.517 * N ** (-0.0817),
-                     250: 4.9404 * N ** (-0.1045),
-                     'Case carb': 6.1514 * N ** (-0.1192),
-                     400: 9.4518 * N ** (-0.148)}
-
-        # N>=2e6
-        high_cycle = {True: 1.6831 * N ** (-0.0323),
-                      False: 1.3558 * N ** (-0.0178)}
-
-        try:
-            if 1e2 <= N < 2e6 and self.nitriding:
-                curve = 'Nitrided'
-            elif 1e2 <= N < 2e6 and self.case_carb:
-                curve = 'Case carb'
-            else:
-                curve = self.hardness
+        if N < 1e2:
+            raise ValueError(f" at YN: the number of cycles is {N} "
+                             f"but the minimum number is {1e2} ")
 
-            if 1e2 <= N < 2e6:
-                Y_N = low_cycle[curve]
-            elif N >= 2e6:
-                Y_N = high_cycle[self.sensitive_use]
-            else:
-                raise ValueError(f" at YN: the number of cycles is {N} "
-                                 f"but the minimum number is {1e2} ")
-            return Y_N
-        except KeyError as bad_key:
-            print(f"at YN: not valid hardness {bad_key}")
+        Y_N, valid = bending_cycle_factor(N, self.hardness, self.nitriding, self.case_carb,
+                                          self.sensitive_use)
+        if not valid:
+            logger.error("at YN: not valid hardness %s", self.hardness)
             return "Error"
+        return Y_N
 
-    @property
+    @dependent_property('contact_ratio', 'number_of_cycles', 'work_hours', 'rpm', 'nitriding',
+                        'sensitive_use')
     def ZN(self):
         """Calculating contact strength stress cycle factor
 
@@ -271,14 +205,7 @@ class Gear:
         if N is None:
             return None
 
-        # N < 3e6
-        low_cycle = {True: 1.249 * N ** (-0.0138),  # nitrided
-                     False: 2.466 * N ** (-0.056)}
-        # N >= 3e6
-        high_cycle = {True: 2.466 * N ** (-0.056),  # for sensitive use
-                      False: 1.4488 * N ** (-0.023)}
-
-        return low_cycle[self.nitriding] if N < 3e6 else high_cycle[self.sensitive_use]
+        return contact_cycle_factor(N, self.nitriding, self.sensitive_use)[0]
 
     @staticmethod
     def Y_j(gear1, gear2):
@@ -287,25 +214,37 @@ class Gear:
         :returns: Gear's geometry factor
         :rtype: float
         """
-        N1 = gear1.teeth_num
-        N2 = gear2.teeth_num
-        pressure_angle = gear1.pressure_angle
+        gear1.Yj, gear2.Yj = Gear.calc_Y_j(gear1.teeth_num, gear2.teeth_num,
+                                           gear1.pressure_angle)
 
-        # load table according to pressure angle
+    @staticmethod
+    def calc_Y_j(N1, N2, pressure_angle, return_mask=False):
+        """Calculate the geometry factors of spur gear pairs,
+        N1 and N2 can be arrays of teeth numbers (e.g. a teeth number sweep)
+
+        :param int or np.ndarray N1: first gear's teeth number
+        :param int or np.ndarray N2: second gear's teeth number
+        :param float pressure_angle: pressure angle (20 or 25)
+        :param bool return_mask: if True teeth numbers out of the table range
+            give nan instead of raising NotInRangeError, and a mask of the valid pairs is returned
+
+        :returns: first and second gears geometry factors (and the in range mask)
+        :rtype: tuple
+        """
+        # load table according to pressure angle (parsed once and cached)
         if pressure_angle == 20:
-            path = os.path.dirname(__file__) + "\\tables\\20deg - spur gear geometry factors.csv"
+            path = os.path.join(TABLES_DIR, "20deg - spur gear geometry factors.csv")
         elif pressure_angle == 25:
-            path = os.path.dirname(__file__) + "\\tables\\25deg - spur gear geometry factors.csv"
+            path = os.path.join(TABLES_DIR, "25deg - spur gear geometry factors.csv")
         else:
             raise ValueError("at spur gear Yj Factor: pressure angle is wrong")
 
-        data = np.genfromtxt(path, delimiter=',')
-        # try:
-        gear1.Yj = table_interpolation(N1, N2, data)
-        gear2.Yj = table_interpolation(N2, N1, data)
-        # except NotInRangeError as not_in_range:
-        # print(f"Error: Teeth number of one of the gears ({not_in_range.num})
-        # not in range {not_in_range.range_}")
+        interpolator = table_registry.get(path, TableInterpolator)
+        if return_mask:
+            Yj1, mask1 = interpolator(N1, N2, return_mask=True)
+            Yj2, mask2 = interpolator(N2, N1, return_mask=True)
+            return Yj1, Yj2, mask1 & mask2
+        return interpolator(N1, N2), interpolator(N2, N1)
 
     @property
     def tangent_velocity(self):
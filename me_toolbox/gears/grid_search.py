@@ -0,0 +1,168 @@
+"""Module containing a vectorized grid search optimizer for spur gear transmissions"""
+# I want the variables names to be the same as in AGMA pylint: disable=invalid-name
+import numpy as np
+
+from me_toolbox.gears.agma_factors import dynamic_factor, size_factor, rim_thickness_factor, \
+    load_distribution_factor, bending_cycle_factor, contact_cycle_factor
+from me_toolbox.gears.gear import Gear
+from me_toolbox.tools.pareto import pareto_front
+
+STANDARD_MODULUS = (0.3, 0.4, 0.5, 0.8, 1, 1.25, 1.5, 2, 2.5, 3, 4, 5, 6, 8, 10, 12, 16, 20, 25)
+
+# minimum number of teeth to avoid interference for each pressure angle
+MINIMUM_TEETH = {20: 18, 25: 13}
+
+# largest number of teeth in the geometry factor table of each pressure angle
+MAXIMUM_TEETH = {20: 1000, 25: 300}
+
+
+def grid_search(transmission, modulus_list=None, teeth_range=None, pressure_angles=None,
+                max_iterations=100, tolerance=1e-6):
+    """Evaluate every (modulus, teeth number, pressure angle) candidate of a spur gear
+    transmission at once and return the Pareto set over width, volume and center distance
+
+    For each candidate the KH/width fixed point is solved for all the candidates together,
+    the width is the largest minimum width for bending and contact of both gears.
+    A candidate is feasible if the fixed point converged (b <= 1020mm), both teeth numbers
+    are in the geometry factor table, 3πm <= b <= 5πm and all the AGMA factors are in
+    their equations range (see gears.agma_factors), e.g. the tangent velocity does not
+    exceed the maximum velocity of the Kv equation.
+
+    Note: the transmission and its gears are only read, never modified
+
+    :param Transmission transmission: Transmission object (of spur gears)
+    :param list modulus_list: moduli to check in [mm] (default: standard moduli list)
+    :param range teeth_range: pinion teeth numbers to check (default: from the minimal teeth
+        number to avoid interference to the largest number in the geometry factor table)
+    :param list pressure_angles: pressure angles to check (20 / 25),
+        default is the pinion's pressure angle
+    :param int max_iterations: maximum number of fixed point iterations
+    :param float tolerance: KH convergence tolerance
+
+    :returns: The Pareto set sorted by width and the arrays of all the feasible candidates
+        (m, N1, N2, pressure_angle, b, V, center, alpha)
+    :rtype: tuple[list[dict], dict[str, np.ndarray]]
+    """
+    gear1, gear2 = transmission.gear1, transmission.gear2
+    modulus_list = STANDARD_MODULUS if modulus_list is None else modulus_list
+    pressure_angles = (gear1.pressure_angle,) if pressure_angles is None else pressure_angles
+    gear_ratio = transmission.gear_ratio if transmission.gear_ratio != 0 else \
+        gear2.teeth_num / gear1.teeth_num
+
+    # building the candidates grid
+    m, N1, phi = [], [], []
+    for pressure_angle in pressure_angles:
+        if pressure_angle not in MINIMUM_TEETH:
+            raise ValueError(f"pressure_angle={pressure_angle} "
+                             f"degrees but it can only be 20/25 degrees")
+        if teeth_range is None:
+            teeth = np.arange(MINIMUM_TEETH[pressure_angle], MAXIMUM_TEETH[pressure_angle] + 1)
+        else:
+            teeth = np.asarray(teeth_range)
+        grid_m, grid_N = np.meshgrid(np.asarray(modulus_list, dtype=float), teeth,
+                                     indexing='ij')
+        m.append(grid_m.ravel())
+        N1.append(grid_N.ravel())
+        phi.append(np.full(grid_m.size, pressure_angle, dtype=float))
+    m, N1, phi = np.concatenate(m), np.concatenate(N1).astype(float), np.concatenate(phi)
+    N2 = np.round(N1 * gear_ratio)
+
+    # geometry
+    d1, d2 = N1 * m, N2 * m
+    velocity = np.pi * d1 * gear1.rpm / 60e3
+    Wt = (60e3 / np.pi) * (transmission.power / (d1 * gear1.rpm))
+    mG = N2 / N1
+    ZI = 0.5 * np.cos(np.radians(phi)) * np.sin(np.radians(phi)) * (mG / (mG + 1))
+
+    # geometry factors
+    Yj1, Yj2 = np.full(m.shape, np.nan), np.full(m.shape, np.nan)
+    valid = np.zeros(m.shape, dtype=bool)
+    for pressure_angle in pressure_angles:
+        angle_mask = phi == pressure_angle
+        Yj1[angle_mask], Yj2[angle_mask], valid[angle_mask] = Gear.calc_Y_j(
+            N1[angle_mask], N2[angle_mask], pressure_angle, return_mask=True)
+
+    contact_ratio = _contact_ratio(d1, d2, m, phi)
+    Ko, ZE, Ytheta, Yz = transmission.Ko, transmission.ZE, transmission.Ytheta, transmission.Yz
+
+    # width independent terms of the minimum width for bending and contact of each gear
+    gears = []
+    for gear, N, d, Yj in ((gear1, N1, d1, Yj1), (gear2, N2, d2, Yj2)):
+        cycles = _number_of_cycles(gear, contact_ratio)
+        YN, YN_valid = bending_cycle_factor(cycles, gear.hardness, gear.nitriding,
+                                            gear.case_carb, gear.sensitive_use)
+        ZN, ZN_valid = contact_cycle_factor(cycles, gear.nitriding, gear.sensitive_use)
+        Kv, _, Kv_valid = dynamic_factor(gear.Qv, velocity)
+        Ks, _ = size_factor(m)
+        KB, KB_valid = rim_thickness_factor(N)
+        allowed_bending = (gear.St * YN) / (Ytheta * Yz * transmission.SF)
+        allowed_contact = (gear.Sc * ZN * gear.Zw) / (Ytheta * Yz * transmission.SH)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bending_term = (Wt * N * Ko * Kv * Ks * KB) / (Yj * allowed_bending * d)
+            contact_term = (Wt * ZE ** 2 * Ko * Kv * Ks * gear.ZR) / (d * ZI * allowed_contact ** 2)
+        valid &= YN_valid & ZN_valid & Kv_valid & KB_valid
+        gears.append((gear, d, bending_term, contact_term))
+
+    # solving the KH/width fixed point for all candidates at once
+    # (because the width range is (3πm,5πm) the initial guess is 4πm)
+    width = 4 * np.pi * m
+    KH_old = np.full(m.shape, np.inf)
+    converged = ~valid
+    for _ in range(max_iterations):
+        bending_width, contact_width, KH_new = _minimum_widths(gears, width)
+        new_width = np.fmax(bending_width, contact_width)
+        diverged = ~converged & ~(new_width <= 1020)
+        valid &= ~diverged
+        converged |= diverged | (np.abs(KH_new - KH_old) < tolerance)
+        width = np.where(converged, width, new_width)
+        KH_old = KH_new
+        if converged.all():
+            break
+    else:
+        valid &= converged
+
+    bending_width, contact_width, _ = _minimum_widths(gears, width)
+    feasible = valid & (width >= 3 * np.pi * m) & (width <= 5 * np.pi * m)
+
+    candidates = {'m': m[feasible], 'N1': N1[feasible].astype(int),
+                  'N2': N2[feasible].astype(int), 'pressure_angle': phi[feasible],
+                  'b': width[feasible],
+                  'V': 0.25 * np.pi * d1[feasible] ** 2 * width[feasible],
+                  'center': 0.5 * (d1[feasible] + d2[feasible]),
+                  'alpha': contact_width[feasible] / bending_width[feasible]}
+
+    front = pareto_front(np.column_stack((candidates['b'], candidates['V'],
+                                          candidates['center'])))
+    front = front[np.argsort(candidates['b'][front], kind='stable')]
+    pareto = [{key: value[index].item() for key, value in candidates.items()} for index in front]
+    return pareto, candidates
+
+
+def _minimum_widths(gears, width):
+    """minimum width for bending and contact (the largest of both gears) and the KH factor"""
+    bending_width, contact_width = 0, 0
+    KH_max = 0
+    for gear, d, bending_term, contact_term in gears:
+        KH, _ = load_distribution_factor(width, d, gear.bearing_span, gear.pinion_offset,
+                                         gear.enclosure, gear.crowned, gear.adjusted)
+        bending_width = np.fmax(bending_width, bending_term * KH)
+        contact_width = np.fmax(contact_width, contact_term * KH)
+        KH_max = np.fmax(KH_max, KH)
+    return bending_width, contact_width, KH_max
+
+
+def _contact_ratio(d1, d2, m, phi):
+    """contact ratio of the gear pairs"""
+    rp, rG = 0.5 * d1, 0.5 * d2
+    phi = np.radians(phi)
+    contact_length = (np.sqrt((rG + m) ** 2 - (rG * np.cos(phi)) ** 2) +
+                      np.sqrt((rp + m) ** 2 - (rp * np.cos(phi)) ** 2) - (rp + rG) * np.sin(phi))
+    return contact_length / (np.pi * m * np.cos(phi))
+
+
+def _number_of_cycles(gear, contact_ratio):
+    """number of cycles of the gear (as in Gear.cycles_or_hours)"""
+    cycles_number = gear.__dict__.get("number_of_cycles", 0)
+    if cycles_number != 0:
+        return np.full(contact_ratio.shape, float(cycles_number))
+    return 60 * gear.work_hours * gear.rpm * contact_ratio
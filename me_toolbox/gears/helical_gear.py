@@ -1,10 +1,14 @@
 """Module containing the HelicalGear class"""
 # I want the variables names to be the same as in AGMA pylint: disable=invalid-name
+import logging
 from math import sin, cos, radians, pi, tan, atan, sqrt, degrees
 import os
-import numpy as np
 from me_toolbox.gears import SpurGear  # for inheritance
-from me_toolbox.tools import table_interpolation
+from me_toolbox.gears.gear import TABLES_DIR
+from me_toolbox.tools import TableInterpolator, table_registry
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class HelicalGear(SpurGear):
@@ -97,29 +101,44 @@ class HelicalGear(SpurGear):
         :return: Yj - Geometric factor
         :rtype: float
         """
+        gear1.Yj, gear2.Yj = HelicalGear.calc_Y_j(gear1.teeth_num, gear2.teeth_num,
+                                                  gear1.helix_angle)
 
-        Np = gear1.teeth_num
-        Ng = gear2.teeth_num
-        helix_angle = gear1.helix_angle
+    @staticmethod
+    def calc_Y_j(Np, Ng, helix_angle, return_mask=False):
+        """Calculate the geometry factors of helical gear pairs,
+        Np, Ng and helix_angle can be arrays (e.g. a teeth number sweep)
+
+        Note: both gears of a helical pair have the same geometry factor, it is
+        returned twice to match :meth:`Gear.calc_Y_j`
 
+        :param int or np.ndarray Np: pinion's teeth number
+        :param int or np.ndarray Ng: gear's teeth number
+        :param float or np.ndarray helix_angle: helix angle in [deg]
+        :param bool return_mask: if True teeth numbers out of the table range
+            give nan instead of raising NotInRangeError, and a mask of the valid pairs is returned
+
+        :returns: pinion and gear geometry factors (and the in range mask)
+        :rtype: tuple
+        """
         # files path
-        j75_path = os.path.dirname(__file__) + "\\tables\\J75 - helix gear geometry factors.csv"
-        jPrime_path = os.path.dirname(
-            __file__) + "\\tables\\JPrime - helix gear geometry factors.csv"
+        j75_path = os.path.join(TABLES_DIR, "J75 - helix gear geometry factors.csv")
+        jPrime_path = os.path.join(TABLES_DIR, "JPrime - helix gear geometry factors.csv")
 
-        # load data
-        j75_data = np.genfromtxt(j75_path, delimiter=',')
-        jPrime_data = np.genfromtxt(jPrime_path, delimiter=',')
+        # load interpolators (tables are parsed once and cached)
+        j75_table = table_registry.get(j75_path, TableInterpolator)
+        jPrime_table = table_registry.get(jPrime_path, TableInterpolator)
 
         # data interpolation
-        j75 = table_interpolation(Np, helix_angle, j75_data)
-        jPrime = table_interpolation(Ng, helix_angle, jPrime_data)
+        if return_mask:
+            j75, j75_mask = j75_table(Np, helix_angle, return_mask=True)
+            jPrime, jPrime_mask = jPrime_table(Ng, helix_angle, return_mask=True)
+            Y_j = j75 * jPrime
+            return Y_j, Y_j, j75_mask & jPrime_mask
 
         # calculate geometric factor Yj
-        Y_j = j75 * jPrime
-
-        gear1.Yj = Y_j
-        gear2.Yj = Y_j
+        Y_j = j75_table(Np, helix_angle) * jPrime_table(Ng, helix_angle)
+        return Y_j, Y_j
 
     @staticmethod
     def ZI(gear1, gear2):
@@ -178,13 +197,15 @@ class HelicalGear(SpurGear):
         Wx = Wt * tan(radians(gear.helix_angle))
         return Wt, Wr, Wx
 
+    @verbose_option
     def optimization(self, transmission, optimize_feature='all', verbose=False):
         """Perform gear optimization
 
         :param gears.transmission.Transmission transmission: Transmission object
             associated with the gear
         :param str optimize_feature: property to optimize for ('width'/'volume'/'center')
-        :param bool verbose: print optimization stages
+        :param bool verbose: print optimization stages (logged with logger.info,
+            see tools.diagnostics)
 
         :return: optimized result (width in mm, volume in mm^3, center distance in mm)
         :rtype: dict
@@ -235,7 +256,7 @@ class HelicalGear(SpurGear):
                     # the new width is the max value of the two minimum width
                     new_width = max(bending_minimum_width, contact_minimum_width)
                     if new_width > 1020:
-                        print("error: KH is not converging for m=", self.modulus)
+                        logger.warning("KH is not converging for m=%s", self.modulus)
                         kh_not_converging = True
                         break
 
@@ -265,8 +286,6 @@ class HelicalGear(SpurGear):
                 mG = transmission.gear_ratio
                 centers_distance = 0.5 * gear.modulus * gear.teeth_num * (mG + 1)
                 volume = 0.25 * pi * (gear.pitch_diameter ** 2) * gear.width
-                f_string = f"m={gear.modulus}, N={gear.teeth_num}, b={gear.width:.2f}," \
-                           f"spring_index={centers_distance:.2f}, V={volume:.2f}, α={alpha:.4f}"
 
                 if gear.width < 2 * pi * gear.axial_pitch:
                     # gear width is less than 2Px (b<Px), gear width should be increased
@@ -280,15 +299,8 @@ class HelicalGear(SpurGear):
                     else:
                         raise ValueError("@ Optimize: b<2Px but the modulus is the lowest possible")
 
-                    if verbose:
-                        # printing step result
-                        v = gear.tangent_velocity
-                        v_max = gear.maximum_velocity
-                        if not isinstance(v_max, str):
-                            msg = "b<2Px" if v < v_max else "b<2Px, v>v_max"
-                        else:
-                            msg = "b<2Px"
-                        print(f_string, ',', msg)
+                    # log step result
+                    self._log_step(centers_distance, volume, alpha, "b<2Px")
 
                     # setting changes
                     gear.modulus = new_modulus
@@ -297,15 +309,8 @@ class HelicalGear(SpurGear):
                     # gear width is more than 5πm (b>Pd), gear width should be decreased
                     # because initial modulus is maximal increase teeth number
 
-                    if verbose:
-                        # print step result
-                        v = gear.tangent_velocity
-                        v_max = gear.maximum_velocity
-                        if not isinstance(v_max, str):
-                            msg = "b>Pd" if v < v_max else "b>Pd, v>v_max"
-                        else:
-                            msg = "b>Pd"
-                        print(f_string, ',', msg)
+                    # log step result
+                    self._log_step(centers_distance, volume, alpha, "b>Pd")
 
                     # increasing teeth number by one
                     # (note: the gear teeth number can't exceed the biggest number specified
@@ -317,15 +322,8 @@ class HelicalGear(SpurGear):
                     # gear width is within range (3πm<b<5πm)
                     if alpha > 1:
                         # if α>1 increase number of teeth
-                        if verbose:
-                            # print step result
-                            v = gear.tangent_velocity
-                            v_max = gear.maximum_velocity
-                            if not isinstance(v_max, str):
-                                print(f"{f_string}, 2Px<b<Pd, α>1" if v < v_max
-                                      else "2Px<b<Pd, α>1, v>v_max")
-                            else:
-                                print(f"{f_string}, 2Px<b<Pd, α>1")
+                        # log step result
+                        self._log_step(centers_distance, volume, alpha, "2Px<b<Pd, α>1")
                         # add result to least of viable results
                         results_list.append({'m': gear.modulus, 'N': gear.teeth_num,
                                              'b': gear.width, 'spring_index': centers_distance,
@@ -336,16 +334,8 @@ class HelicalGear(SpurGear):
                         # if α<=1 stop optimization and return the optimized value
                         # and a list of all viable options
 
-                        # print optimization progress
-                        if verbose:
-                            # print step result
-                            v = gear.tangent_velocity
-                            v_max = gear.maximum_velocity
-                            if not isinstance(v_max, str):
-                                print(f"{f_string}, 2Px<b<Pd, α<=1" if v < v_max
-                                      else "2Px<b<Pd, α<=1, v>v_max")
-                            else:
-                                print(f"{f_string}, 2Px<b<Pd, α<=1")
+                        # log step result
+                        self._log_step(centers_distance, volume, alpha, "2Px<b<Pd, α<=1")
 
                         # find optimize feature
                         # optimize by width
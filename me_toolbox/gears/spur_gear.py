@@ -1,8 +1,12 @@
 """Module containing the SpurGear class"""
 # I want the variables names to be the same as in AGMA pylint: disable=invalid-name
+import logging
 from math import pi, radians, cos, sin
 
 from me_toolbox.gears import Gear
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class SpurGear(Gear):
@@ -90,13 +94,15 @@ class SpurGear(Gear):
         Z_I = 0.5 * cos(phi) * sin(phi) * (mG / (mG + 1))
         return Z_I
 
+    @verbose_option
     def optimization(self, transmission, optimize_feature='all', verbose=False):
         """Perform gear optimization
 
         :param gears.transmission.Transmission transmission: Transmission object
             associated with the gears
         :param str optimize_feature: property to optimize for ('width'/'volume'/'center')
-        :param bool verbose: print optimization stages
+        :param bool verbose: print optimization stages (logged with logger.info,
+            see tools.diagnostics)
 
         :return: optimized result (width in mm, volume in mm^3, center distance in mm)
         :rtype: dict
@@ -153,7 +159,7 @@ class SpurGear(Gear):
                     # the new width is the max value of the two minimum width
                     new_width = max(bending_minimum_width, contact_minimum_width)
                     if new_width > 1020:
-                        print("error: KH is not converging for m=", modulus)
+                        logger.warning("KH is not converging for m=%s", modulus)
                         kh_not_converging = True
                         break
 
@@ -179,8 +185,6 @@ class SpurGear(Gear):
                 centers_distance = 0.5 * gear.modulus * gear.teeth_num * (
                         transmission.gear_ratio + 1)
                 volume = 0.25 * pi * (gear.pitch_diameter ** 2) * gear.width
-                f_string = f"m={gear.modulus}, N={gear.teeth_num}, b={gear.width:.2f}," \
-                           f"spring_index={centers_distance:.2f}, V={volume:.2f}, α={alpha:.4f}"
 
                 if gear.width < 3 * pi * gear.modulus:
                     # gear width is less than 3πm (b<3πm), gear width should be increased
@@ -195,12 +199,8 @@ class SpurGear(Gear):
                         raise ValueError(
                             "at Optimize: b<3πm but the modulus is the lowest possible")
 
-                    if verbose:
-                        # printing step result
-                        v = gear.tangent_velocity
-                        v_max = gear.maximum_velocity
-                        msg = "b<3πm" if v < v_max else "b<3πm, v>v_max"
-                        print(f_string, ',', msg)
+                    # log step result
+                    self._log_step(centers_distance, volume, alpha, "b<3πm")
 
                     # setting changes
                     gear.modulus = new_modulus
@@ -209,12 +209,8 @@ class SpurGear(Gear):
                     # gear width is more than 5πm (b>5πm), gear width should be decreased
                     # because initial modulus is maximal increase teeth number
 
-                    if verbose:
-                        # print step result
-                        v = gear.tangent_velocity
-                        v_max = gear.maximum_velocity
-                        msg = "b>5πm" if v < v_max else "b>5πm, v>v_max"
-                        print(f_string, ',', msg)
+                    # log step result
+                    self._log_step(centers_distance, volume, alpha, "b>5πm")
 
                     # increasing teeth number by one
                     # (note: the gear teeth number can't exceed the
@@ -226,12 +222,8 @@ class SpurGear(Gear):
                     # gear width is within range (3πm<b<5πm)
                     if alpha > 1:
                         # if α>1 increase number of teeth
-                        if verbose:
-                            # print step result
-                            v = gear.tangent_velocity
-                            v_max = gear.maximum_velocity
-                            print(f"{f_string}, 3πm<b<5πm, α>1" if v < v_max
-                                  else "3πm<b<5πm, α>1, v>v_max")
+                        # log step result
+                        self._log_step(centers_distance, volume, alpha, "3πm<b<5πm, α>1")
 
                         # add result to least of viable results
                         results_list.append(
@@ -243,13 +235,8 @@ class SpurGear(Gear):
                         # if α<=1 stop optimization and return the optimized value
                         # and a list of all viable options
 
-                        # print optimization progress
-                        if verbose:
-                            # print step result
-                            v = gear.tangent_velocity
-                            v_max = gear.maximum_velocity
-                            print(f"{f_string}, 3πm<b<5πm, α<=1" if v < v_max
-                                  else "3πm<b<5πm, α<=1, v>v_max")
+                        # log step result
+                        self._log_step(centers_distance, volume, alpha, "3πm<b<5πm, α<=1")
 
                         # find optimize feature
                         # optimize by width
@@ -302,6 +289,23 @@ class SpurGear(Gear):
 
                         return optimized_result, results_list
 
+    def _log_step(self, centers_distance, volume, alpha, state):
+        """Log an optimization step (logger.info, nothing is formatted when it's disabled)
+
+        :param float centers_distance: The centers distance [mm]
+        :param float volume: The gear volume [mm^3]
+        :param float alpha: contact to bending minimum width ratio
+        :param str state: The step state (e.g. "b<3πm")
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        v_max = self.maximum_velocity
+        if not isinstance(v_max, str) and self.tangent_velocity >= v_max:
+            state += ", v>v_max"
+        logger.info("m=%s, N=%s, b=%.2f, center distance=%.2f, V=%.2f, α=%.4f, %s",
+                    self.modulus, self.teeth_num, self.width, centers_distance, volume, alpha,
+                    state)
+
     def calc_centers_distance(self, gear_ratio):
         """Calculate the distance between the centers of the gears
         :param float gear_ratio: transmissions gear ratio
@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.gears.agma_factors import dynamic_factor, size_factor, rim_thickness_factor, \
+    load_distribution_factor, bending_cycle_factor, contact_cycle_factor, \
+    bending_cycles_to_failure, contact_cycles_to_failure
+
+
+class TestAGMAFactors(TestCase):
+
+    def assert_matches_scalar(self, kernel, *arrays):
+        """the array kernel equals the scalar kernel element-wise"""
+        result = kernel(*arrays)
+        for index, values in enumerate(zip(*arrays)):
+            expected = kernel(*[value.item() for value in values])
+            for array_value, scalar_value in zip(result, expected):
+                np.testing.assert_allclose(array_value[index], scalar_value, rtol=1e-12)
+
+    def test_dynamic_factor(self):
+        Qv = np.array([5, 6, 8.5, 11, 12, 4, 13])
+        velocity = np.full(Qv.shape, 5.0)
+        Kv, v_max, valid = dynamic_factor(Qv, velocity)
+        np.testing.assert_array_equal(valid, [True, True, True, True, True, False, False])
+        self.assertEqual(Kv[4], 1)
+        self.assertEqual(v_max[4], np.inf)
+        self.assertTrue(np.isnan(Kv[5:]).all())
+        self.assert_matches_scalar(dynamic_factor, Qv[:5], velocity[:5])
+        # above the maximum velocity Kv is calculated but masked
+        Kv, v_max, valid = dynamic_factor(6, 30.0)
+        self.assertGreater(30, v_max)
+        self.assertFalse(valid)
+
+    def test_size_and_rim_thickness_factors(self):
+        self.assert_matches_scalar(size_factor, np.array([1, 2.5, 3, 10]))
+        teeth = np.array([3, 5, 10, 50])
+        self.assert_matches_scalar(rim_thickness_factor, teeth)
+        KB, valid = rim_thickness_factor(np.array([2, 10]))
+        np.testing.assert_array_equal(valid, [False, True])
+        self.assertTrue(np.isnan(KB[0]))
+
+    def test_load_distribution_factor(self):
+        width = np.array([10, 25, 100, 500, 1020, 1100])
+        diameter = np.full(width.shape, 100.0)
+        KH, valid = load_distribution_factor(width, diameter, 10, 2, 'precision enclosed',
+                                             crowned=True)
+        np.testing.assert_array_equal(valid, [True] * 5 + [False])
+        for b, d, value in zip(width[:5], diameter, KH):
+            self.assertAlmostEqual(load_distribution_factor(
+                float(b), d, 10, 2, 'precision enclosed', crowned=True)[0], value, places=12)
+        with self.assertRaises(KeyError):
+            load_distribution_factor(10, 100, 10, 2, 'closed')
+
+    def test_bending_cycle_factor(self):
+        N = np.array([50, 1e4, 1e5, 1e5, 1e5, 1e7, 1e7])
+        hardness = np.array([400, 160, 250, 300, 300, 300, 300])
+        nitriding = np.array([False, False, False, False, True, False, False])
+        sensitive_use = np.array([False, False, False, False, False, True, False])
+        YN, valid = bending_cycle_factor(N, hardness, nitriding, sensitive_use=sensitive_use)
+        np.testing.assert_array_equal(valid, [False, True, True, False, True, True, True])
+        for index in np.flatnonzero(valid):
+            self.assertAlmostEqual(YN[index], bending_cycle_factor(
+                N[index], hardness[index].item(), nitriding[index].item(),
+                sensitive_use=sensitive_use[index].item())[0], places=12)
+
+    def test_contact_cycle_factor(self):
+        N = np.array([1e4, 1e5, 1e7, 1e7])
+        nitriding = np.array([True, False, False, False])
+        sensitive_use = np.array([False, False, True, False])
+        self.assert_matches_scalar(contact_cycle_factor, N, nitriding, sensitive_use)
+        self.assertFalse(contact_cycle_factor(np.array([0.0]))[1][0])
+
+    def test_cycles_to_failure(self):
+        # the inverse of the stress cycle factors
+        N = np.array([1e3, 1e5, 1e7, 1e9])
+        YN, _ = bending_cycle_factor(N, 250, sensitive_use=True)
+        cycles, valid = bending_cycles_to_failure(YN, 250, sensitive_use=True)
+        np.testing.assert_allclose(cycles, N, rtol=1e-9)
+        self.assertTrue(valid.all())
+        ZN, _ = contact_cycle_factor(N)
+        np.testing.assert_allclose(contact_cycles_to_failure(ZN)[0], N, rtol=1e-9)
+        self.assertAlmostEqual(bending_cycles_to_failure(YN[1].item(), 250)[0] / 1e5, 1)
+        self.assertFalse(bending_cycles_to_failure(1.5, 300)[1])
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from me_toolbox.gears import optimize_batch, TransmissionSpec
+
+
+class TestOptimizeBatch(TestCase):
+    def setUp(self):
+        pinion = dict(modulus=4, pressure_angle=25, teeth_num=25, rpm=1500, grade=2, Qv=11,
+                      crowned=False, adjusted=True, width=25, bearing_span=10, pinion_offset=2,
+                      enclosure='extra precision enclosed', hardness=400,
+                      number_of_cycles=1e8, material='steel', sensitive_use=True)
+        gearbox = dict(oil_temp=65, reliability=0.999, power=50e3, gear_ratio=3.1,
+                       driving_machine='light shock', driven_machine='moderate shock',
+                       SF=1.1, SH=1)
+        self.specs = [TransmissionSpec('spur', pinion, {**gearbox, 'power': power})
+                      for power in (10e3, 30e3, 50e3)]
+
+    def test_parallel_matches_serial(self):
+        serial = optimize_batch(self.specs, max_workers=1)
+        parallel = optimize_batch(self.specs, max_workers=2, chunksize=2)
+        self.assertEqual(serial, parallel)
+        # results are in input order, more power needs a larger gear
+        volumes = [result[0]['optimized volume']['V'] for result in serial]
+        self.assertEqual(volumes, sorted(volumes))
+
+    def test_return_exceptions(self):
+        specs = self.specs[:1] + [TransmissionSpec('bevel', {}, {})]
+        results = optimize_batch(specs, max_workers=1, return_exceptions=True)
+        self.assertIsInstance(results[1], ValueError)
+        with self.assertRaises(ValueError):
+            optimize_batch(specs, max_workers=1)
@@ -0,0 +1,53 @@
+from unittest import TestCase
+from math import pi
+import numpy as np
+
+from me_toolbox.gears import SpurGear, Transmission
+from me_toolbox.gears.grid_search import pareto_front
+
+
+class TestGridSearch(TestCase):
+    def setUp(self):
+        self.pinion = SpurGear(modulus=4, pressure_angle=25, teeth_num=25, rpm=1500, grade=2,
+                               Qv=11, crowned=False, adjusted=True, width=25, bearing_span=10,
+                               pinion_offset=2, enclosure='extra precision enclosed',
+                               hardness=400, number_of_cycles=1e8, material='steel',
+                               sensitive_use=True)
+        self.gearbox = Transmission(gear1=self.pinion, oil_temp=65, reliability=0.999,
+                                    power=50e3, gear_ratio=3.1, driving_machine='light shock',
+                                    driven_machine='moderate shock', SF=1.1, SH=1)
+
+    def test_gears_not_modified(self):
+        pinion_state = dict(self.pinion.__dict__)
+        gear_state = dict(self.gearbox.gear2.__dict__)
+        self.gearbox.grid_optimize()
+        self.assertEqual(self.pinion.__dict__, pinion_state)
+        self.assertEqual(self.gearbox.gear2.__dict__, gear_state)
+
+    def test_width_range(self):
+        _, candidates = self.gearbox.grid_optimize()
+        self.assertGreater(len(candidates['b']), 0)
+        self.assertTrue(np.all(candidates['b'] >= 3 * pi * candidates['m']))
+        self.assertTrue(np.all(candidates['b'] <= 5 * pi * candidates['m']))
+
+    def test_matches_scalar_analysis(self):
+        # rebuild the best candidate as regular gears and check its width converged
+        pareto, _ = self.gearbox.grid_optimize(modulus_list=[2.5], teeth_range=[49])
+        result = pareto[0]
+        pinion = SpurGear(modulus=2.5, pressure_angle=25, teeth_num=49, rpm=1500, grade=2,
+                          Qv=11, crowned=False, adjusted=True, width=result['b'],
+                          bearing_span=10, pinion_offset=2,
+                          enclosure='extra precision enclosed', hardness=400,
+                          number_of_cycles=1e8, material='steel', sensitive_use=True)
+        gearbox = Transmission(gear1=pinion, oil_temp=65, reliability=0.999, power=50e3,
+                               gear_ratio=result['N2'] / result['N1'],
+                               driving_machine='light shock',
+                               driven_machine='moderate shock', SF=1.1, SH=1)
+        gearbox.gear2.width = result['b']
+        widths = [gearbox.minimum_width_for_bending(gear) for gear in (pinion, gearbox.gear2)]
+        widths += [gearbox.minimum_width_for_contact(gear) for gear in (pinion, gearbox.gear2)]
+        self.assertAlmostEqual(max(widths), result['b'], places=4)
+
+    def test_pareto_front(self):
+        points = np.array([[1, 5], [2, 2], [3, 3], [5, 1], [1, 6]])
+        np.testing.assert_array_equal(pareto_front(points), [0, 1, 3])
@@ -0,0 +1,75 @@
+import logging
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.gears import SpurGear, Transmission
+
+
+class TestDutyCycle(TestCase):
+    def setUp(self):
+        self.pinion = SpurGear(modulus=2.5, pressure_angle=25, teeth_num=49, rpm=1500, grade=2,
+                               Qv=11, crowned=False, adjusted=True, width=40, bearing_span=10,
+                               pinion_offset=2, enclosure='extra precision enclosed',
+                               hardness=400, number_of_cycles=1e8, material='steel',
+                               sensitive_use=True)
+        self.gearbox = Transmission(gear1=self.pinion, oil_temp=65, reliability=0.999,
+                                    power=50e3, gear_ratio=3.1, driving_machine='light shock',
+                                    driven_machine='moderate shock', SF=1.1, SH=1)
+
+    def test_single_block_matches_operating_point(self):
+        # one block at the transmission's operating point for the pinion's number of cycles
+        result = self.gearbox.duty_cycle(50e3, 1500, 1e8 / (60 * 1500))['gear1']
+        self.assertAlmostEqual(float(result['bending_stress']),
+                               self.gearbox.bending_stress(self.pinion), places=8)
+        self.assertAlmostEqual(float(result['contact_stress']),
+                               self.gearbox.contact_stress(self.pinion), places=8)
+        self.assertAlmostEqual(result['life'],
+                               self.gearbox.life_expectency(self.pinion, in_hours=True), places=1)
+        self.assertAlmostEqual(result['minimal_hardness'],
+                               self.gearbox.minimal_hardness(self.pinion), places=8)
+
+    def test_minimal_hardness_uses_contact_stress(self):
+        gearbox, pinion = self.gearbox, self.pinion
+        Sc = (gearbox.Ytheta * gearbox.Yz * gearbox.SH * gearbox.contact_stress(pinion)) / (
+                pinion.ZN * pinion.Zw)
+        self.assertGreaterEqual(gearbox.minimal_hardness(pinion), (Sc - 237) / 2.41)
+
+    def test_blocks_damage(self):
+        power, rpm, hours = [50e3, 20e3, 5e3], [1500, 1500, 3000], [100, 1000, 300]
+        result = self.gearbox.duty_cycle(power, rpm, hours)
+        for block, (P, n, t) in enumerate(zip(power, rpm, hours)):
+            single = self.gearbox.duty_cycle(P, n, t)
+            for gear in ('gear1', 'gear2'):
+                self.assertAlmostEqual(float(single[gear]['bending_stress']),
+                                       result[gear]['bending_stress'][block])
+        for gear in ('gear1', 'gear2'):
+            gear_result = result[gear]
+            self.assertTrue(gear_result['valid'].all())
+            damage = np.sum(gear_result['cycles'] / gear_result['contact_cycles'])
+            self.assertAlmostEqual(gear_result['contact_damage'], damage)
+            self.assertAlmostEqual(gear_result['life'], sum(hours) / max(
+                gear_result['bending_damage'], gear_result['contact_damage']))
+        # a longer design life needs a harder gear
+        longer = self.gearbox.duty_cycle(power, rpm, hours, design_life=10 * sum(hours))
+        self.assertGreater(longer['gear1']['minimal_hardness'],
+                           result['gear1']['minimal_hardness'])
+
+    def test_out_of_range_block(self):
+        # a block above the maximal pitch line velocity of Qv=11 and a block with no curve
+        # (negative power) are excluded, the damage is the damage of the valid blocks
+        expected = self.gearbox.duty_cycle([50e3, 5e3], [1500, 3000], [100, 300])
+        for power, rpm in (([50e3, 20e3, 5e3], [1500, 8000, 3000]),
+                           ([50e3, -20e3, 5e3], [1500, 1500, 3000])):
+            with self.assertLogs('me_toolbox.gears', logging.WARNING):
+                result = self.gearbox.duty_cycle(power, rpm, [100, 10, 300])
+            for gear in ('gear1', 'gear2'):
+                gear_result = result[gear]
+                np.testing.assert_array_equal(gear_result['excluded'], [1])
+                self.assertAlmostEqual(gear_result['bending_damage'] /
+                                       expected[gear]['bending_damage'], 1)
+                self.assertAlmostEqual(gear_result['contact_damage'] /
+                                       expected[gear]['contact_damage'], 1)
+                self.assertAlmostEqual(gear_result['life'], 410 / max(
+                    gear_result['bending_damage'], gear_result['contact_damage']))
+                self.assertTrue(np.isfinite(gear_result['minimal_hardness']))
@@ -1,9 +1,17 @@
 """Module containing the Transmission Class"""
 # I want the variables names to be the same as in AGMA pylint: disable=invalid-name
+import logging
 from math import cos, sin, log, sqrt, radians, pi
 
-from me_toolbox.gears import Gear
-from me_toolbox.tools import print_atributes
+import numpy as np
+
+from me_toolbox.gears import Gear, SpurGear
+from me_toolbox.gears.agma_factors import dynamic_factor, bending_cycle_curve, \
+    contact_cycle_curve, bending_cycles_to_failure, contact_cycles_to_failure
+from me_toolbox.gears.grid_search import grid_search
+from me_toolbox.tools import print_atributes, dependent_property
+
+logger = logging.getLogger(__name__)
 
 
 class GearTypeError(ValueError):
@@ -77,7 +85,7 @@ class Transmission:
 
         return {"Ko=": self.Ko, "Yθ=": self.Ytheta, "Yz=": self.Yz, "ZE=": self.ZE, "ZI=": self.ZI}
 
-    @property
+    @dependent_property('oil_temp')
     def Ytheta(self):
         """Returns temperature factor"""
 
@@ -87,7 +95,7 @@ class Transmission:
             y_theta = 1
         return y_theta
 
-    @property
+    @dependent_property('driving_machine', 'driven_machine')
     def Ko(self):
         """ Returns overload factor
         Ko is dependent on the type of driving motor type
@@ -107,7 +115,7 @@ class Transmission:
 
         return table[self.driving_machine][self.driven_machine]
 
-    @property
+    @dependent_property('reliability')
     def Yz(self):
         """Returns reliability factor"""
         R = self.reliability
@@ -120,7 +128,7 @@ class Transmission:
 
         return Y_z
 
-    @property
+    @dependent_property('gear1.material', 'gear2.material')
     def ZE(self):
         """returns the elastic coefficient"""
         elastic_modulus_list = {'steel': 2e5, 'malleable iron': 1.7e5,
@@ -138,7 +146,7 @@ class Transmission:
             return sqrt(
                 (1 / pi) / (((1 - poissons_ratio ** 2) / E1) + ((1 - poissons_ratio ** 2) / E2)))
         except TypeError:
-            print(f"error: at ZE: invalid gear material ({material1} or {material2})")
+            logger.error("at ZE: invalid gear material (%s or %s)", material1, material2)
 
     @property
     def centers_distance(self):
@@ -256,42 +264,23 @@ class Transmission:
         :rtype: float
         """
 
-        bending_stress = self.bending_stress(gear)
-        contact_stress = self.contact_stress(gear)
-        YN = (bending_stress * self.SF * self.Ytheta * self.Yz) / gear.St
-        ZN = (contact_stress * self.SH * self.Ytheta * self.Yz) / (gear.Sc * gear.Zw)
-
-        # for YN > 1
-        YN_low_cycle = {160: (YN / 2.3194) ** (-1 / 0.0538),
-                        250: (YN / 4.9404) ** (-1 / 0.1045),
-                        400: (YN / 9.4518) ** (-1 / 0.148)}
-        # for YN <= 1
-        YN_high_cycle = {True: (YN / 1.6831) ** (-1 / 0.0323),
-                         False: (YN / 1.3558) ** (-1 / 0.0178)}
-
-        # for ZN > 1
-        ZN_low_cycle = {True: (ZN / 1.249) ** (-1 / 0.0138),
-                        False: (ZN / 2.466) ** (-1 / 0.056)}
-        # for ZN < 1
-        ZN_high_cycle = {True: (ZN / 2.466) ** (-1 / 0.056),
-                         False: (ZN / 1.4488) ** (-1 / 0.023)}
-        # print(f"YN = {YN}, ZN = {ZN}")
-        try:
-            # number of cycles until bending failure
-            Ny = YN_low_cycle[gear.hardness] if YN > 1 else YN_high_cycle[gear.sensitive_use]
+        YN = (self.bending_stress(gear) * self.SF * self.Ytheta * self.Yz) / gear.St
+        ZN = (self.contact_stress(gear) * self.SH * self.Ytheta * self.Yz) / (gear.Sc * gear.Zw)
 
-            # number of cycles until contact failure
-            Nz = ZN_low_cycle[gear.nitriding] if ZN > 1 else ZN_high_cycle[gear.sensitive_use]
+        # number of cycles until bending failure
+        Ny, valid = bending_cycles_to_failure(YN, gear.hardness, gear.nitriding, gear.case_carb,
+                                              gear.sensitive_use)
+        if not valid:
+            logger.error("YN > 1 but hardness %s has no graph associated with it", gear.hardness)
+            return None
 
-            N = min(Ny, Nz)
-            # print(f"Ny={Ny:e}, Nz={Nz:e}")
-        except KeyError:
-            print(f"error: YN > 1 but hardness {gear.hardness} has no graph associated with it")
-            # return YN, ZN
-        else:
-            # if in_hours True convert number of cycles to house
-            # and shorten float length to only 2 decimal places
-            return float(f"{N / (gear.rpm * 60):.2f}") if in_hours else N
+        # number of cycles until contact failure
+        Nz, _ = contact_cycles_to_failure(ZN, gear.nitriding, gear.sensitive_use)
+
+        N = min(Ny, Nz)
+        # if in_hours True convert number of cycles to house
+        # and shorten float length to only 2 decimal places
+        return float(f"{N / (gear.rpm * 60):.2f}") if in_hours else N
 
     def minimal_hardness(self, gear):
         """Returns the minimal hardness of the gear to avoid failure
@@ -301,26 +290,133 @@ class Transmission:
         :returns: Minimal hardness
         :rtype: float
         """
-        # for bending
+        # required bending and contact strength
         St = (self.Ytheta * self.Yz * self.SF * self.bending_stress(gear)) / gear.YN
-        if gear.grade == 1:
-            # for grade 1
-            HBt = (St - 88.3) / 0.533
-        else:
-            # for grade 2
-            HBt = (St - 113) / 0.703
+        Sc = (self.Ytheta * self.Yz * self.SH * self.contact_stress(gear)) / (gear.ZN * gear.Zw)
+        return self.calc_minimal_hardness(gear.grade, St, Sc)
+
+    @staticmethod
+    def calc_minimal_hardness(grade, St, Sc):
+        """Returns the minimal hardness for the required bending and contact strength
+
+        :param int grade: material grade (1 / 2)
+        :param float St: required bending strength
+        :param float Sc: required contact strength
 
-        # for contact
-        Sc = (self.Ytheta * self.Yz * self.SH * self.bending_stress(gear)) / (gear.ZN * gear.Zw)
-        if gear.grade == 1:
-            # for grade 1
+        :returns: Minimal hardness [HBN]
+        :rtype: float
+        """
+        if grade == 1:
+            HBt = (St - 88.3) / 0.533
             HBc = (Sc - 200) / 2.22
         else:
             # for grade 2
+            HBt = (St - 113) / 0.703
             HBc = (Sc - 237) / 2.41
-
         return max(HBt, HBc)
 
+    def duty_cycle(self, power, rpm, hours, design_life=None):
+        """Evaluates the gears over a duty cycle of operating blocks,
+        each block is a (power, rpm, hours) operating point, the damage of the blocks
+        is accumulated with Miner's rule
+
+        example: result = gearbox.duty_cycle(power=[50e3, 30e3, 5e3], rpm=[1500, 1500, 3000],
+                                             hours=[200, 1000, 300], design_life=20e3)
+                 result['gear1']['life'], result['gear2']['minimal_hardness']
+
+        Note: the number of cycles of a block is 60 * hours * rpm, the minimal hardness
+            uses the Miner equivalent stress on the curves at the design life
+            (the low cycle curves are the curves of the gear's current hardness).
+            The blocks out of the range of the AGMA factors are excluded from the damage and
+            the minimal hardness (with a warning), the life is inf if no block is valid
+
+        :param float or list or np.ndarray power: transmission power of each block [W]
+        :param float or list or np.ndarray rpm: gear1 angular velocity of each block [rpm]
+        :param float or list or np.ndarray hours: duration of each block [hours]
+        :param float design_life: required life for the minimal hardness [hours]
+            (default: the duty cycle duration)
+
+        :returns: a dictionary for each gear ('gear1', 'gear2') with the bending and contact
+            stresses, the stress cycle factors the stresses require (YN, ZN), the number of
+            cycles and the number of cycles to failure of each block, a mask of the blocks
+            in the range of the AGMA factors and the indices of the excluded blocks, the
+            bending and contact damage of one duty cycle, the life [hours] and the minimal
+            hardness [HBN]
+        :rtype: dict[str, dict]
+        """
+        power, rpm, hours = np.broadcast_arrays(np.asarray(power, dtype=float),
+                                                np.asarray(rpm, dtype=float),
+                                                np.asarray(hours, dtype=float))
+        total_hours = hours.sum()
+        design_life = total_hours if design_life is None else design_life
+        temperature_reliability = self.Ytheta * self.Yz
+
+        result = {}
+        for name, gear in (('gear1', self.gear1), ('gear2', self.gear2)):
+            d, b = gear.pitch_diameter, gear.width
+            gear_rpm = rpm * (gear.rpm / self.gear1.rpm)
+            cycles = 60 * hours * gear_rpm
+
+            # stresses of each block
+            Wt = (60e3 / pi) * (power / (d * gear_rpm))
+            Kv, _, valid = dynamic_factor(gear.Qv, pi * d * gear_rpm / 60e3)
+            load = Wt * self.Ko * Kv * gear.Ks * gear.KH
+            bending_stress = (load * gear.teeth_num * gear.KB) / (gear.Yj * b * d)
+            with np.errstate(invalid='ignore'):
+                contact_stress = np.sqrt((load * self.ZE ** 2 * gear.ZR) / (b * d * self.ZI))
+
+            # required stress cycle factors and the number of cycles to failure
+            YN = (bending_stress * self.SF * temperature_reliability) / gear.St
+            ZN = (contact_stress * self.SH * temperature_reliability) / (gear.Sc * gear.Zw)
+            bending_cycles, bending_valid = bending_cycles_to_failure(
+                YN, gear.hardness, gear.nitriding, gear.case_carb, gear.sensitive_use)
+            contact_cycles, contact_valid = contact_cycles_to_failure(
+                ZN, gear.nitriding, gear.sensitive_use)
+
+            valid = valid & bending_valid & contact_valid
+            excluded = np.flatnonzero(~valid)
+            if excluded.size:
+                logger.warning("at duty_cycle: the %s blocks %s are out of the AGMA factors "
+                               "range and excluded from the damage", name, excluded.tolist())
+
+            # cumulative damage (Miner's rule) of the valid blocks of one duty cycle
+            valid_cycles = np.where(valid, cycles, 0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                bending_damage = np.sum(np.where(valid, cycles / bending_cycles, 0))
+                contact_damage = np.sum(np.where(valid, cycles / contact_cycles, 0))
+                life = total_hours / np.fmax(bending_damage, contact_damage)
+
+            # minimal hardness for the design life, using the Miner equivalent stresses
+            design_cycles = cycles.sum() * design_life / total_hours
+            a, exponent = bending_cycle_curve(design_cycles, gear.hardness, gear.nitriding,
+                                              gear.case_carb, gear.sensitive_use)
+            bending_eq = self._equivalent_stress(bending_stress, valid_cycles, exponent)
+            St = temperature_reliability * self.SF * bending_eq / (a * design_cycles ** exponent)
+            a, exponent = contact_cycle_curve(design_cycles, gear.nitriding, gear.sensitive_use)
+            contact_eq = self._equivalent_stress(contact_stress, valid_cycles, exponent)
+            Sc = temperature_reliability * self.SH * contact_eq / (
+                    a * design_cycles ** exponent * gear.Zw)
+
+            result[name] = {'bending_stress': bending_stress, 'contact_stress': contact_stress,
+                            'YN': YN, 'ZN': ZN, 'cycles': cycles,
+                            'bending_cycles': bending_cycles, 'contact_cycles': contact_cycles,
+                            'valid': valid, 'excluded': excluded,
+                            'bending_damage': float(bending_damage),
+                            'contact_damage': float(contact_damage), 'life': float(life),
+                            'minimal_hardness': float(self.calc_minimal_hardness(gear.grade,
+                                                                                 St, Sc))}
+        return result
+
+    @staticmethod
+    def _equivalent_stress(stress, cycles, exponent):
+        """The constant stress causing the same damage in the same number of cycles
+        (Miner's rule on the curve factor = a * N ** exponent, the blocks with 0 cycles are
+        ignored, nan if there are no cycles)"""
+        m = -1 / exponent
+        with np.errstate(invalid='ignore'):
+            stress = np.where(cycles > 0, stress, 0)
+            return (np.sum(cycles * stress ** m) / np.sum(cycles)) ** (1 / m)
+
     def optimize(self, gear, optimize_feature='all', verbose=False):
         """ perform gear optimization
 
@@ -337,6 +433,27 @@ class Transmission:
         """
         return gear.optimization(self, optimize_feature, verbose)
 
+    def grid_optimize(self, modulus_list=None, teeth_range=None, pressure_angles=None):
+        """Perform gear optimization by evaluating all the candidates at once,
+        unlike optimize the gears are not modified
+
+        example: pareto, candidates = gearbox.grid_optimize(pressure_angles=(20, 25))
+
+        note: result of width in [mm], volume in [mm^3] and center distance in [mm]
+
+        :param list modulus_list: moduli to check in [mm] (default: standard moduli list)
+        :param range teeth_range: pinion teeth numbers to check
+        :param list pressure_angles: pressure angles to check (20 / 25)
+
+        :returns: The Pareto set over width, volume and center distance (sorted by width)
+            and the arrays of all the feasible candidates
+        :rtype: tuple[list[dict], dict]
+        """
+        if type(self.gear1) is not SpurGear:
+            raise GearTypeError(f"grid optimization supports spur gears only, "
+                                f"not {type(self.gear1).__name__}")
+        return grid_search(self, modulus_list, teeth_range, pressure_angles)
+
     def check_undercut(self):
         """Checks undercut state """
 
@@ -390,7 +507,7 @@ class Transmission:
                           sqrt((rp + m) ** 2 - (rp * cos(phi)) ** 2) - (rp + rG) * sin(phi))
         contact_ratio = contact_length / (p * cos(phi))
         if contact_ratio < 1.2:
-            print("attention: ratio is should be higher than 1.2")
+            logger.warning("contact ratio %.3f should be higher than 1.2", contact_ratio)
 
         self.gear1.contact_ratio = contact_ratio
         self.gear2.contact_ratio = contact_ratio
@@ -1,4 +1,11 @@
-from me_toolbox.springs.spring import Spring
-from me_toolbox.springs.helical_compression_spring import HelicalCompressionSpring
-from me_toolbox.springs.extension_spring import ExtensionSpring
-from me_toolbox.springs.helical_torsion_spring import HelicalTorsionSpring
+from me_toolbox._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={
+    'spring': ['Spring'],
+    'helical_compression_spring': ['HelicalCompressionSpring'],
+    'extension_spring': ['ExtensionSpring'],
+    'helical_torsion_spring': ['HelicalTorsionSpring'],
+    'material_table': ['SpringMaterialTable'],
+    'spring_batch': ['HelicalCompressionSpringBatch'],
+    'spring_optimizer': ['spring_search'],
+})
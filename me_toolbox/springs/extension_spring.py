@@ -1,9 +1,13 @@
 """A module containing the extension spring class"""
+import logging
 from math import pi
 
 from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
 from me_toolbox.springs import HelicalCompressionSpring
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class ExtensionSpring(HelicalCompressionSpring):
@@ -80,9 +84,9 @@ class ExtensionSpring(HelicalCompressionSpring):
         in_range = True
         C = self.spring_index
         if isinstance(C, float) and not 3 <= C <= 16 and self.set_removed:
-            print("Note: C - spring index should be in range of [3,16],"
-                  "lower C causes surface cracks,\n"
-                  "higher C causes the spring to tangle and requires separate packing")
+            logger.warning("C - spring index should be in range of [3,16], "
+                           "lower C causes surface cracks,\n"
+                           "higher C causes the spring to tangle and requires separate packing")
             in_range = False
         return in_range
 
@@ -179,23 +183,24 @@ class ExtensionSpring(HelicalCompressionSpring):
         """
         return (force - self.initial_tension) / self.spring_rate
 
+    @verbose_option
     def static_analysis(self, verbose=False):
         """ Returns the static safety factors for the hook (torsion and
         bending), and for the spring's body (torsion)
 
-        :param bool verbose: More information
+        :param bool verbose: More information (logged with logger.info)
 
         :returns: Spring's body (torsion) safety factor, Spring's hook bending safety factor,
             Spring's hook torsion safety factor
         :type: dict{str: float}
         """
         if verbose:
-            print(f"max body shear stress = {self.max_body_shear_stress:.2f}\n"
-                  f"body Ssy = {self.shear_yield_strength:.2f}\n\n"
-                  f"max hook normal stress = {self.max_hook_normal_stress:.2f}\n"
-                  f"hook Sy = {self.hook_normal_yield_strength:.2f}\n\n"
-                  f"max hook shear stress = {self.max_hook_shear_stress:.2f}\n"
-                  f"hook Ssy = {self.hook_shear_yield_strength:.2f}\n")
+            logger.info("max body shear stress = %.2f\nbody Ssy = %.2f\n\n"
+                        "max hook normal stress = %.2f\nhook Sy = %.2f\n\n"
+                        "max hook shear stress = %.2f\nhook Ssy = %.2f\n",
+                        self.max_body_shear_stress, self.shear_yield_strength,
+                        self.max_hook_normal_stress, self.hook_normal_yield_strength,
+                        self.max_hook_shear_stress, self.hook_shear_yield_strength)
 
         n_body = self.shear_yield_strength / self.max_body_shear_stress
         n_hook_normal = self.hook_normal_yield_strength / self.max_hook_normal_stress
@@ -203,6 +208,7 @@ class ExtensionSpring(HelicalCompressionSpring):
 
         return {'n_body': n_body, 'n_hook_normal': n_hook_normal, 'n_hook_shear': n_hook_shear}
 
+    @verbose_option
     def fatigue_analysis(self, max_force, min_force, reliability,
                          criterion='gerber', z=-3, verbose=False, metric=True):
         """Fatigue analysis of the hook section, for normal and shear stress,and for the
@@ -213,7 +219,7 @@ class ExtensionSpring(HelicalCompressionSpring):
         :param float reliability: in percentage
         :param str criterion: fatigue criterion ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
-        :param bool verbose: print more details
+        :param bool verbose: print more details (logged with logger.info)
         :param bool metric: Metric or imperial
 
         :returns: Normal and shear safety factors for the hook section and
@@ -271,19 +277,20 @@ class ExtensionSpring(HelicalCompressionSpring):
                                                          alt_body_shear_stress,
                                                          Sse, Ssu, Ssy_body, z)
         if verbose:
-            print(f"Alternating force = {alt_force:.2f}, "
-                  f"Mean force = {mean_force:.2f}\n\n"
-                  f"Body's alternating shear stress = {alt_body_shear_stress:.2f}, "
-                  f"Body's mean shear stress = {mean_body_shear_stress:.2f}, "
-                  f"Body's initial shear stress = {initial_body_shear_stress:.2f}\n\n"
-                  f"Hook's alternating shear stress = {hook_alt_shear_stress:.2f}, "
-                  f"Hook's mean shear stress = {hook_mean_shear_stress:.2f}\n\n"
-                  f"Hook's alternating normal stress = {hook_alt_normal_stress:.2f}, "
-                  f"Hook's mean normal stress = {hook_mean_normal_stress:.2f}\n\n"
-                  f"Sut = {Sut:.2f}, Sse = {Sse:.2f}, Se = {Se:.2f}, Ssu = {Ssu:.2f}, "
-                  f"Ssa = {Ssa:.2f}\n"
-                  f"Ssy_body = {Ssy_body:.2f}, Ssy_hook = {Ssy_hook:.2f}, "
-                  f"Sy_hook = {Sy_hook:.2f}\n")
+            logger.info("Alternating force = %.2f, Mean force = %.2f\n\n"
+                        "Body's alternating shear stress = %.2f, "
+                        "Body's mean shear stress = %.2f, "
+                        "Body's initial shear stress = %.2f\n\n"
+                        "Hook's alternating shear stress = %.2f, "
+                        "Hook's mean shear stress = %.2f\n\n"
+                        "Hook's alternating normal stress = %.2f, "
+                        "Hook's mean normal stress = %.2f\n\n"
+                        "Sut = %.2f, Sse = %.2f, Se = %.2f, Ssu = %.2f, Ssa = %.2f\n"
+                        "Ssy_body = %.2f, Ssy_hook = %.2f, Sy_hook = %.2f\n",
+                        alt_force, mean_force, alt_body_shear_stress, mean_body_shear_stress,
+                        initial_body_shear_stress, hook_alt_shear_stress, hook_mean_shear_stress,
+                        hook_alt_normal_stress, hook_mean_normal_stress, Sut, Sse, Se, Ssu, Ssa,
+                        Ssy_body, Ssy_hook, Sy_hook)
 
         return {'body': {'nf': nf_body, 'ns': ns_body, 'N': N_body, 'Sf': Sf_body},
                 'hook_normal': {'nf': nf_hook_normal, 'ns': ns_hook_normal, 'N': N_hook_normal, 'Sf': Sf_hook_normal},
@@ -1,11 +1,14 @@
 """A module containing the helical push spring class"""
-from math import pi  # , sqrt
-
-from sympy import sqrt
+import logging
+from math import pi
 
 from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
 from me_toolbox.springs import Spring
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools.backend import sqrt
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class HelicalCompressionSpring(Spring):
@@ -79,23 +82,23 @@ class HelicalCompressionSpring(Spring):
         return all([self._check_spring_index(), self._check_active_coils(), self._check_zeta()])
 
     def _alert_set_removed(self):
-        """Print a Note if set is removed"""
+        """Log a warning if set is removed"""
         if self.set_removed:
-            print("Note: set should ONLY be removed for static loading"
-                  "and NOT for periodical loading")
+            logger.warning("set should ONLY be removed for static loading "
+                           "and NOT for periodical loading")
 
     def _check_spring_index(self) -> bool:
         in_range = True
         C = self.spring_index  # pylint: disable=invalid-name
         if isinstance(C, float) and not 4 <= C <= 12 and self.set_removed:
-            print("Note: C - spring index should be in range of [4,12],"
-                  "lower C causes surface cracks,\n"
-                  "higher C causes the spring to tangle and requires separate packing")
+            logger.warning("C - spring index should be in range of [4,12], "
+                           "lower C causes surface cracks,\n"
+                           "higher C causes the spring to tangle and requires separate packing")
             in_range = False
         elif isinstance(C, float) and not 3 <= C <= 12:
-            print("Note: C - spring index should be in range of [3,12],"
-                  "lower C causes surface cracks,\n"
-                  "higher C causes the spring to tangle and requires separate packing")
+            logger.warning("C - spring index should be in range of [3,12], "
+                           "lower C causes surface cracks,\n"
+                           "higher C causes the spring to tangle and requires separate packing")
             in_range = False
         return in_range
 
@@ -103,8 +106,8 @@ class HelicalCompressionSpring(Spring):
         in_range = True
         active_coils = self.active_coils
         if isinstance(active_coils, float) and not 3 <= active_coils <= 15:
-            print(f"Note: active_coils={active_coils:.2f} is not in range [3,15],"
-                  f"this can cause non linear behavior")
+            logger.warning("active_coils=%.2f is not in range [3,15], "
+                           "this can cause non linear behavior", active_coils)
             in_range = False
         return in_range
 
@@ -112,8 +115,8 @@ class HelicalCompressionSpring(Spring):
         in_range = True
         zeta = self.zeta
         if zeta < 0.15:
-            print(f"Note: zeta={zeta:.2f} is smaller then 0.15,"
-                  f"the spring could reach its solid length")
+            logger.warning("zeta=%.2f is smaller then 0.15, "
+                           "the spring could reach its solid length", zeta)
             in_range = False
         return in_range
 
@@ -269,6 +272,7 @@ class HelicalCompressionSpring(Spring):
             shear_stress = self.max_shear_stress
         return self.shear_yield_strength / shear_stress
 
+    @verbose_option
     def fatigue_analysis(self, max_force, min_force, reliability,
                          criterion='modified goodman', z=-3, verbose=False, metric=True):
         """ Returns safety factors for fatigue and for first cycle according to Lange failure
@@ -279,7 +283,7 @@ class HelicalCompressionSpring(Spring):
         :param float reliability: in percentage
         :param str criterion: fatigue criterion ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
-        :param bool verbose: print more details
+        :param bool verbose: print more details (logged with logger.info)
         :param bool metric: Metric or imperial
 
         :returns: static and dynamic safety factor
@@ -304,18 +308,19 @@ class HelicalCompressionSpring(Spring):
         N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_shear_stress, alt_shear_stress, Sse, Ssu, Ssy, z)
 
         if verbose:
-            print(f"Alternating force = {alternating_force:.2f}, Mean force = {mean_force:.2f}\n"
-                  f"Alternating shear stress = {alt_shear_stress:.2f}, "
-                  f"Mean shear stress = {mean_shear_stress:.2f}\n"
-                  f"Sse = {Sse:.2f}, Ssu = {Ssu:.2f}, Ssy = {Ssy:.2f}")
+            logger.info("Alternating force = %.2f, Mean force = %.2f\n"
+                        "Alternating shear stress = %.2f, Mean shear stress = %.2f\n"
+                        "Sse = %.2f, Ssu = %.2f, Ssy = %.2f", alternating_force, mean_force,
+                        alt_shear_stress, mean_shear_stress, Sse, Ssu, Ssy)
         return nf, nl, N, Sf
 
+    @verbose_option
     def buckling(self, anchors, verbose=False) -> tuple[bool, float]:
         """ Checks if the spring will buckle and find the
         maximum free length to avoid buckling
         :param str or None anchors: How the spring is anchored
             (The options are: 'fixed-fixed', 'fixed-hinged', 'hinged-hinged', 'clamped-free')
-        :param bool verbose: Print buckling test result
+        :param bool verbose: Print buckling test result (logged with logger.info)
         :returns: True if buckling occurring and The maximum safe length (free_length)
             to avoid buckling
         """
@@ -329,30 +334,30 @@ class HelicalCompressionSpring(Spring):
             alpha = options[anchors.lower()]
             max_safe_length = (pi * D / alpha) * sqrt((2 * (E - G)) / (2 * G + E))
         except ValueError as err:
-            print(f"{err}, make sure E and G have the same units (Mpa)")
+            logger.error("%s, make sure E and G have the same units (Mpa)", err)
         except KeyError as key:
-            print(f"Ends: {key} is unknown ")
+            logger.error("Ends: %s is unknown", key)
         except AttributeError:
-            print("Anchors not specified")
+            logger.error("Anchors not specified")
         else:
             if verbose:
                 if self.free_length >= max_safe_length:
-                    print(f"Buckling is accruing, the max safe length = {max_safe_length:.2f}, ",
-                          f"but the free_length = {self.free_length:.2f}")
+                    logger.info("Buckling is accruing, the max safe length = %.2f, "
+                                "but the free_length = %.2f", max_safe_length, self.free_length)
 
                 else:
-                    print(
-                        f"Buckling is NOT accruing, the max safe length = {max_safe_length:.2f}, ",
-                        f"and the free_length = {self.free_length:.2f}")
+                    logger.info("Buckling is NOT accruing, the max safe length = %.2f, "
+                                "and the free_length = %.2f", max_safe_length, self.free_length)
 
             return self.free_length >= max_safe_length, max_safe_length
 
+    @verbose_option
     def natural_frequency(self, density, working_frequency, verbose=False) -> dict[str:float] or None:
         """Figures out what is the natural frequency of the spring
 
         :param float density: Spring's material density
         :param float working_frequency: The expected frequency the spring is used for
-        :param bool verbose: Print if spring frequency is not in range
+        :param bool verbose: Print if spring frequency is not in range (logged with logger.info)
         """
         d = self.wire_diameter
         D = self.diameter
@@ -363,20 +368,20 @@ class HelicalCompressionSpring(Spring):
 
         if verbose:
             if results['fixed-fixed'] > 20 * working_frequency:
-                print(f"The spring's natural frequency for fixed ends is much grater than the "
-                      f"working frequency \nwhich is good\n")
+                logger.info("The spring's natural frequency for fixed ends is much grater than "
+                            "the working frequency \nwhich is good\n")
             else:
-                print(f"Note: the natural frequency={results['fixed-fixed']:.2f} "
-                      f"for fixed ends is not larger than 20*working frequency="
-                      f"{20 * working_frequency:.2f} \nwhich means the spring can resonance\n")
+                logger.info("Note: the natural frequency=%.2f for fixed ends is not larger than "
+                            "20*working frequency=%.2f \nwhich means the spring can resonance\n",
+                            results['fixed-fixed'], 20 * working_frequency)
 
             if results['fixed-free'] > 20 * working_frequency:
-                print(f"The spring's natural frequency for one fixed and one free ends is much"
-                      f"grater than the working frequency \nwhich is good\n")
+                logger.info("The spring's natural frequency for one fixed and one free ends is "
+                            "much grater than the working frequency \nwhich is good\n")
             else:
-                print(f"Note: the natural frequency={results['fixed-free']:.2f} "
-                      f"for one fixed and one free ends is not larger than 20*working frequency="
-                      f"{20 * working_frequency:.2f} \nwhich means the spring can resonance\n")
+                logger.info("Note: the natural frequency=%.2f for one fixed and one free ends is "
+                            "not larger than 20*working frequency=%.2f \nwhich means the spring "
+                            "can resonance\n", results['fixed-free'], 20 * working_frequency)
 
         return results
 
@@ -1,9 +1,13 @@
 """A module containing the helical torsion spring class"""
+import logging
 from math import pi
 
 from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
 from me_toolbox.springs import Spring
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools.diagnostics import verbose_option
+
+logger = logging.getLogger(__name__)
 
 
 class HelicalTorsionSpring(Spring):
@@ -66,12 +70,12 @@ class HelicalTorsionSpring(Spring):
         if self.arbor_diameter is None:
             return None
         if self.clearance < 0:
-            print(f"The clearance between the spring and arbor "
-                  f"after tension is applied is negative ({self.clearance})")
+            logger.warning("The clearance between the spring and arbor "
+                           "after tension is applied is negative (%s)", self.clearance)
             return False
         elif self.clearance == 0:
-            print(f"The clearance between the spring and arbor "
-                  f"after tension is applied is zero")
+            logger.warning("The clearance between the spring and arbor "
+                           "after tension is applied is zero")
         else:
             return True
 
@@ -221,18 +225,20 @@ class HelicalTorsionSpring(Spring):
         else:
             raise ValueError(f"Can't calculate weight, no density is specified")
 
+    @verbose_option
     def static_analysis(self, verbose=False):
         """ Returns the static safety factor
 
-        :param bool verbose: Print additional information
+        :param bool verbose: Print additional information (logged with logger.info)
 
         :returns: Spring's safety factor
         :type: float
         """
         if verbose:
-            print(f"Sy={self.yield_strength}, Maximal stress={self.max_stress}")
+            logger.info("Sy=%s, Maximal stress=%s", self.yield_strength, self.max_stress)
         return self.yield_strength / self.max_stress
 
+    @verbose_option
     def fatigue_analysis(self, max_moment, min_moment, fatigue_percent, reliability,
                          criterion='gerber', z=-3, verbose=False):
         """ Returns safety factors for fatigue and
@@ -244,7 +250,7 @@ class HelicalTorsionSpring(Spring):
         :param float reliability: in percentage
         :param str criterion: fatigue criterion ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
-        :param bool verbose: print more details
+        :param bool verbose: print more details (logged with logger.info)
 
         :returns: static and dynamic safety factor
         :rtype: tuple[float, float]
@@ -265,9 +271,9 @@ class HelicalTorsionSpring(Spring):
         nf, nl = FailureCriteria.get_safety_factors(Sy, Sut, Se, alt_stress, mean_stress, criterion)
         N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_stress, alt_stress, Se, Sut, Sy, z)
         if verbose:
-            print(f"Alternating moment = {alt_moment}, Mean moment = {mean_moment}\n\n"
-                  f"Alternating stress = {alt_stress}, Mean stress = {mean_stress}\n\n"
-                  f"Se= {Se}")
+            logger.info("Alternating moment = %s, Mean moment = %s\n\n"
+                        "Alternating stress = %s, Mean stress = %s\n\nSe= %s",
+                        alt_moment, mean_moment, alt_stress, mean_stress, Se)
         return nf, nl, N, Sf
 
     def natural_frequency(self):
@@ -0,0 +1,136 @@
+"""module containing the SpringMaterialTable class, the spring wire materials
+table (Sut = A / d^m) loaded once into arrays indexed by material
+"""
+import os
+
+import numpy as np
+
+from me_toolbox.tools import table_registry
+
+TABLES_DIR = os.path.join(os.path.dirname(__file__), 'tables')
+MATERIALS_TABLE_PATH = os.path.join(TABLES_DIR, "ultimate _tensile_strength.csv")
+
+
+class SpringMaterialTable:
+    """Spring wire materials table, the rows of each material are sorted by
+    diameter so the ultimate tensile strength of many diameters is found in one call
+
+    Note: use SpringMaterialTable.load() to get the (cached) table of the library
+    """
+
+    def __repr__(self):
+        return f"SpringMaterialTable(materials={self.materials})"
+
+    def __init__(self, data):
+        """
+        :param np.ndarray data: structured array with the table columns
+            (type, astm, m, min_d_in, max_d_in, A_in, min_d_mm, max_d_mm, A_mm, relative_cost)
+        """
+        data = np.sort(np.atleast_1d(data), order=['type', 'min_d_mm'], kind='stable')
+        materials = np.char.lower(data['type'].astype(str))
+        names, starts = np.unique(materials, return_index=True)
+        stops = np.append(starts[1:], len(data))
+        self._rows = {name: slice(start, stop) for name, start, stop in
+                      zip(names.tolist(), starts.tolist(), stops.tolist())}
+
+        self.astm = data['astm'].astype(str)
+        self.relative_cost = data['relative_cost'].astype(float)
+        self.m = data['m'].astype(float)
+        self._columns = {True: (data['min_d_mm'].astype(float), data['max_d_mm'].astype(float),
+                                data['A_mm'].astype(float)),
+                         False: (data['min_d_in'].astype(float), data['max_d_in'].astype(float),
+                                 data['A_in'].astype(float))}
+        for array in (self.relative_cost, self.m, *self._columns[True], *self._columns[False]):
+            array.flags.writeable = False
+
+    @staticmethod
+    def read(path):
+        """Read the materials csv file into a structured array
+
+        :param str path: path to the table file
+
+        :rtype: np.ndarray
+        """
+        return np.genfromtxt(path, delimiter=',', names=True, dtype=None, encoding='utf-8')
+
+    @classmethod
+    def load(cls, path=MATERIALS_TABLE_PATH):
+        """Returns the materials table, the file is read only on the first call
+
+        :param str path: path to the table file
+
+        :rtype: SpringMaterialTable
+        """
+        return table_registry.get(path, cls, reader=cls.read)
+
+    @property
+    def materials(self):
+        """Returns the available materials
+
+        :rtype: list[str]
+        """
+        return list(self._rows)
+
+    def diameter_range(self, material, metric=True):
+        """Returns the wire diameter range of the material
+
+        :param str material: The spring's material
+        :param bool metric: Metric or imperial
+
+        :returns: minimum and maximum diameters
+        :rtype: tuple[float, float]
+        """
+        min_d, max_d, _ = self._columns[metric]
+        rows = self._material_rows(material)
+        return float(min_d[rows][0]), float(max_d[rows][-1])
+
+    def lookup(self, material, diameter, metric=True):
+        """Returns the A and m constants of every diameter
+
+        :param str material: The spring's material
+        :param float or np.ndarray diameter: Wire diameters
+        :param bool metric: Metric or imperial
+
+        :returns: A, m and a mask of the diameters that are in the table
+            (A and m are nan where the mask is False)
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        rows = self._material_rows(material)
+        min_d, max_d, A = (column[rows] for column in self._columns[metric])
+        diameter = np.asarray(diameter, dtype=float)
+
+        # the first row that ends after the diameter (as the rows share their edges)
+        index = np.minimum(np.searchsorted(max_d, diameter, side='left'), len(max_d) - 1)
+        mask = (min_d[index] <= diameter) & (diameter <= max_d[index])
+        return (np.where(mask, A[index], np.nan), np.where(mask, self.m[rows][index], np.nan),
+                mask)
+
+    def ultimate_tensile_strength(self, material, diameter, metric=True, return_mask=False):
+        """Returns the ultimate tensile strength estimation (Sut = A / d^m)
+
+        :param str material: The spring's material
+        :param float or np.ndarray diameter: Wire diameters
+        :param bool metric: Metric or imperial
+        :param bool return_mask: if True diameters out of the table range
+            give nan instead of raising ValueError, and a mask of the valid diameters is returned
+
+        :returns: ultimate tensile strength (and the mask)
+        :rtype: np.ndarray or tuple[np.ndarray, np.ndarray]
+
+        :raises KeyError: if the material is unknown
+        :raises ValueError: if a diameter doesn't match any of the values in the table
+        """
+        A, m, mask = self.lookup(material, diameter, metric)
+        Sut = A / np.asarray(diameter, dtype=float) ** m
+        if return_mask:
+            return Sut, mask
+        if not mask.all():
+            raise ValueError("The diameter don't match any of the values in the table")
+        return Sut
+
+    def _material_rows(self, material):
+        """Returns the slice of the material's rows"""
+        try:
+            return self._rows[material.lower()]
+        except KeyError:
+            raise KeyError("The material is unknown") from None
@@ -1,12 +1,16 @@
 """A module containing the spring class"""
-import csv
-import os
+import logging
+
 import numpy as np
 
 from me_toolbox.tools import print_atributes
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools.diagnostics import verbose_option
+from me_toolbox.springs.material_table import SpringMaterialTable
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 class Spring(ABC):
 
     def __repr__(self):
@@ -171,40 +175,27 @@ class Spring(ABC):
         return Ke * (0.5 * Sr) / (1 - (0.5*Sr/Sut)**2)
 
     @staticmethod
+    @verbose_option
     def material_prop(material, diameter, metric=True, verbose=False):
-        """Reads table A_and_m.csv from file and returns the Sut estimation from the material
-         properties Ap and m
+        """Returns the Sut estimation from the material properties A and m
+        (from the ultimate tensile strength table)
         :param str material: The spring's material
-        :param float diameter: Wire diameter
+        :param float or np.ndarray diameter: Wire diameter (or an array of wire diameters)
         :param bool metric: Metric or imperial
-        :param bool verbose: Prints Values of A and m
+        :param bool verbose: Prints Values of A and m (logged with logger.info)
 
         :returns: ultimate tensile strength (Sut)
-        :rtype: float
+        :rtype: float or np.ndarray
         """
 
-        path = os.path.dirname(__file__) + "\\tables\\ultimate _tensile_strength.csv"
-        with open(path, newline='') as file:
-            reader = csv.DictReader(file)
-            table = []
-            available_types = []
-            for line in reader:
-                table.append(line)
-                available_types.append(line['type'])
-
-        for line in table:
-            min_d = float(line['min_d_mm'] if metric else line['min_d_in'])
-            max_d = float(line['max_d_mm'] if metric else line['max_d_in'])
-            if line['type'] == material.lower() and min_d <= diameter <= max_d:
-                A, m = float(line['A_mm'] if metric else line['A_in']), float(line['m'])
-                if verbose:
-                    print(f"A={A}, m={m}")
-                return A / (diameter ** m)
-
-        if material not in available_types:
-            raise KeyError("The material is unknown")
-        else:
-            raise ValueError("The diameter don't match any of the values in the table")
+        # the table is read from disk only once
+        table = SpringMaterialTable.load()
+        if verbose:
+            A, m, _ = table.lookup(material, diameter, metric)
+            logger.info("A=%s, m=%s", A, m)
+
+        Sut = table.ultimate_tensile_strength(material, diameter, metric)
+        return float(Sut) if np.ndim(Sut) == 0 else Sut
 
     @abstractmethod
     def static_analysis(self):
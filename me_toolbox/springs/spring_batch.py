@@ -0,0 +1,399 @@
+"""A module containing the HelicalCompressionSpringBatch class, a structure of arrays
+counterpart of HelicalCompressionSpring for evaluating many spring designs at once
+"""
+from math import pi
+
+import numpy as np
+
+from me_toolbox.fatigue import FailureCriteria, SNCurve
+from me_toolbox.springs.material_table import SpringMaterialTable
+
+END_TYPES = ('plain', 'plain and ground', 'squared or closed', 'squared and ground')
+
+# per end type: end coils, wire diameters added to the solid length,
+# wire diameters subtracted from the free length and coils added for the pitch
+_END_COILS = np.array([0, 1, 2, 2])
+_SOLID_EXTRA = np.array([1, 0, 1, 0])
+_PITCH_LENGTH = np.array([1, 0, 3, 2])
+_PITCH_COILS = np.array([0, 1, 0, 0])
+
+# alpha values from table 10-2
+ANCHORS = {'fixed-fixed': 0.5, 'fixed-hinged': 0.707, 'hinged-hinged': 1, 'clamped-free': 2}
+
+
+class HelicalCompressionSpringBatch:
+    """Many helical push springs, every attribute is an array (or a value broadcast to
+    all the springs) and every calculation is done for all the springs at once
+
+    Note: the calculations are the same as in HelicalCompressionSpring
+
+    .. code-block:: python
+
+        d, D = np.meshgrid([1.5, 2, 2.5], np.linspace(10, 30, 41))
+        springs = HelicalCompressionSpringBatch(max_force=100, wire_diameter=d,
+                                                spring_diameter=D, ..., spring_rate=5)
+        nf, nl, N, Sf = springs.fatigue_analysis(100, 20, reliability=99)
+    """
+
+    def __repr__(self):
+        return f"HelicalCompressionSpringBatch(size={self.size}, shape={self.shape})"
+
+    def __init__(self, max_force, wire_diameter, spring_diameter, ultimate_tensile_strength,
+                 shear_yield_percent, shear_modulus, elastic_modulus, end_type,
+                 spring_rate, set_removed=False, shot_peened=False, density=None, zeta=0.15):
+        """Instantiate a batch of helical push springs, the parameters are arrays
+        (or single values) broadcastable to a common shape
+
+        :param np.ndarray max_force: The maximum load on the springs [N]
+        :param np.ndarray wire_diameter: Springs wire diameter [mm]
+        :param np.ndarray spring_diameter: Springs diameter measured from [mm]
+            the center point of the wire diameter
+        :param np.ndarray ultimate_tensile_strength: Ultimate tensile strength of the material [MPa]
+        :param np.ndarray shear_yield_percent: Yield percent used to estimate shear_yield_stress
+        :param np.ndarray shear_modulus: Shear modulus [MPa]
+        :param np.ndarray or None elastic_modulus: Elastic modulus
+            (used for buckling calculations) [MPa]
+        :param str or np.ndarray end_type: What kind of ending the springs have,
+            the options are: 'plain', 'plain and ground', 'squared or closed', 'squared and ground'
+        :param np.ndarray spring_rate: Spring rate (k) [N/mm]
+        :param np.ndarray set_removed: If True adds to STATIC strength
+            (must NOT use for fatigue application)
+        :param np.ndarray shot_peened: If True adds to fatigue strength
+        :param np.ndarray or None density: Material density
+            (used for finding natural frequency) [kg/m^3]
+        :param np.ndarray zeta: Overrun safety factor
+
+        :returns: Helical Compression Springs batch
+        :rtype: HelicalCompressionSpringBatch
+        """
+        end_type_code = self._end_type_code(end_type)
+        optional = {'elastic_modulus': elastic_modulus, 'density': density}
+        arrays = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in
+              (max_force, wire_diameter, spring_diameter, ultimate_tensile_strength,
+               shear_yield_percent, shear_modulus, spring_rate, zeta)),
+            np.asarray(set_removed, dtype=bool), np.asarray(shot_peened, dtype=bool),
+            end_type_code,
+            *(np.asarray(value, dtype=float) for value in optional.values() if value is not None))
+
+        (self.max_force, self.wire_diameter, self.diameter, self.ultimate_tensile_strength,
+         shear_yield_percent, self.shear_modulus, self.spring_rate, self.zeta,
+         self.set_removed, self.shot_peened, self.end_type_code) = arrays[:11]
+        # percent (>=1) to decimal
+        self.shear_yield_percent = np.where(shear_yield_percent >= 1, shear_yield_percent / 100,
+                                            shear_yield_percent)
+        remaining = iter(arrays[11:])
+        for name, value in optional.items():
+            setattr(self, name, None if value is None else next(remaining))
+
+    @classmethod
+    def from_material(cls, material, max_force, wire_diameter, spring_diameter,
+                      shear_yield_percent, shear_modulus, elastic_modulus, end_type, spring_rate,
+                      set_removed=False, shot_peened=False, density=None, zeta=0.15,
+                      metric=True):
+        """Instantiate a batch of springs estimating the ultimate tensile strength
+        from the material table (see Spring.material_prop)
+
+        :param str material: The springs material
+        :param bool metric: Metric or imperial
+
+        :returns: Helical Compression Springs batch
+        :rtype: HelicalCompressionSpringBatch
+        """
+        Sut = SpringMaterialTable.load().ultimate_tensile_strength(material, wire_diameter,
+                                                                   metric)
+        return cls(max_force, wire_diameter, spring_diameter, Sut, shear_yield_percent,
+                   shear_modulus, elastic_modulus, end_type, spring_rate, set_removed,
+                   shot_peened, density, zeta)
+
+    @staticmethod
+    def calc_spring_rate(wire_diameter, spring_diameter, total_coils, end_type, shear_modulus):
+        """Calculate the springs constants using the geometric properties
+        (used for screening designs by number of coils)
+
+        :param np.ndarray wire_diameter: Springs wire diameter
+        :param np.ndarray spring_diameter: Springs mean diameter
+        :param np.ndarray total_coils: Springs total coils
+        :param str or np.ndarray end_type: The way the springs ends are made
+        :param np.ndarray shear_modulus: The springs material shear modulus
+
+        :rtype: np.ndarray
+        """
+        Na = np.asarray(total_coils) - _END_COILS[
+            HelicalCompressionSpringBatch._end_type_code(end_type)]
+        d = np.asarray(wire_diameter)
+        G = np.asarray(shear_modulus)
+        C = np.asarray(spring_diameter) / d
+        return ((G * d) / (8 * C ** 3 * Na)) * ((2 * C ** 2) / (1 + 2 * C ** 2))
+
+    @staticmethod
+    def _end_type_code(end_type):
+        """Returns the index of the end types in END_TYPES"""
+        end_type = np.char.lower(np.asarray(end_type, dtype=str))
+        codes = np.full(end_type.shape, -1)
+        for code, name in enumerate(END_TYPES):
+            codes[end_type == name] = code
+        if (codes == -1).any():
+            raise ValueError(f"{set(end_type[codes == -1].tolist())} not one of this: "
+                             f"{END_TYPES}")
+        return codes
+
+    @property
+    def shape(self):
+        """The shape of the springs arrays"""
+        return self.wire_diameter.shape
+
+    @property
+    def size(self):
+        """The number of springs"""
+        return self.wire_diameter.size
+
+    @property
+    def end_type(self):
+        """The springs end types
+
+        :rtype: np.ndarray
+        """
+        return np.array(END_TYPES)[self.end_type_code]
+
+    @property
+    def spring_index(self):
+        """C - spring index"""
+        return self.diameter / self.wire_diameter
+
+    @property
+    def inside_diameter(self):
+        """The springs inside diameter"""
+        return self.diameter - self.wire_diameter
+
+    @property
+    def outside_diameter(self):
+        """The springs outside diameter"""
+        return self.diameter + self.wire_diameter
+
+    @property
+    def active_coils(self):
+        """Number of active coils (derived using Castigliano's theorem)"""
+        C = self.spring_index
+        return ((self.shear_modulus * self.wire_diameter) / (8 * C ** 3 * self.spring_rate)) * \
+               ((2 * C ** 2) / (1 + 2 * C ** 2))
+
+    @property
+    def end_coils(self):
+        """Number of the springs end coils (Ne)"""
+        return _END_COILS[self.end_type_code]
+
+    @property
+    def total_coils(self):
+        """Number of the springs total coils (Nt)"""
+        return self.end_coils + self.active_coils
+
+    @property
+    def solid_length(self):
+        """Ls - the solid length of the springs"""
+        return self.wire_diameter * (self.total_coils + _SOLID_EXTRA[self.end_type_code])
+
+    @property
+    def Fsolid(self):  # pylint: disable=invalid-name
+        """The max_force it takes to get the springs to solid length (Fs=(1+zeta)Fmax)"""
+        return (1 + self.zeta) * self.max_force
+
+    @property
+    def free_length(self):
+        """The free length of the springs"""
+        return (self.Fsolid / self.spring_rate) + self.solid_length
+
+    @property
+    def pitch(self):
+        """The springs pitch (the distance between the coils)"""
+        return (self.free_length - _PITCH_LENGTH[self.end_type_code] * self.wire_diameter) / \
+               (self.active_coils + _PITCH_COILS[self.end_type_code])
+
+    @property
+    def shear_yield_strength(self):
+        """The material shear yield strength (Ssy)"""
+        return self.shear_yield_percent * self.ultimate_tensile_strength
+
+    @property
+    def shear_ultimate_strength(self):
+        """Ssu - ultimate tensile strength for shear"""
+        return 0.67 * self.ultimate_tensile_strength
+
+    @property
+    def factor_Ks(self):  # pylint: disable=invalid-name
+        """Static shear stress concentration factor"""
+        return (2 * self.spring_index + 1) / (2 * self.spring_index)
+
+    @property
+    def factor_Kw(self):  # pylint: disable=invalid-name
+        """Wahl shear stress concentration factor (K_W)"""
+        C = self.spring_index
+        return (4 * C - 1) / (4 * C - 4) + (0.615 / C)
+
+    @property
+    def factor_KB(self):  # pylint: disable=invalid-name
+        """Bergstrasser shear stress concentration factor(K_B) (very close to factor_Kw)"""
+        return (4 * self.spring_index + 2) / (4 * self.spring_index - 3)
+
+    @property
+    def k_factor(self):
+        """The shear stress concentration factor in use (Ks if the set is removed else Kw)"""
+        return np.where(self.set_removed, self.factor_Ks, self.factor_Kw)
+
+    @property
+    def max_shear_stress(self):
+        """The maximum shear stress"""
+        return self.calc_shear_stress(self.max_force)
+
+    def calc_shear_stress(self, force, k_factor=None):
+        """Calculates the shear stress based on the force applied
+
+        :param np.ndarray force: Force in [N]
+        :param np.ndarray k_factor: The appropriate k factor for the calculation
+            (default: k_factor)
+        """
+        k_factor = self.k_factor if k_factor is None else k_factor
+        return (k_factor * 8 * force * self.diameter) / (pi * self.wire_diameter ** 3)
+
+    @property
+    def max_deflection(self):
+        """The springs maximum deflection (change in length)"""
+        return self.calc_deflection(self.max_force)
+
+    def calc_deflection(self, force):
+        """Calculate the springs deflection (change in length) due to specific force
+
+        :param np.ndarray force: Force in [N]
+        """
+        C = self.spring_index
+        return ((8 * force * C ** 3 * self.active_coils) / (self.shear_modulus *
+                                                            self.wire_diameter)) * \
+            ((1 + 2 * C ** 2) / (2 * C ** 2))
+
+    @property
+    def weight(self):
+        """The springs weight according to their density"""
+        if self.density is None:
+            raise ValueError("Can't calculate weight, no density is specified")
+        area = 0.25 * pi * (self.wire_diameter * 1e-3) ** 2  # cross-section area
+        length = pi * self.diameter * 1e-3  # the circumference of the spring
+        return area * length * self.total_coils * self.density
+
+    def shear_endurance_limit(self, reliability=50, metric=True):
+        """Sse - Shear endurance limit according to Zimmerli
+
+        :param float reliability: reliability in percentage
+        :param bool metric: metric or imperial
+        """
+        percentage = np.array([50, 90, 95, 99, 99.9, 99.99, 99.999, 99.9999])
+        reliability_factors = np.array([1, 0.897, 0.868, 0.814, 0.753, 0.702, 0.659, 0.620])
+        Ke = np.interp(reliability, percentage, reliability_factors)
+
+        if metric:
+            Ssa = np.where(self.shot_peened, 398, 241)
+            Ssm = np.where(self.shot_peened, 534, 379)
+        else:
+            Ssa = np.where(self.shot_peened, 57.5e3, 35e3)
+            Ssm = np.where(self.shot_peened, 77.5e3, 55e3)
+
+        return Ke * (Ssa / (1 - (Ssm / self.shear_ultimate_strength) ** 2))
+
+    def check_design(self):
+        """Returns a mask of the springs that are in the acceptable range for good design
+        (spring index, active coils and zeta)
+
+        :rtype: np.ndarray
+        """
+        C = self.spring_index
+        Na = self.active_coils
+        C_min = np.where(self.set_removed, 4, 3)
+        return (C_min <= C) & (C <= 12) & (3 <= Na) & (Na <= 15) & (self.zeta >= 0.15)
+
+    def static_analysis(self, solid=False):
+        """Returns the static safety factors
+
+        :param bool solid: If true use the Fsolid instead of Fmax
+        """
+        force = self.Fsolid if solid else self.max_force
+        return self.shear_yield_strength / self.calc_shear_stress(force)
+
+    def fatigue_analysis(self, max_force, min_force, reliability,
+                         criterion='modified goodman', z=-3, metric=True):
+        """Returns safety factors for fatigue and for first cycle according to Langer
+        failure criteria, the number of cycles until failure and the fatigue strength
+
+        :param np.ndarray max_force: Maximal force acting on the springs
+        :param np.ndarray min_force: Minimal force acting on the springs
+        :param float reliability: in percentage
+        :param str criterion: fatigue criterion
+            ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+            -5.69 for metal where N=5e8
+        :param bool metric: Metric or imperial
+
+        :returns: fatigue and static (first cycle) safety factors, number of cycles
+            until failure and the fatigue strength (nan where there is no failure point)
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        """
+        max_force, min_force = np.asarray(max_force), np.asarray(min_force)
+        if np.any(max_force == min_force):
+            raise ValueError("max_force can't equal the min_force")
+        alternating_force = np.abs(max_force - min_force) / 2
+        mean_force = (max_force + min_force) / 2
+
+        alt_shear_stress = self.calc_shear_stress(alternating_force)
+        mean_shear_stress = self.calc_shear_stress(mean_force)
+
+        Sse = self.shear_endurance_limit(reliability, metric)
+        Ssu = self.shear_ultimate_strength
+        Ssy = self.shear_yield_strength
+        nf, nl = FailureCriteria.get_safety_factors_array(Ssy, Ssu, Sse, alt_shear_stress,
+                                                          mean_shear_stress, criterion)
+        N, Sf = SNCurve(Ssu, Sse, Ssy, z).num_of_cycles(alt_shear_stress, mean_shear_stress)
+        return nf, nl, N, Sf
+
+    def buckling(self, anchors):
+        """Checks which springs will buckle and the maximum free length to avoid buckling
+
+        :param str anchors: How the springs are anchored
+            ('fixed-fixed', 'fixed-hinged', 'hinged-hinged', 'clamped-free')
+
+        :returns: buckling mask and the maximum safe length (free_length)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        if self.elastic_modulus is None:
+            raise ValueError("Can't check buckling, no elastic modulus is specified")
+        try:
+            alpha = ANCHORS[anchors.lower()]
+        except KeyError:
+            raise KeyError(f"Ends: {anchors} is unknown") from None
+        E, G = self.elastic_modulus, self.shear_modulus
+        with np.errstate(invalid='ignore'):
+            max_safe_length = (pi * self.diameter / alpha) * np.sqrt((2 * (E - G)) / (2 * G + E))
+        return self.free_length >= max_safe_length, max_safe_length
+
+    def natural_frequency(self, density=None):
+        """Returns the natural frequency of the springs
+
+        :param np.ndarray density: Springs material density (default: density)
+
+        :returns: natural frequency for fixed-fixed and fixed-free ends
+        :rtype: dict[str, np.ndarray]
+        """
+        density = self.density if density is None else density
+        if density is None:
+            raise ValueError("Can't calculate the natural frequency, no density is specified")
+        frequency = ((self.wire_diameter * 1e-3) /
+                     (pi * (self.diameter * 1e-3) ** 2 * self.active_coils)) * \
+            np.sqrt(self.shear_modulus / (2 * density))
+        return {'fixed-fixed': frequency / 2, 'fixed-free': frequency / 4}
+
+    def __getitem__(self, index):
+        """Returns the springs at the index as a new batch"""
+        batch = object.__new__(type(self))
+        for name, value in vars(self).items():
+            setattr(batch, name, None if value is None else value[index])
+        return batch
+
+    def __len__(self):
+        return len(self.wire_diameter)
@@ -0,0 +1,148 @@
+"""Module containing a vectorized design search for helical compression springs"""
+# pylint: disable=invalid-name
+from math import pi
+
+import numpy as np
+
+from me_toolbox.springs.material_table import SpringMaterialTable
+from me_toolbox.springs.spring_batch import HelicalCompressionSpringBatch, END_TYPES
+from me_toolbox.tools.pareto import pareto_front
+
+# preferred metric wire diameters [mm] (Shigley table A-17)
+STANDARD_WIRE_DIAMETERS = (0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5, 0.55, 0.6, 0.65, 0.7, 0.8,
+                           0.9, 1, 1.1, 1.2, 1.4, 1.6, 1.8, 2, 2.2, 2.5, 2.8, 3, 3.5, 4, 4.5, 5,
+                           5.5, 6, 6.5, 7, 8, 9, 10, 11, 12, 14, 16)
+
+# the recommended spring index and active coils ranges (see HelicalCompressionSpring checks)
+SPRING_INDEX_RANGE = (4, 12)
+ACTIVE_COILS_RANGE = (3, 15)
+
+
+def spring_search(material, max_force, min_force, spring_rate, shear_yield_percent,
+                  shear_modulus, elastic_modulus, density, rate_tolerance=0.05,
+                  fatigue_safety_factor=1.0, static_safety_factor=1.2, reliability=50,
+                  criterion='modified goodman', anchors=None, working_frequency=None,
+                  max_outside_diameter=None, min_inside_diameter=None, max_solid_length=None,
+                  max_free_length=None, wire_diameters=None, spring_indices=None,
+                  active_coils=None, end_types=END_TYPES, set_removed=False, shot_peened=False,
+                  zeta=0.15, metric=True):
+    """Search the (wire diameter, spring index, active coils, end type) grid for helical
+    compression springs with the required spring rate and return the Pareto set
+    of weight against fatigue safety factor
+
+    The infeasible candidates are pruned in stages, so the fatigue analysis is done
+    only for the remaining candidates:
+    1. wire diameter and spring index: material table range, diameters and static
+       safety factor at solid length
+    2. active coils: spring rate within the tolerance
+    3. end type: solid and free lengths
+    4. fatigue and first cycle safety factors, buckling and natural frequency
+
+    :param str material: The springs material (see Spring.material_prop)
+    :param float max_force: Maximal force acting on the spring [N]
+    :param float min_force: Minimal force acting on the spring [N]
+    :param float spring_rate: The required spring rate [N/mm]
+    :param float shear_yield_percent: Yield percent used to estimate shear_yield_stress
+    :param float shear_modulus: Shear modulus [MPa]
+    :param float elastic_modulus: Elastic modulus [MPa]
+    :param float density: Material density [kg/m^3]
+    :param float rate_tolerance: allowed relative deviation from the spring rate
+    :param float fatigue_safety_factor: minimal fatigue safety factor
+    :param float static_safety_factor: minimal static safety factor at solid length
+    :param float reliability: in percentage
+    :param str criterion: fatigue criterion
+        ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
+    :param str or None anchors: How the spring is anchored, if None buckling is not checked
+        ('fixed-fixed', 'fixed-hinged', 'hinged-hinged', 'clamped-free')
+    :param float or None working_frequency: if given, the natural frequency for fixed ends
+        must be larger than 20*working_frequency
+    :param float or None max_outside_diameter: maximal outside diameter (e.g. a hole) [mm]
+    :param float or None min_inside_diameter: minimal inside diameter (e.g. a rod) [mm]
+    :param float or None max_solid_length: maximal solid length [mm]
+    :param float or None max_free_length: maximal free length [mm]
+    :param list wire_diameters: wire diameters to check (default: preferred metric sizes)
+    :param list spring_indices: spring indexes to check (default: 4 to 12 in steps of 0.1)
+    :param list active_coils: active coils to check (default: 3 to 15 in steps of 0.25)
+    :param list end_types: end types to check (default: all end types)
+    :param bool set_removed: If True adds to STATIC strength
+    :param bool shot_peened: If True adds to fatigue strength
+    :param float zeta: Overrun safety factor
+    :param bool metric: Metric or imperial
+
+    :returns: The Pareto set sorted by weight and the arrays of all the feasible candidates
+        (d, D, C, Na, end_type, k, free_length, solid_length, weight, ns, nf, nl)
+    :rtype: tuple[list[dict], dict[str, np.ndarray]]
+    """
+    if wire_diameters is None:
+        if not metric:
+            raise ValueError("the standard wire diameters are metric, "
+                             "wire_diameters must be given for imperial units")
+        wire_diameters = STANDARD_WIRE_DIAMETERS
+    if spring_indices is None:
+        spring_indices = np.arange(40, 121) / 10
+    if active_coils is None:
+        active_coils = np.arange(12, 61) / 4
+    shear_yield_percent = shear_yield_percent / 100 if shear_yield_percent >= 1 else \
+        shear_yield_percent
+
+    # stage 1 - wire diameter and spring index
+    d, C = (grid.ravel() for grid in np.meshgrid(np.asarray(wire_diameters, dtype=float),
+                                                  np.asarray(spring_indices, dtype=float),
+                                                  indexing='ij'))
+    D = C * d
+    Sut, feasible = SpringMaterialTable.load().ultimate_tensile_strength(material, d, metric,
+                                                                        return_mask=True)
+    feasible &= (SPRING_INDEX_RANGE[0] <= C) & (C <= SPRING_INDEX_RANGE[1])
+    if max_outside_diameter is not None:
+        feasible &= D + d <= max_outside_diameter
+    if min_inside_diameter is not None:
+        feasible &= D - d >= min_inside_diameter
+    K = (2 * C + 1) / (2 * C) if set_removed else (4 * C - 1) / (4 * C - 4) + (0.615 / C)
+    with np.errstate(invalid='ignore'):
+        ns = (shear_yield_percent * Sut) / ((K * 8 * (1 + zeta) * max_force * D) / (pi * d ** 3))
+        feasible &= ns >= static_safety_factor
+    d, C, D, Sut, ns = (array[feasible] for array in (d, C, D, Sut, ns))
+
+    # stage 2 - active coils
+    Na = np.tile(np.asarray(active_coils, dtype=float), d.size)
+    d, C, D, Sut, ns = (np.repeat(array, len(active_coils)) for array in (d, C, D, Sut, ns))
+    k = ((shear_modulus * d) / (8 * C ** 3 * Na)) * ((2 * C ** 2) / (1 + 2 * C ** 2))
+    feasible = (np.abs(k - spring_rate) <= rate_tolerance * spring_rate) & \
+               (ACTIVE_COILS_RANGE[0] <= Na) & (Na <= ACTIVE_COILS_RANGE[1])
+    d, C, D, Sut, ns, Na, k = (array[feasible] for array in (d, C, D, Sut, ns, Na, k))
+
+    # stage 3 - end types (the spring rate of the candidate is used so Na is kept)
+    end_type = np.tile(np.asarray(end_types), d.size)
+    d, C, D, Sut, ns, Na, k = (np.repeat(array, len(end_types))
+                               for array in (d, C, D, Sut, ns, Na, k))
+    springs = HelicalCompressionSpringBatch(
+        max_force, d, D, Sut, shear_yield_percent, shear_modulus, elastic_modulus, end_type, k,
+        set_removed=set_removed, shot_peened=shot_peened, density=density, zeta=zeta)
+    feasible = np.ones(d.shape, dtype=bool)
+    if max_solid_length is not None:
+        feasible &= springs.solid_length <= max_solid_length
+    if max_free_length is not None:
+        feasible &= springs.free_length <= max_free_length
+    springs, ns, Na = springs[feasible], ns[feasible], Na[feasible]
+
+    # stage 4 - fatigue, buckling and natural frequency
+    nf, nl, _, _ = springs.fatigue_analysis(max_force, min_force, reliability, criterion,
+                                            metric=metric)
+    feasible = (nf >= fatigue_safety_factor) & (nl >= 1)
+    if anchors is not None:
+        buckles, _ = springs.buckling(anchors)
+        feasible &= ~buckles
+    if working_frequency is not None:
+        feasible &= springs.natural_frequency()['fixed-fixed'] > 20 * working_frequency
+    springs = springs[feasible]
+
+    candidates = {'d': springs.wire_diameter, 'D': springs.diameter, 'C': springs.spring_index,
+                  'Na': Na[feasible], 'end_type': springs.end_type, 'k': springs.spring_rate,
+                  'free_length': springs.free_length, 'solid_length': springs.solid_length,
+                  'weight': springs.weight, 'ns': ns[feasible], 'nf': nf[feasible],
+                  'nl': nl[feasible]}
+
+    front = pareto_front(np.column_stack((candidates['weight'], -candidates['nf'])))
+    front = front[np.argsort(candidates['weight'][front], kind='stable')]
+    pareto = [{key: value[index].item() for key, value in candidates.items()} for index in front]
+    return pareto, candidates
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.springs import Spring
+from me_toolbox.springs.material_table import SpringMaterialTable
+
+
+class TestSpringMaterialTable(TestCase):
+    def setUp(self):
+        self.table = SpringMaterialTable.load()
+
+    def test_loaded_once(self):
+        self.assertIs(SpringMaterialTable.load(), self.table)
+
+    def test_vectorized_matches_scalar(self):
+        diameters = np.array([0.3, 1.2, 2.5, 3, 5, 8.7])
+        Sut = Spring.material_prop('302 stainless wire', diameters)
+        for d, expected in zip(diameters, Sut):
+            self.assertAlmostEqual(Spring.material_prop('302 stainless wire', d), expected)
+
+    def test_shared_edges(self):
+        # at a shared edge the first (smaller diameters) row is used
+        self.assertAlmostEqual(Spring.material_prop('302 stainless wire', 2.5),
+                               1867 / 2.5 ** 0.146)
+        self.assertAlmostEqual(Spring.material_prop('302 stainless wire', 0.1, metric=False),
+                               169 / 0.1 ** 0.146)
+
+    def test_diameter_range(self):
+        self.assertEqual(self.table.diameter_range('Phosphore-Bronze Wire'), (0.1, 7.5))
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            Spring.material_prop('music wire', [1, 7])
+        Sut, mask = self.table.ultimate_tensile_strength('music wire', [1, 7], return_mask=True)
+        np.testing.assert_array_equal(mask, [True, False])
+        self.assertTrue(np.isnan(Sut[1]))
+        with self.assertRaises(KeyError):
+            Spring.material_prop('unobtainium', 1)
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.springs import HelicalCompressionSpring, HelicalCompressionSpringBatch, Spring
+
+
+class TestHelicalCompressionSpringBatch(unittest.TestCase):
+    def setUp(self):
+        self.designs = [(6, 50, 'squared and ground', 6, False, True),
+                        (4, 30, 'plain', 4, True, False),
+                        (5, 40, 'plain and ground', 8, False, False),
+                        (3, 25, 'squared or closed', 3, False, True)]
+        self.springs = []
+        for d, D, ends, k, removed_set, peened in self.designs:
+            Sut = Spring.material_prop('music wire', d, metric=True, verbose=False)
+            self.springs.append(HelicalCompressionSpring(
+                max_force=500, wire_diameter=d, spring_diameter=D,
+                ultimate_tensile_strength=Sut, shear_yield_percent=45, shear_modulus=75e3,
+                elastic_modulus=205e3, end_type=ends, spring_rate=k, set_removed=removed_set,
+                shot_peened=peened, density=7800, zeta=0.25))
+
+        d, D, ends, k, removed_set, peened = (np.array(column) for column in zip(*self.designs))
+        self.batch = HelicalCompressionSpringBatch.from_material(
+            'music wire', max_force=500, wire_diameter=d, spring_diameter=D,
+            shear_yield_percent=45, shear_modulus=75e3, elastic_modulus=205e3, end_type=ends,
+            spring_rate=k, set_removed=removed_set, shot_peened=peened, density=7800, zeta=0.25)
+
+    def test_properties(self):
+        for name in ('spring_index', 'factor_Kw', 'factor_KB', 'max_shear_stress',
+                     'solid_length', 'Fsolid', 'free_length', 'pitch', 'active_coils',
+                     'total_coils', 'shear_yield_strength', 'max_deflection', 'weight'):
+            expected = [getattr(spring, name) for spring in self.springs]
+            np.testing.assert_allclose(getattr(self.batch, name), expected, err_msg=name)
+
+    def test_static_analysis(self):
+        for solid in (False, True):
+            expected = [spring.static_analysis(solid) for spring in self.springs]
+            np.testing.assert_allclose(self.batch.static_analysis(solid), expected)
+
+    def test_fatigue_analysis(self):
+        nf, nl, N, Sf = self.batch.fatigue_analysis(500, 100, reliability=99.999)
+        for i, spring in enumerate(self.springs):
+            expected_nf, expected_nl, expected_N, expected_Sf = spring.fatigue_analysis(
+                500, 100, 99.999)
+            self.assertAlmostEqual(nf[i], expected_nf)
+            self.assertAlmostEqual(nl[i], expected_nl)
+            self.assertAlmostEqual(N[i], expected_N)
+            if expected_Sf is None:
+                self.assertTrue(np.isnan(Sf[i]))
+            else:
+                self.assertAlmostEqual(Sf[i], expected_Sf)
+
+    def test_buckling(self):
+        buckles, max_safe_length = self.batch.buckling('fixed-hinged')
+        for i, spring in enumerate(self.springs):
+            expected_buckles, expected_length = spring.buckling('fixed-hinged')
+            self.assertEqual(buckles[i], expected_buckles)
+            self.assertAlmostEqual(max_safe_length[i], expected_length)
+
+    def test_natural_frequency(self):
+        result = self.batch.natural_frequency()
+        for i, spring in enumerate(self.springs):
+            expected = spring.natural_frequency(7800, 0.0005)
+            for ends, value in expected.items():
+                self.assertAlmostEqual(result[ends][i], value)
+
+    def test_calc_spring_rate(self):
+        d, D, ends = (np.array(column) for column in list(zip(*self.designs))[:3])
+        k = HelicalCompressionSpringBatch.calc_spring_rate(d, D, self.batch.total_coils, ends,
+                                                          75e3)
+        np.testing.assert_allclose(k, self.batch.spring_rate)
+
+    def test_check_design(self):
+        expected = [spring.check_design() for spring in self.springs]
+        np.testing.assert_array_equal(self.batch.check_design(), expected)
+
+    def test_unknown_end_type(self):
+        with self.assertRaises(ValueError):
+            HelicalCompressionSpringBatch(500, 6, 50, 1500, 0.45, 75e3, 205e3, 'hooked', 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.springs import HelicalCompressionSpring, Spring
+from me_toolbox.springs.spring_optimizer import spring_search
+
+
+class TestSpringSearch(unittest.TestCase):
+    def setUp(self):
+        self.pareto, self.candidates = spring_search(
+            'music wire', max_force=500, min_force=100, spring_rate=6, shear_yield_percent=45,
+            shear_modulus=75e3, elastic_modulus=205e3, density=7800,
+            fatigue_safety_factor=1.2, reliability=99, anchors='fixed-hinged',
+            max_free_length=200, shot_peened=True)
+
+    def test_constraints(self):
+        candidates = self.candidates
+        self.assertGreater(len(candidates['d']), 0)
+        self.assertTrue(np.all((4 <= candidates['C']) & (candidates['C'] <= 12)))
+        self.assertTrue(np.all(np.abs(candidates['k'] - 6) <= 0.05 * 6))
+        self.assertTrue(np.all(candidates['nf'] >= 1.2))
+        self.assertTrue(np.all(candidates['ns'] >= 1.2))
+        self.assertTrue(np.all(candidates['free_length'] <= 200))
+
+    def test_pareto_front(self):
+        weights = [design['weight'] for design in self.pareto]
+        safety_factors = [design['nf'] for design in self.pareto]
+        self.assertEqual(weights, sorted(weights))
+        # a heavier spring on the front must have a larger safety factor
+        self.assertTrue(np.all(np.diff(safety_factors) > 0))
+        self.assertEqual(min(weights), self.candidates['weight'].min())
+
+    def test_matches_scalar_analysis(self):
+        design = self.pareto[0]
+        spring = HelicalCompressionSpring(
+            max_force=500, wire_diameter=design['d'], spring_diameter=design['D'],
+            ultimate_tensile_strength=Spring.material_prop('music wire', design['d']),
+            shear_yield_percent=45, shear_modulus=75e3, elastic_modulus=205e3,
+            end_type=design['end_type'], spring_rate=design['k'], shot_peened=True,
+            density=7800)
+        nf, _, _, _ = spring.fatigue_analysis(500, 100, reliability=99)
+        self.assertAlmostEqual(spring.active_coils, design['Na'])
+        self.assertAlmostEqual(spring.weight, design['weight'])
+        self.assertAlmostEqual(nf, design['nf'])
+        self.assertAlmostEqual(spring.static_analysis(solid=True), design['ns'])
+        self.assertFalse(spring.buckling('fixed-hinged')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,22 @@
+from me_toolbox._lazy import attach
+
+# imported eagerly because the function has the same name as its module
 from me_toolbox.tools.table_interpolation import table_interpolation
-from me_toolbox.tools.table_interpolation import NotInRangeError
-from me_toolbox.tools.helpers import *
-from me_toolbox.tools.stress import *
\ No newline at end of file
+
+__getattr__, __dir__, __all__ = attach(__name__, submodule_attrs={
+    'table_interpolation': ['TableInterpolator', 'NotInRangeError'],
+    'helpers': ['print_atributes', 'parse_input', 'conversion', 'lbs_per_in_to_newtons_per_mm',
+                'newtons_per_mm_to_lbs_per_in', 'lbs_to_newtons', 'newtons_to_lbs',
+                'inch_to_millimetre', 'millimetre_to_inch', 'Nmm_per_rad_to_Nmm_per_deg',
+                'Nmm_per_deg_to_Nmm_per_rad', 'Nm_per_rad_to_Nmm_per_deg',
+                'Nmm_per_deg_to_Nm_per_rad', 'percent_to_decimal', 'pol2cart'],
+    'stress': ['uniform_stress', 'bending_stress', 'shear_bending_stress', 'torsion_stress',
+               'max_shear_stress'],
+    'table_registry': ['TableRegistry', 'table_registry'],
+    'caching': ['dependent_property', 'clear_cache'],
+    'backend': ['use_symbolic', 'is_symbolic', 'symbolic'],
+    'pareto': ['pareto_front'],
+    'profiling': ['record', 'Recording'],
+    'diagnostics': ['log_to_console', 'capture', 'verbose_output', 'verbose_option'],
+})
+__all__.append('table_interpolation')
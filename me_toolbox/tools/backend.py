@@ -0,0 +1,73 @@
+"""module containing the numeric backend used by the calculations,
+by default the calculations are done with floats (or numpy arrays),
+symbolic calculations (using sympy) are enabled with use_symbolic()
+
+Note: the mode is kept in a context variable, enabling it affects only the current thread
+(or asyncio task), the calculations of other threads stay numeric
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+import math
+
+import numpy as np
+
+_symbolic = ContextVar('me_toolbox_symbolic', default=False)
+
+
+def use_symbolic(enabled=True):
+    """Enable (or disable) the symbolic mode of the current thread (or asyncio task),
+    in symbolic mode the calculations accept sympy expressions
+    (e.g. a stress as function of a symbolic max_force)
+
+    Note: sympy is imported only when the symbolic mode is used
+
+    :param bool enabled: True for symbolic mode, False for numeric mode
+    """
+    if enabled:
+        import sympy  # pylint: disable=import-outside-toplevel,unused-import
+    _symbolic.set(enabled)
+
+
+def is_symbolic():
+    """Returns True if the symbolic mode is enabled (in the current thread)
+
+    :rtype: bool
+    """
+    return _symbolic.get()
+
+
+@contextmanager
+def symbolic():
+    """Context manager enabling the symbolic mode inside a with block
+
+    .. code-block:: python
+
+        with symbolic():
+            nF = fatigue_analysis.modified_goodman
+    """
+    import sympy  # pylint: disable=import-outside-toplevel,unused-import
+    token = _symbolic.set(True)
+    try:
+        yield
+    finally:
+        _symbolic.reset(token)
+
+
+def sqrt(value):
+    """Square root of a float, a numpy array or (in symbolic mode) a sympy expression
+
+    :param float or np.ndarray value: the value
+
+    :returns: The square root of the value
+    :rtype: float or np.ndarray
+    """
+    if _symbolic.get():
+        from sympy import sqrt as sympy_sqrt  # pylint: disable=import-outside-toplevel
+        return sympy_sqrt(value)
+    if isinstance(value, np.ndarray):
+        return np.sqrt(value)
+    try:
+        return math.sqrt(value)
+    except TypeError as err:
+        raise TypeError(f"{err}, for symbolic expressions enable the symbolic mode "
+                        f"with me_toolbox.tools.backend.use_symbolic()") from err
@@ -0,0 +1,95 @@
+"""module containing the dependent_property decorator, a property that is
+recalculated only when one of the attributes it depends on changes"""
+from weakref import WeakKeyDictionary
+
+_MISSING = object()
+
+
+class DependentProperty:
+    """Read-only property that caches its value per instance together with the values
+    of its dependencies, the value is recalculated only if one of them changed
+
+    Note: the cache is kept outside the instance so it doesn't appear in the
+    instance's __dict__ (and isn't pickled or copied with it)
+    """
+
+    def __init__(self, func, dependencies):
+        self.func = func
+        self.dependencies = tuple(dependency.split('.') for dependency in dependencies)
+        self.__doc__ = func.__doc__
+        self.name = func.__name__
+        self._cache = WeakKeyDictionary()
+
+    def __repr__(self):
+        names = ', '.join('.'.join(dependency) for dependency in self.dependencies)
+        return f"DependentProperty({self.name}, dependencies=({names}))"
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        key = self._dependencies_values(instance)
+        cached_key, value = self._cache.get(instance, (_MISSING, None))
+        try:
+            if cached_key == key:
+                return value
+        except (ValueError, TypeError):
+            # dependencies values that can't be compared (e.g. arrays) are never cached
+            return self.func(instance)
+
+        value = self.func(instance)
+        self._cache[instance] = (key, value)
+        return value
+
+    def __set__(self, instance, value):
+        raise AttributeError(f"can't set attribute '{self.name}'")
+
+    def _dependencies_values(self, instance):
+        """Returns the current values of the dependencies (None for missing attributes)"""
+        values = []
+        for dependency in self.dependencies:
+            value = instance
+            for attribute in dependency:
+                value = getattr(value, attribute, None)
+            values.append(value)
+        return tuple(values)
+
+    def invalidate(self, instance):
+        """Remove the cached value of the instance"""
+        self._cache.pop(instance, None)
+
+
+def dependent_property(*dependencies):
+    """Decorator turning a method into a cached read-only property,
+    the value is recalculated only when one of the dependencies changes
+
+    .. code-block:: python
+
+        class Gear:
+            @dependent_property('modulus', 'teeth_num')
+            def pitch_diameter(self):
+                return self.modulus * self.teeth_num
+
+    :param str dependencies: names of the attributes the property depends on,
+        dotted names (e.g. 'gear1.material') are used for attributes of attributes
+
+    :returns: property decorator
+    :rtype: callable
+    """
+    def decorator(func):
+        return DependentProperty(func, dependencies)
+    return decorator
+
+
+def clear_cache(obj):
+    """Remove all the cached dependent property values of obj
+
+    :param obj: object with dependent properties
+    """
+    for cls in type(obj).__mro__:
+        for attribute in vars(cls).values():
+            if isinstance(attribute, DependentProperty):
+                attribute.invalidate(obj)
@@ -0,0 +1,181 @@
+"""module containing the library's diagnostics helpers, the calculations report warnings
+(e.g. a gear width that doesn't converge) and the verbose stages through the standard
+logging module under the 'me_toolbox' logger, which is silent unless configured
+
+.. code-block:: python
+
+    from me_toolbox.tools.diagnostics import log_to_console, capture
+
+    log_to_console()  # show the warnings (and info records with level=logging.INFO)
+
+    with capture() as records:
+        gearbox.optimize(pinion)
+    messages = [record.getMessage() for record in records]
+
+Note: the messages are formatted lazily, when the logger is disabled (the default)
+a diagnostic costs only a level check. capture and verbose_output don't reconfigure the
+logger per call, they set context variables (per thread or asyncio task). Their first use
+installs, once, a handler printing/collecting the records of the current context and a
+filter on the library's loggers which keeps the other records at the configured level
+(the logger's level is then DEBUG, so the info records are created and filtered)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import inspect
+import logging
+import pkgutil
+import sys
+import threading
+
+LOGGER_NAME = 'me_toolbox'
+
+_CONSOLE_FORMAT = '%(levelname)s:%(name)s: %(message)s'
+
+# the verbose flag and the active captures (records, level, name) of the current context
+_verbose = ContextVar('me_toolbox_verbose', default=False)
+_captures = ContextVar('me_toolbox_captures', default=())
+
+_install_lock = threading.Lock()
+_installed = False
+# the level configured for the library's logger before the install (None - the root's level)
+_level = None
+
+
+def _configured_level():
+    return logging.getLogger().getEffectiveLevel() if _level is None else _level
+
+
+def _context_level():
+    """The minimal level requested by the with blocks of the current context
+    (None - outside the blocks)"""
+    levels = [level for _, level, _ in _captures.get()]
+    if _verbose.get():
+        levels.append(logging.INFO)
+    return min(levels, default=None)
+
+
+class _ContextFilter(logging.Filter):
+    """Filter of the library's loggers, passes the records above the configured level and
+    the records requested by the with blocks of the current context"""
+    def filter(self, record):
+        level = _context_level()
+        if level is not None and record.levelno >= level:
+            return True
+        return record.levelno >= _configured_level()
+
+
+class _ContextHandler(logging.Handler):
+    """Handler printing or collecting the records of the current context"""
+    def emit(self, record):
+        try:
+            if _verbose.get() and record.levelno >= logging.INFO:
+                sys.stdout.write(record.getMessage() + '\n')
+            for records, level, name in _captures.get():
+                if record.levelno >= level and (record.name == name or
+                                                record.name.startswith(name + '.')):
+                    records.append(record)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+def _install():
+    """Add the context handler and filter to the library's loggers (once)"""
+    global _installed, _level  # pylint: disable=global-statement
+    with _install_lock:
+        if _installed:
+            return
+        import me_toolbox  # pylint: disable=import-outside-toplevel
+        context_filter = _ContextFilter()
+        names = [LOGGER_NAME] + [module.name for module in
+                                 pkgutil.walk_packages(me_toolbox.__path__, LOGGER_NAME + '.')]
+        for name in names:
+            logging.getLogger(name).addFilter(context_filter)
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.addHandler(_ContextHandler())
+        _level = logger.level or None
+        logger.setLevel(logging.DEBUG)
+        _installed = True
+
+
+def log_to_console(level=logging.WARNING, stream=None, fmt=_CONSOLE_FORMAT):
+    """Print the library's diagnostics to the console
+
+    :param int level: The minimal level printed (logging.WARNING/INFO/DEBUG)
+    :param stream: The output stream (default: sys.stderr)
+    :param str fmt: The records format
+
+    :returns: The added handler (remove it with
+        logging.getLogger('me_toolbox').removeHandler(handler))
+    :rtype: logging.StreamHandler
+    """
+    global _level  # pylint: disable=global-statement
+    logger = logging.getLogger(LOGGER_NAME)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    handler.setLevel(level)
+    logger.addHandler(handler)
+    with _install_lock:
+        if _installed:
+            _level = min(_configured_level(), level)
+        elif logger.getEffectiveLevel() > level:
+            logger.setLevel(level)
+    return handler
+
+
+@contextmanager
+def capture(level=logging.WARNING, name=LOGGER_NAME):
+    """Collect the diagnostics records of the current thread inside a with block
+
+    :param int level: The minimal level collected
+    :param str name: The logger name (e.g. 'me_toolbox.gears' for the gears only)
+
+    :returns: The records list (filled while the block runs)
+    :rtype: list[logging.LogRecord]
+    """
+    _install()
+    records = []
+    token = _captures.set(_captures.get() + ((records, level, name),))
+    try:
+        yield records
+    finally:
+        _captures.reset(token)
+
+
+@contextmanager
+def verbose_output(verbose=True):
+    """Print the records (info and above) of the current thread to stdout inside a with
+    block, used by the functions with a verbose option so verbose=True keeps printing the
+    stages without any logging configuration, does nothing if verbose is False
+
+    :param bool verbose: whether to print the info records
+    """
+    if not verbose:
+        yield
+        return
+    _install()
+    token = _verbose.set(True)
+    try:
+        yield
+    finally:
+        _verbose.reset(token)
+
+
+def verbose_option(func):
+    """Decorator running func inside verbose_output when it's called with verbose=True
+    (func must have a verbose parameter), the stages are logged with logger.info
+
+    :param callable func: The decorated function
+    """
+    parameters = inspect.signature(func).parameters
+    index = list(parameters).index('verbose')
+    default = parameters['verbose'].default
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        verbose = kwargs.get('verbose', args[index] if len(args) > index else default)
+        if not verbose:
+            return func(*args, **kwargs)
+        with verbose_output():
+            return func(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,20 @@
+"""module containing the pareto_front function used by the design optimizers"""
+import numpy as np
+
+
+def pareto_front(objectives, chunk_size=512):
+    """Returns the indexes of the non-dominated rows (all the objectives are minimized)
+
+    :param np.ndarray objectives: (n_points, n_objectives) array
+    :param int chunk_size: number of points compared against all the other points at once
+
+    :returns: indexes of the Pareto optimal points
+    :rtype: np.ndarray
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    dominated = np.zeros(len(objectives), dtype=bool)
+    for start in range(0, len(objectives), chunk_size):
+        chunk = objectives[start:start + chunk_size, None, :]
+        dominated[start:start + chunk_size] = np.any(
+            np.all(objectives <= chunk, axis=2) & np.any(objectives < chunk, axis=2), axis=1)
+    return np.flatnonzero(~dominated)
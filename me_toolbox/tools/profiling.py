@@ -0,0 +1,200 @@
+"""module containing the record context manager, an opt-in instrumentation of the
+library's expensive functions (call counts and accumulated wall time)
+
+.. code-block:: python
+
+    from me_toolbox.tools.profiling import record
+
+    with record() as recording:
+        gearbox.optimize(pinion)
+    print(recording.report())
+
+Note: the functions are patched only inside the with block and restored when it exits,
+outside of it there is no overhead
+"""
+from contextlib import contextmanager
+import functools
+import importlib
+import sys
+from threading import Lock
+from time import perf_counter
+
+from me_toolbox.tools.caching import DependentProperty
+
+# the instrumented functions ('module:qualified name')
+DEFAULT_TARGETS = (
+    'me_toolbox.gears.gear:Gear.Y_j',
+    'me_toolbox.gears.gear:Gear.calc_Y_j',
+    'me_toolbox.gears.gear:Gear.KH',
+    'me_toolbox.gears.helical_gear:HelicalGear.Y_j',
+    'me_toolbox.gears.helical_gear:HelicalGear.calc_Y_j',
+    'me_toolbox.tools.table_interpolation:table_interpolation',
+    'me_toolbox.tools.table_interpolation:TableInterpolator.__call__',
+    'me_toolbox.fasteners.threaded_fastener:ThreadedFastener.calc_member_stiffness',
+    'me_toolbox.springs.spring:Spring.material_prop',
+    'me_toolbox.fatigue.fatigue_analysis:FatigueAnalysis.calc_num_of_cycles',
+    'me_toolbox.fatigue.sn_curve:SNCurve.num_of_cycles',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.modified_goodman',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.soderberg',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.gerber',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.asme_elliptic',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.langer_static_yield',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.get_safety_factors',
+    'me_toolbox.fatigue.failure_criteria:FailureCriteria.get_safety_factors_array',
+)
+
+_lock = Lock()
+_recordings = []  # the active recordings (record blocks can be nested)
+_patches = []  # (owner, attribute, original value) of every patched attribute
+
+
+class Recording:
+    """Call counts and accumulated wall time of the instrumented functions
+
+    Note: the times are inclusive, an instrumented function calling another one
+    (e.g. get_safety_factors calling gerber) includes the time of the inner call,
+    dependent properties (e.g. Gear.KH) are counted only when they are recalculated
+    """
+
+    def __repr__(self):
+        return f"Recording(functions={len(self.calls)}, calls={sum(self.calls.values())})"
+
+    def __init__(self):
+        self.calls = {}
+        self.times = {}
+        self.wall_time = 0.0
+        self._start = None
+
+    def add(self, name, elapsed):
+        """Add a call of a function (the instrumented functions call it holding the module's
+        lock, so the calls from concurrent threads aren't lost)
+
+        :param str name: The function name
+        :param float elapsed: The call duration [s]
+        """
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.times[name] = self.times.get(name, 0.0) + elapsed
+
+    def summary(self):
+        """Returns the calls, total time and mean time of each function that was called,
+        sorted by the total time
+
+        :rtype: dict[str, dict]
+        """
+        with _lock:
+            # a snapshot, the calls of other threads may still be added
+            calls, times = dict(self.calls), dict(self.times)
+        names = sorted(calls, key=times.get, reverse=True)
+        return {name: {'calls': calls[name],
+                       'total_time': times[name],
+                       'mean_time': times[name] / calls[name]} for name in names}
+
+    def report(self):
+        """Returns the summary as a table
+
+        :rtype: str
+        """
+        lines = [f"{'function':<45}{'calls':>9}{'total [ms]':>12}{'mean [us]':>11}{'share':>8}"]
+        for name, stats in self.summary().items():
+            share = stats['total_time'] / self.wall_time if self.wall_time else 0
+            lines.append(f"{name:<45}{stats['calls']:>9}{stats['total_time'] * 1e3:>12.3f}"
+                         f"{stats['mean_time'] * 1e6:>11.2f}{share:>8.1%}")
+        lines.append(f"wall time of the recording: {self.wall_time * 1e3:.3f} [ms]")
+        return '\n'.join(lines)
+
+
+@contextmanager
+def record(targets=DEFAULT_TARGETS):
+    """Count the calls and accumulate the wall time of the instrumented functions
+    inside a with block
+
+    Note: the calls from all the threads are recorded, module functions are patched in
+        the library's modules, a function imported by name into another module before
+        the block (from ... import table_interpolation) isn't recorded when called there
+
+    :param tuple[str] targets: the instrumented functions ('module:qualified name',
+        default: DEFAULT_TARGETS), used only by the outermost record block
+
+    :returns: The recording (filled while the block runs)
+    :rtype: Recording
+    """
+    recording = Recording()
+    with _lock:
+        if not _recordings:
+            _patch(targets)
+        _recordings.append(recording)
+    recording._start = perf_counter()
+    try:
+        yield recording
+    finally:
+        recording.wall_time = perf_counter() - recording._start
+        with _lock:
+            _recordings.remove(recording)
+            if not _recordings:
+                _restore()
+
+
+def _instrument(name, func):
+    """Returns func wrapped with the call counting and timing"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                for recording in _recordings:
+                    recording.add(name, elapsed)
+    return wrapper
+
+
+def _patch(targets):
+    """Replace the targets with instrumented versions (the originals are kept in _patches)"""
+    try:
+        for target in targets:
+            module_name, qualified_name = target.split(':')
+            *owner_path, attribute = qualified_name.split('.')
+            owner = importlib.import_module(module_name)
+            for name in owner_path:
+                owner = getattr(owner, name)
+            _patch_attribute(owner, attribute, qualified_name)
+    except Exception:
+        _restore()
+        raise
+
+
+def _set(owner, attribute, value):
+    _patches.append((owner, attribute, getattr(owner, attribute)
+                     if not isinstance(owner, type) else owner.__dict__[attribute]))
+    setattr(owner, attribute, value)
+
+
+def _patch_attribute(owner, attribute, name):
+    if not isinstance(owner, type):
+        # a module function, also patch the modules that imported it by name
+        original = getattr(owner, attribute)
+        wrapper = _instrument(name, original)
+        for module in list(sys.modules.values()):
+            if getattr(module, '__name__', '').startswith('me_toolbox') and \
+                    module.__dict__.get(attribute) is original:
+                _set(module, attribute, wrapper)
+        return
+
+    descriptor = owner.__dict__[attribute]
+    if isinstance(descriptor, DependentProperty):
+        _set(descriptor, 'func', _instrument(name, descriptor.func))
+    elif isinstance(descriptor, (staticmethod, classmethod)):
+        _set(owner, attribute, type(descriptor)(_instrument(name, descriptor.__func__)))
+    elif isinstance(descriptor, property):
+        _set(owner, attribute, property(_instrument(name, descriptor.fget), descriptor.fset,
+                                        descriptor.fdel, descriptor.__doc__))
+    else:
+        _set(owner, attribute, _instrument(name, descriptor))
+
+
+def _restore():
+    """Put back the original functions"""
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
@@ -17,10 +17,96 @@ class NotInRangeError(ValueError):
         super().__init__(self.msg)
 
 
+class TableInterpolator:
+    """Bilinear interpolator built once from a table and evaluated on whole
+    arrays of query points in one vectorized call
+
+    The table has the same format used by :func:`table_interpolation`, the first column
+    holds the rows coordinates and the first row holds the columns coordinates
+    (the top left cell is ignored)
+    """
+
+    def __repr__(self):
+        return f"TableInterpolator(rows={self.row_range}, cols={self.col_range})"
+
+    def __init__(self, data):
+        """Instantiating TableInterpolator object
+
+        :param np.ndarray data: the table as numpy array
+        """
+        data = np.asarray(data, dtype=float)
+        self.rows = data[1:, 0]
+        self.cols = data[0, 1:]
+        self.values = data[1:, 1:]
+        self.row_range = (self.rows[0], self.rows[-1])
+        self.col_range = (self.cols[0], self.cols[-1])
+
+    def in_range(self, x_row, x_col):
+        """Returns a mask of the points inside the table range
+
+        :param float or np.ndarray x_row: the x row coordinates
+        :param float or np.ndarray x_col: the x col coordinates
+
+        :rtype: np.ndarray
+        """
+        return self._row_in_range(x_row) & self._col_in_range(x_col)
+
+    def _row_in_range(self, x_row):
+        return (x_row >= self.row_range[0]) & (x_row <= self.row_range[1])
+
+    def _col_in_range(self, x_col):
+        return (x_col >= self.col_range[0]) & (x_col <= self.col_range[1])
+
+    def __call__(self, x_row, x_col, return_mask=False):
+        """Interpolate the values in the table corresponding to the coordinates
+
+        :param float or np.ndarray x_row: the x row coordinates
+        :param float or np.ndarray x_col: the x col coordinates
+        :param bool return_mask: if True out of range points are set to nan and a mask of
+            the valid points is returned, if False a NotInRangeError is raised for the first
+            out of range point
+
+        :returns: The interpolated values (and the in range mask if return_mask is True)
+        :rtype: float or np.ndarray or tuple[np.ndarray, np.ndarray]
+
+        :raises NotInRangeError: if a point is out of the table range and return_mask is False
+        """
+        x_row, x_col = np.broadcast_arrays(np.asarray(x_row, dtype=float),
+                                           np.asarray(x_col, dtype=float))
+        row_in_range, col_in_range = self._row_in_range(x_row), self._col_in_range(x_col)
+        mask = row_in_range & col_in_range
+
+        if not return_mask and not mask.all():
+            # report the first point out of range, checking the column first like
+            # table_interpolation does
+            if not col_in_range.all():
+                raise NotInRangeError("x_col", x_col[~col_in_range].flat[0], self.col_range)
+            raise NotInRangeError("x_row", x_row[~row_in_range].flat[0], self.row_range)
+
+        # lower neighbours indexes (the last cell is interpolated from its left/upper cell)
+        i = np.clip(np.searchsorted(self.rows, x_row, side='right') - 1, 0, len(self.rows) - 2)
+        j = np.clip(np.searchsorted(self.cols, x_col, side='right') - 1, 0, len(self.cols) - 2)
+
+        t = (x_row - self.rows[i]) / (self.rows[i + 1] - self.rows[i])
+        u = (x_col - self.cols[j]) / (self.cols[j + 1] - self.cols[j])
+
+        values = self.values
+        result = ((1 - t) * (1 - u) * values[i, j] + t * (1 - u) * values[i + 1, j] +
+                  (1 - t) * u * values[i, j + 1] + t * u * values[i + 1, j + 1])
+
+        if return_mask:
+            return np.where(mask, result, np.nan), mask
+
+        return float(result) if result.ndim == 0 else result
+
+
 def table_interpolation(x_row, x_col, data):
     """ Get table in numpy array form and two coordinates and
     Interpolate the value in the table corresponding to those coordinates
 
+    Note: for repeated lookups in the same table build a :class:`TableInterpolator` once
+    and call it with arrays of points instead
+
     :keyword x_row: the x row from which to retrieve the value
     :type x_row: float
     :keyword x_col: the x col from which to retrieve the value
@@ -29,53 +115,4 @@ def table_interpolation(x_row, x_col, data):
     :type data: np.ndarray
     :rtype: float
     """
-
-    # first gear number of known teeth values
-    first_column = data[:, 0]
-
-    # second gear number of known teeth values
-    first_row = data[0, :]
-
-    if x_col > first_row[-1] or x_col < first_row[1]:
-        raise NotInRangeError("x_col", x_col, (first_row[1], first_row[-1]))
-
-    if x_row > first_column[-1] or x_row < first_column[1]:
-        raise NotInRangeError("x_row", x_row, (first_column[1], first_column[-1]))
-
-    # upper bounds indexes of x_row and x_col
-    index1 = np.searchsorted(first_column, x_row, side='right')
-    index2 = np.searchsorted(first_row, x_col, side='right')
-
-    try:
-        # get x_row neighbors
-        x_row_low, x_row_high = data[index1 - 1, 0], data[index1, 0]
-    except IndexError:
-        # if x_row upper neighbor is out of the table range
-        x_row_low, x_row_high = data[index1 - 1, 0], np.nan
-    try:
-        # get x_col neighbors
-        x_col_low, x_col_high = data[0, index2 - 1], data[0, index2]
-    except IndexError:
-        # if x_col upper neighbor is out of the table range
-        x_col_low, x_col_high = data[0, index2 - 1], np.nan
-
-    # if gear teeth number is not in the table do an
-    # interpolation on closest values inside the table
-    if x_row == x_row_low and x_col == x_col_low:
-        # x_row and x_col are known no need to interpolate
-        result = data[index1 - 1, index2 - 1]
-    elif x_row == x_row_low:
-        # x_row is known and x_col is interpolated
-        result = np.interp(x_col, data[0, :], data[index1 - 1, :])
-    elif x_col == x_col_low:
-        # x_col is known and x_row is interpolated
-        result = np.interp(x_row, data[:, 0], data[:, index2 - 1])
-    else:
-        # both are unknown and interpolated
-        lower_bound = np.interp(x_row, data[:, 0], data[:, index2 - 1])
-        upper_bound = np.interp(x_row, data[:, 0], data[:, index2])
-        range_ = np.array([data[0, index2 - 1], data[0, index2]])
-        bounds = np.array([lower_bound, upper_bound])
-        result = np.interp(x_col, range_, bounds)
-
-    return result
+    return TableInterpolator(data)(x_row, x_col)
@@ -0,0 +1,84 @@
+"""module containing the TableRegistry class, a process-wide cache for data tables"""
+from threading import Lock
+
+import numpy as np
+
+
+class TableRegistry:
+    """Loads each table from disk once and keeps it in memory,
+    optionally as a pre-built object (e.g. an interpolator)
+
+    Note: the cached arrays are shared between all callers so they are
+    marked as read-only
+    """
+
+    def __repr__(self):
+        return f"TableRegistry(tables={len(self._tables)}, hits={self.hits}, " \
+               f"misses={self.misses})"
+
+    def __init__(self):
+        self._tables = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, builder=None, reader=None):
+        """Returns the table stored in the csv file at path, the file is read from
+        disk only on the first call
+
+        :param str path: Path to a comma separated table file
+        :param callable builder: Optional callable applied once to the parsed table
+            (e.g. an interpolator class), its result is cached instead of the raw table
+        :param callable reader: Optional callable parsing the file at path
+            (e.g. for tables with text columns), by default the table is read as floats
+
+        :returns: The parsed table (or the object built from it)
+        :rtype: np.ndarray or any
+        """
+        key = (path, builder, reader)
+        try:
+            table = self._tables[key]
+        except KeyError:
+            with self._lock:
+                # another thread might have loaded the table while we waited for the lock
+                if key not in self._tables:
+                    self._tables[key] = self._load(path, builder, reader)
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                return self._tables[key]
+        self.hits += 1
+        return table
+
+    def _load(self, path, builder, reader):
+        """Parse the table file (or reuse the already parsed raw table)"""
+        data = self._tables.get((path, None, reader))
+        if data is None:
+            data = self._read(path) if reader is None else reader(path)
+        return data if builder is None else builder(data)
+
+    @staticmethod
+    def _read(path):
+        """Read the table from disk"""
+        data = np.genfromtxt(path, delimiter=',')
+        data.flags.writeable = False
+        return data
+
+    def stats(self):
+        """Returns the cache counters
+
+        :returns: number of cache hits, misses and cached tables
+        :rtype: dict
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'tables': len(self._tables)}
+
+    def clear(self):
+        """Remove all the cached tables and reset the counters"""
+        with self._lock:
+            self._tables.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# the registry shared by the whole process
+table_registry = TableRegistry()
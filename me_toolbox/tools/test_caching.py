@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from me_toolbox.tools import dependent_property, clear_cache
+
+
+class Part:
+    def __init__(self, length, width):
+        self.length = length
+        self.width = width
+        self.calls = 0
+
+    @dependent_property('length', 'width')
+    def area(self):
+        """area of the part"""
+        self.calls += 1
+        return self.length * self.width
+
+
+class Assembly:
+    def __init__(self, part):
+        self.part = part
+
+    @dependent_property('part.length', 'part.height')
+    def length(self):
+        return 2 * self.part.length
+
+
+class TestDependentProperty(TestCase):
+    def test_cached_until_dependency_changes(self):
+        part = Part(2, 3)
+        self.assertEqual(part.area, 6)
+        self.assertEqual(part.area, 6)
+        self.assertEqual(part.calls, 1)
+        part.width = 4
+        self.assertEqual(part.area, 8)
+        self.assertEqual(part.calls, 2)
+
+    def test_instances_are_independent(self):
+        part1, part2 = Part(2, 3), Part(1, 1)
+        self.assertEqual((part1.area, part2.area), (6, 1))
+        self.assertNotIn('area', vars(part1))
+
+    def test_dotted_and_missing_dependencies(self):
+        assembly = Assembly(Part(2, 3))
+        self.assertEqual(assembly.length, 4)
+        assembly.part.length = 5
+        self.assertEqual(assembly.length, 10)
+
+    def test_clear_cache(self):
+        part = Part(2, 3)
+        _ = part.area
+        clear_cache(part)
+        _ = part.area
+        self.assertEqual(part.calls, 2)
+
+    def test_read_only(self):
+        with self.assertRaises(AttributeError):
+            Part(2, 3).area = 1
+        self.assertEqual(Part.area.__doc__, "area of the part")
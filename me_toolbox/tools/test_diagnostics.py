@@ -0,0 +1,92 @@
+from contextlib import redirect_stdout
+import io
+import logging
+import threading
+from unittest import TestCase
+
+from me_toolbox.tools import capture, verbose_option, verbose_output
+from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
+from me_toolbox.springs import HelicalCompressionSpring, Spring
+
+
+class TestDiagnostics(TestCase):
+
+    def test_silent_by_default(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            FailureCriteria.get_safety_factors(420, 520, 180, 120, -60, 'gerber')
+        self.assertEqual(output.getvalue(), '')
+
+    def test_verbose_prints(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            FailureCriteria.get_safety_factors(420, 520, 180, 120, 60, 'gerber', verbose=True)
+        self.assertIn("the gerber safety factor is", output.getvalue())
+        # nothing is printed once the call returns
+        printed = output.getvalue()
+        with redirect_stdout(output):
+            FailureCriteria.get_safety_factors(420, 520, 180, 120, 60, 'gerber')
+        self.assertEqual(output.getvalue(), printed)
+
+    def test_threads(self):
+        # the with blocks get only the records of their own thread
+        logger = logging.getLogger('me_toolbox.fatigue.failure_criteria')
+        started, logged = threading.Event(), threading.Event()
+
+        def other_thread():
+            started.wait()
+            logger.info("other info")
+            logger.warning("other warning")
+            logged.set()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        output = io.StringIO()
+        with redirect_stdout(output), capture() as records, verbose_output():
+            started.set()
+            logged.wait()
+            logger.info("own info")
+        thread.join()
+        self.assertEqual(output.getvalue(), "own info\n")
+        self.assertEqual(records, [])
+
+    def test_capture(self):
+        fatigue = FatigueAnalysis(modified_endurance_limit=90, stress_type='bending',
+                                  ductile=True, ultimate_tensile_strength=480,
+                                  yield_strength=410, Kf_bending=1,
+                                  alt_bending_stress=100, mean_bending_stress=50)
+        with capture() as records:
+            fatigue.miner_rule([[2, 150, -50], [1, 900, -900]], Sut=480, Se=90, z=-5.69)
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].levelno, logging.WARNING)
+        self.assertIn("Reversible Stress = 900.0 not in range", records[0].getMessage())
+
+    def test_verbose_option(self):
+        @verbose_option
+        def func(value, verbose=False):
+            logging.getLogger('me_toolbox.test').info("value=%s", value)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            func(1)
+            func(2, True)
+            func(3, verbose=True)
+        self.assertEqual(output.getvalue(), "value=2\nvalue=3\n")
+
+    def test_spring_diagnostics(self):
+        output = io.StringIO()
+        with redirect_stdout(output), capture() as records:
+            spring = HelicalCompressionSpring(
+                max_force=500, wire_diameter=6, spring_diameter=50,
+                ultimate_tensile_strength=Spring.material_prop('music wire', 6),
+                shear_yield_percent=0.45, shear_modulus=75e3, elastic_modulus=205e3,
+                end_type='squared and ground', spring_rate=6, zeta=0.25)
+            self.assertFalse(spring.check_design())
+            self.assertIsNone(spring.buckling('clamped'))
+        self.assertEqual(output.getvalue(), '')
+        self.assertIn("active_coils=", records[0].getMessage())
+        self.assertEqual(records[-1].levelno, logging.ERROR)
+
+        with redirect_stdout(output):
+            spring.buckling('fixed-hinged', verbose=True)
+        self.assertIn("the max safe length", output.getvalue())
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox import tools
+from me_toolbox.tools import record
+from me_toolbox.fatigue import FailureCriteria
+from me_toolbox.gears import Gear
+
+
+class TestRecord(TestCase):
+
+    def setUp(self):
+        self.data = np.array([[np.nan, 10, 20],
+                              [20, 0.495, 0.505],
+                              [30, 0.545, 0.552]])
+
+    def test_counts_calls(self):
+        with record() as recording:
+            for _ in range(3):
+                FailureCriteria.get_safety_factors(420, 520, 180, 120, 60, 'gerber')
+            Gear.calc_Y_j(25, 60, 20)
+            tools.table_interpolation(25, 15, self.data)
+        summary = recording.summary()
+        self.assertEqual(summary['FailureCriteria.get_safety_factors']['calls'], 3)
+        self.assertEqual(summary['FailureCriteria.gerber']['calls'], 3)
+        self.assertEqual(summary['Gear.calc_Y_j']['calls'], 1)
+        self.assertEqual(summary['table_interpolation']['calls'], 1)
+        self.assertGreater(summary['Gear.calc_Y_j']['total_time'], 0)
+        self.assertIn('Gear.calc_Y_j', recording.report())
+
+    def test_restored(self):
+        original = Gear.__dict__['calc_Y_j']
+        with self.assertRaises(ZeroDivisionError):
+            with record():
+                self.assertIsNot(Gear.__dict__['calc_Y_j'], original)
+                raise ZeroDivisionError
+        self.assertIs(Gear.__dict__['calc_Y_j'], original)
+        self.assertFalse(hasattr(tools.table_interpolation, '__wrapped__'))
+
+    def test_nested(self):
+        with record() as outer:
+            FailureCriteria.soderberg(420, 180, 120, 60)
+            with record() as inner:
+                FailureCriteria.soderberg(420, 180, 120, 60)
+        self.assertEqual(outer.calls['FailureCriteria.soderberg'], 2)
+        self.assertEqual(inner.calls['FailureCriteria.soderberg'], 1)
+
+    def test_threads(self):
+        def work(_):
+            for _ in range(500):
+                FailureCriteria.soderberg(420, 180, 120, 60)
+
+        with record() as recording:
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(work, range(8)))
+        self.assertEqual(recording.calls['FailureCriteria.soderberg'], 8 * 500)
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.tools import TableInterpolator, NotInRangeError, table_interpolation
+
+
+class TestTableInterpolator(TestCase):
+
+    def setUp(self):
+        self.data = np.array([[np.nan, 10, 20, 30],
+                              [20, 0.495, 0.505, 0.465],
+                              [30, 0.545, 0.552, 0.5],
+                              [60, 0.61, 0.608, 0.539]])
+        self.interpolator = TableInterpolator(self.data)
+
+    def test_known_value(self):
+        self.assertAlmostEqual(self.interpolator(30, 20), 0.552)
+
+    def test_last_cell(self):
+        self.assertAlmostEqual(self.interpolator(60, 30), 0.539)
+
+    def test_bilinear(self):
+        expected = 0.25 * (0.495 + 0.505 + 0.545 + 0.552)
+        self.assertAlmostEqual(self.interpolator(25, 15), expected)
+
+    def test_array_values(self):
+        # the values of the original (scalar) table_interpolation implementation
+        rows = np.array([20, 25, 33.3, 60, 47])
+        cols = np.array([10, 12.5, 30, 21, 29.9])
+        expected = [0.495, 0.522125, 0.50429, 0.6011, 0.5227163333333333]
+        np.testing.assert_allclose(self.interpolator(rows, cols), expected, rtol=1e-12)
+        for row, col, value in zip(rows, cols, expected):
+            self.assertAlmostEqual(table_interpolation(row, col, self.data), value, places=12)
+
+    def test_not_in_range(self):
+        self.assertRaises(NotInRangeError, self.interpolator, [25, 70], [15, 15])
+
+    def test_mask(self):
+        result, mask = self.interpolator([25, 70, 25], [15, 15, 5], return_mask=True)
+        self.assertListEqual(mask.tolist(), [True, False, False])
+        self.assertTrue(np.isnan(result[1]) and np.isnan(result[2]))
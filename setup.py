@@ -24,8 +24,9 @@ setuptools.setup(
         'Operating System :: OS Independent',
     ],
     package_dir={"me_toolbox": "me_toolbox"},
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(include=['me_toolbox', 'me_toolbox.*']),
     include_package_data=True,
-    install_requires=['sympy', 'numpy', 'mpmath'],
+    install_requires=['numpy'],
+    extras_require={'symbolic': ['sympy']},
     python_requires=">=3.9",
 )